@@ -1,7 +1,15 @@
 from application.entry._open_graph import get_open_graph_meta_for_entry
 
-from ._create_entry import Bookmark, Checkin, Location, Reply, create_entry
+from ._create_entry import (
+    Bookmark,
+    Checkin,
+    Location,
+    Reply,
+    create_entry,
+    purge_pages_for_post,
+)
+from ._delete_entry import delete_entry
 from ._post_to_bridgy import post_to_bridgy
 from ._update_entry import update_entry
 
-__all__ = ["get_open_graph_meta_for_entry", "create_entry"]
+__all__ = ["get_open_graph_meta_for_entry", "create_entry", "purge_pages_for_post"]
@@ -6,7 +6,7 @@ from django.contrib.gis import geos
 from django.db import transaction
 from django.utils import timezone
 
-from core import constants
+from core import constants, documents, page_cache
 from data.entry import models as entry_models
 from data.files import models as file_models
 from data.indieweb import constants as indieweb_constants
@@ -15,6 +15,7 @@ from data.streams import models as stream_models
 from data.trips import models as trip_models
 from domain.entry import operations as entry_ops
 from domain.entry import queries as entry_queries
+from domain.timeline import operations as timeline_ops
 
 
 class PostKindMismatch(Exception):
@@ -108,9 +109,35 @@ def create_entry(
     if checkin:
         _create_checkin(entry, checkin)
 
+    timeline_ops.refresh_timeline(entry.t_post_id)
+    purge_pages_for_post(entry.t_post)
+
     return entry
 
 
+def get_page_tags_for_post(t_post: post_models.TPost) -> set[str]:
+    """
+    Get the tags of the cached pages showing the post: its permalink, the lists, its kind, streams, trips and files.
+    """
+    tags = {page_cache.TIMELINE, page_cache.post_tag(t_post.uuid), page_cache.kind_tag(t_post.m_post_kind.key)}
+    tags.update(page_cache.stream_tag(slug) for slug in t_post.streams.values_list("slug", flat=True))
+    trip_uuids = list(t_post.trips.values_list("uuid", flat=True))
+    if trip_uuids:
+        tags.update([page_cache.TRIPS, *(page_cache.trip_tag(trip_uuid) for trip_uuid in trip_uuids)])
+    if t_post.files.exists():
+        tags.add(page_cache.FILES)
+    return tags
+
+
+def purge_pages_for_post(t_post: post_models.TPost, previous_tags: set[str] | None = None) -> None:
+    """
+    Purge the cached public pages that show the post, and those that showed it before a change (previous_tags).
+    """
+    page_cache.purge(*get_page_tags_for_post(t_post), *(previous_tags or set()))
+    # The feeds are rendered again now, instead of by the first reader polling them.
+    documents.regenerate_documents()
+
+
 def _create_entry(
     status: post_models.MPostStatus,
     post_kind: post_models.MPostKind,
@@ -0,0 +1,17 @@
+from django.db import transaction
+
+from data.entry import models as entry_models
+
+from ._create_entry import get_page_tags_for_post, purge_pages_for_post
+
+
+@transaction.atomic
+def delete_entry(entry: entry_models.TEntry) -> None:
+    """
+    Delete an entry and remove it from the public pages.
+    """
+    t_post = entry.t_post
+    previous_tags = get_page_tags_for_post(t_post)
+    # The timeline row goes with the entry.
+    entry.delete()
+    purge_pages_for_post(t_post, previous_tags=previous_tags)
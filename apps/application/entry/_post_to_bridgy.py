@@ -7,6 +7,8 @@ from data.entry import models as entry_models
 from data.indieweb import models as indieweb_models
 from data.post import models as post_models
 
+from ._create_entry import purge_pages_for_post
+
 
 class AlreadySentWebmention(Exception): ...
 
@@ -20,6 +22,8 @@ def post_to_bridgy(
         t_entry.bridgy_publish_url.get(url=target_bridgy_url)
     except entry_models.BridgyPublishUrl.DoesNotExist:
         t_entry.new_bridgy_url(target_bridgy_url)
+        # Bridgy reads the publish link from the permalink, which may be cached without it.
+        purge_pages_for_post(t_entry.t_post)
 
     try:
         _send_webmention(
@@ -53,4 +57,6 @@ def _send_webmention(t_entry: entry_models.TEntry, t_post: post_models.TPost, so
 
 
 def _create_syndication_url(entry: entry_models.TEntry, syndication_url: str) -> entry_models.TSyndication:
-    return entry_models.TSyndication.objects.create(t_entry=entry, url=syndication_url)
+    t_syndication = entry_models.TSyndication.objects.create(t_entry=entry, url=syndication_url)
+    purge_pages_for_post(entry.t_post)
+    return t_syndication
@@ -12,8 +12,16 @@ from data.streams import models as stream_models
 from data.trips import models as trip_models
 from domain.entry import operations as entry_ops
 from domain.entry import queries as entry_queries
+from domain.timeline import operations as timeline_ops
 
-from ._create_entry import Bookmark, Checkin, Location, Reply
+from ._create_entry import (
+    Bookmark,
+    Checkin,
+    Location,
+    Reply,
+    get_page_tags_for_post,
+    purge_pages_for_post,
+)
 
 
 class PostKindMismatch(Exception):
@@ -41,6 +49,7 @@ def update_entry(
     Create a new entry with related data.
     """
     entry = entry_models.TEntry.objects.get(pk=entry_id)
+    previous_tags = get_page_tags_for_post(entry.t_post)
     _update_entry(
         entry=entry,
         status=status,
@@ -72,6 +81,9 @@ def update_entry(
     if checkin:
         _update_checkin(entry, checkin)
 
+    timeline_ops.refresh_timeline(entry.t_post_id)
+    purge_pages_for_post(entry.t_post, previous_tags=previous_tags)
+
     return entry
 
 
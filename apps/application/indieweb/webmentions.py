@@ -18,6 +18,7 @@ from domain.files.utils import extract_uuid_from_url
 from domain.indieweb import utils
 from domain.indieweb import webmention as webmention_domain
 from domain.post import queries as post_queries
+from domain.timeline import operations as timeline_ops
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +42,7 @@ def create_moderation_record_for_webmention(webmention: webmention_models.WebMen
         indieweb_models.TWebmention.new(
             t_webmention_response=webmention, t_post=t_post, microformat_data=microformat_data
         )
+    timeline_ops.refresh_timeline(t_post.pk)
 
 
 def _get_post_by_uuid(url: str) -> TPost | None:
@@ -113,6 +115,7 @@ def send_webmention(request, t_post: TPost, e_content: str) -> list[indieweb_mod
 
 def moderate_webmention(t_web_mention: indieweb_models.TWebmention, approval: bool) -> None:
     t_web_mention.set_approval(approved=approval)
+    timeline_ops.refresh_timeline(t_web_mention.t_post_id)
 
 
 def _extract_microformat_data(*, webmention: webmention_models.WebMentionResponse):
@@ -0,0 +1,58 @@
+import uuid
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+from django.core.cache import cache
+from django.db import transaction
+
+T = TypeVar("T")
+
+
+def get_version(key: str) -> str | None:
+    """
+    Get the version stored under key in the cache shared by every process, or None if the cache can't hold it.
+
+    Processes keep data in memory with the version it was loaded at, and reload it once the version differs.
+    """
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid.uuid4().hex, timeout=None)
+        # Read it back in case another process added it first.
+        version = cache.get(key)
+    return version
+
+
+def replace_version(key: str) -> None:
+    """
+    Replace the version once the current transaction commits, so every process reloads its data.
+    """
+    transaction.on_commit(lambda: cache.set(key, uuid.uuid4().hex, timeout=None))
+
+
+class ProcessCache(Generic[T]):
+    """
+    A value loaded once per process, and kept until the version under key changes.
+    """
+
+    def __init__(self, key: str, load: Callable[[], T]) -> None:
+        self.key = key
+        self.load = load
+        self._current: tuple[str, T] | None = None
+
+    def get(self) -> T:
+        version = get_version(self.key)
+        current = self._current
+        if current is not None and version is not None and current[0] == version:
+            return current[1]
+        value = self.load()
+        if version is not None:
+            self._current = (version, value)
+        return value
+
+    def clear(self) -> None:
+        """
+        Make every process reload the value, this one straight away and the others once the current transaction
+        commits.
+        """
+        self._current = None
+        replace_version(self.key)
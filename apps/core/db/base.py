@@ -1,7 +1,57 @@
+import logging
+import re
+
 from django.contrib.gis.db.backends.spatialite import base
 
+logger = logging.getLogger(__name__)
+
+# PRAGMAs that may be configured with DATABASES[alias]["OPTIONS"]["pragmas"].
+CONNECTION_PRAGMAS = (
+    "busy_timeout",
+    "journal_mode",
+    "synchronous",
+    "cache_size",
+    "mmap_size",
+    "temp_store",
+    "query_only",
+)
+
+_PRAGMA_VALUE = re.compile(r"^-?[A-Za-z0-9_]+$")
+
+# Aliases that have reported their effective PRAGMAs in this process.
+_reported_aliases: set[str] = set()
+
 
 class DatabaseWrapper(base.DatabaseWrapper):
+    @property
+    def pragmas(self) -> dict[str, str | int]:
+        """
+        PRAGMAs applied to every new connection for this alias.
+        """
+        return self.settings_dict["OPTIONS"].get("pragmas", {})
+
+    def get_connection_params(self):
+        params = super().get_connection_params()
+        # PRAGMAs are applied once connected and are not valid arguments to sqlite3.connect.
+        params.pop("pragmas", None)
+        return params
+
+    def get_new_connection(self, conn_params):
+        conn = super().get_new_connection(conn_params)
+        for name, value in self.pragmas.items():
+            conn.execute(_pragma_statement(name, value))
+        if self.alias not in _reported_aliases:
+            _reported_aliases.add(self.alias)
+            logger.info("SQLite connection profile for %s: %s", self.alias, _effective_pragmas(conn))
+        return conn
+
+    def effective_pragmas(self) -> dict[str, str]:
+        """
+        Return the value SQLite reports for each configurable PRAGMA on the current connection.
+        """
+        self.ensure_connection()
+        return _effective_pragmas(self.connection)
+
     def prepare_database(self):
         # Workaround for https://code.djangoproject.com/ticket/32935
         with self.cursor() as cursor:
@@ -9,3 +59,18 @@ class DatabaseWrapper(base.DatabaseWrapper):
             if cursor.fetchall() == []:
                 cursor.execute("SELECT InitSpatialMetaData(1)")
         super().prepare_database()
+
+
+def _pragma_statement(name: str, value: str | int) -> str:
+    """
+    Build a PRAGMA statement. PRAGMAs can't be parameterized, so only known names and simple values are accepted.
+    """
+    if name not in CONNECTION_PRAGMAS:
+        raise ValueError(f"Unsupported PRAGMA {name}")
+    if not _PRAGMA_VALUE.match(str(value)):
+        raise ValueError(f"Invalid value for PRAGMA {name}: {value}")
+    return f"PRAGMA {name} = {value}"
+
+
+def _effective_pragmas(conn) -> dict[str, str]:
+    return {name: str(conn.execute(f"PRAGMA {name}").fetchone()[0]) for name in CONNECTION_PRAGMAS}
@@ -0,0 +1,42 @@
+from django.db import models
+
+# Control characters can't appear in indexed text, so they mark matches without clashing with escaping.
+SNIPPET_START = "\x02"
+SNIPPET_END = "\x03"
+
+
+class FullTextField(models.TextField):
+    """
+    The hidden column named after an FTS5 table, used to MATCH against every column of the table.
+    """
+
+
+@FullTextField.register_lookup
+class Match(models.Lookup):
+    lookup_name = "match"
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f"{lhs} MATCH {rhs}", [*lhs_params, *rhs_params]
+
+
+class Snippet(models.Func):
+    """
+    A fragment of the best matching column with the matched terms wrapped in SNIPPET_START and SNIPPET_END.
+
+    Only valid in a query that filters the table with a match lookup.
+    """
+
+    function = "snippet"
+    output_field = models.TextField()
+
+    def __init__(self, document: str, tokens: int = 24):
+        super().__init__(
+            models.F(document),
+            models.Value(-1),
+            models.Value(SNIPPET_START),
+            models.Value(SNIPPET_END),
+            models.Value("…"),
+            models.Value(tokens),
+        )
@@ -0,0 +1,81 @@
+import contextlib
+import re
+import time
+from collections import Counter
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+
+from django.db import connections
+
+_WHITESPACE = re.compile(r"\s+")
+# IN (%s, %s, %s) differs with the number of values but is the same statement.
+_PLACEHOLDER_LIST = re.compile(r"\(\s*%s(?:\s*,\s*%s)*\s*\)")
+
+
+def fingerprint(sql: str) -> str:
+    """
+    Normalize a statement so repeated executions with different parameters compare equal.
+    """
+    return _PLACEHOLDER_LIST.sub("(...)", _WHITESPACE.sub(" ", sql).strip())
+
+
+@dataclass
+class QueryRecorder:
+    """
+    Record every statement executed while installed with connection.execute_wrapper.
+    """
+
+    statements: list[tuple[str, float]] = field(default_factory=list)
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.statements.append((sql, time.perf_counter() - start))
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    @property
+    def duration(self) -> float:
+        """
+        Total time spent in the database, in seconds.
+        """
+        return sum(duration for _, duration in self.statements)
+
+    def repeated(self, threshold: int = 2) -> dict[str, int]:
+        """
+        Statements that were executed at least threshold times, by fingerprint.
+        """
+        counts = Counter(fingerprint(sql) for sql, _ in self.statements)
+        return {sql: count for sql, count in counts.most_common() if count >= threshold}
+
+    def over_budget(self, max_queries: int | None, max_repeats: int | None) -> list[str]:
+        """
+        Describe each way the recorded statements exceed the budget. None disables a limit.
+        """
+        problems = []
+        if max_queries is not None and self.count > max_queries:
+            problems.append(f"{self.count} queries (budget {max_queries})")
+        if max_repeats is not None:
+            for sql, count in self.repeated(threshold=max_repeats + 1).items():
+                problems.append(f"{count} executions (budget {max_repeats}) of {sql}")
+        return problems
+
+    def server_timing(self) -> str:
+        repeated = len(self.repeated())
+        return f'db;dur={self.duration * 1000:.1f};desc="{self.count} queries, {repeated} repeated"'
+
+
+@contextlib.contextmanager
+def record_queries() -> Iterator[QueryRecorder]:
+    """
+    Record the statements executed on every database connection in this thread inside the block.
+    """
+    recorder = QueryRecorder()
+    with contextlib.ExitStack() as stack:
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(recorder))
+        yield recorder
@@ -0,0 +1,55 @@
+import contextlib
+import contextvars
+from collections.abc import Iterator
+
+from django.db import DEFAULT_DB_ALIAS, connections
+
+READ_ONLY_DB_ALIAS = "readonly"
+
+_read_only = contextvars.ContextVar("read_only", default=False)
+
+
+def set_read_only(enabled: bool) -> None:
+    """
+    Route reads in the current context to the read-only connection.
+    """
+    _read_only.set(enabled)
+
+
+@contextlib.contextmanager
+def read_only() -> Iterator[None]:
+    """
+    Route reads made inside the block to the read-only connection.
+    """
+    token = _read_only.set(True)
+    try:
+        yield
+    finally:
+        _read_only.reset(token)
+
+
+class ReadWriteRouter:
+    """
+    Send reads to the read-only connection when requested, and everything else to the writer.
+
+    The read-only connection opens the same SQLite file with mode=ro and query_only, so with WAL enabled readers
+    never wait on, or take, the write lock.
+    """
+
+    def db_for_read(self, model, **hints) -> str | None:
+        if not _read_only.get() or READ_ONLY_DB_ALIAS not in connections.settings:
+            return None
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            # Uncommitted writes are only visible to the writer.
+            return DEFAULT_DB_ALIAS
+        return READ_ONLY_DB_ALIAS
+
+    def db_for_write(self, model, **hints) -> str:
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints) -> bool:
+        # Both aliases are the same database.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints) -> bool:
+        return db == DEFAULT_DB_ALIAS
@@ -0,0 +1,104 @@
+import math
+from typing import TYPE_CHECKING
+
+from django.db import migrations
+from django.db.models import F, FloatField, Func, Value
+from django.db.models.expressions import RawSQL
+
+if TYPE_CHECKING:
+    from django.contrib.gis.db.models import GeometryField
+
+# The SRID of longitude/latitude coordinates, which every geometry column holds.
+WGS84 = 4326
+# Mean earth radius, as SpatiaLite uses for great-circle distances.
+EARTH_RADIUS_KM = 6371.0088
+# Far enough that every point on earth is within it.
+MAX_DISTANCE_KM = math.pi * EARTH_RADIUS_KM
+
+
+def bounding_box(lat: float, lon: float, radius_km: float) -> tuple[float, float, float, float]:
+    """
+    Get the smallest (min_lon, min_lat, max_lon, max_lat) box containing every point within radius_km.
+
+    Near the poles, or if the circle crosses the antimeridian, the box spans every longitude.
+    """
+    angular_radius = radius_km / EARTH_RADIUS_KM
+    min_lat = lat - math.degrees(angular_radius)
+    max_lat = lat + math.degrees(angular_radius)
+    if min_lat <= -90 or max_lat >= 90:
+        return -180.0, max(min_lat, -90.0), 180.0, min(max_lat, 90.0)
+    d_lon = math.degrees(math.asin(min(1.0, math.sin(angular_radius) / math.cos(math.radians(lat)))))
+    if lon - d_lon < -180 or lon + d_lon > 180:
+        return -180.0, min_lat, 180.0, max_lat
+    return lon - d_lon, min_lat, lon + d_lon, max_lat
+
+
+def index_lookup(table: str, column: str, box: tuple[float, float, float, float]) -> RawSQL:
+    """
+    Select the ids of the rows whose point is inside the box from SpatiaLite's R*Tree index on the column.
+
+    SpatiaLite never uses the index by itself, so filtering on this is what makes a geo query indexed.
+    """
+    min_x, min_y, max_x, max_y = box
+    return RawSQL(
+        f'SELECT pkid FROM "idx_{table}_{column}" WHERE xmin <= %s AND xmax >= %s AND ymin <= %s AND ymax >= %s',
+        [max_x, min_x, max_y, min_y],
+    )
+
+
+class Distance(Func):
+    """
+    Great-circle distance in km between a WGS84 point field and a coordinate.
+    """
+
+    function = "ST_Distance"
+    # SpatiaLite returns NULL rather than 0 for identical points.
+    template = "COALESCE(%(function)s(%(expressions)s, 0), 0) / 1000.0"
+    output_field = FloatField()
+
+    def __init__(self, point_field: str, lat: float, lon: float):
+        super().__init__(F(point_field), Func(Value(lon), Value(lat), Value(WGS84), function="MakePoint"))
+
+
+def change_srid(
+    model_name: str, table: str, name: str, old_field: "GeometryField", new_field: "GeometryField"
+) -> list[migrations.operations.base.Operation]:
+    """
+    Get the migration operations that change the SRID of a geometry column, keeping its coordinates as they are.
+
+    SpatiaLite can't alter a geometry column, so its values are copied to a temporary column with SetSRID(), and back
+    once the column has been added again as new_field. Its spatial index is rebuilt at the end.
+    """
+    temporary_name = f"{name}_{new_field.srid}"
+    return [
+        # Nullable, so it can be added back to the filled table when migrating backwards.
+        migrations.SeparateDatabaseAndState(
+            state_operations=[migrations.AlterField(model_name, name, _with_null(old_field))]
+        ),
+        migrations.AddField(model_name, temporary_name, _with_null(new_field)),
+        migrations.RunSQL(
+            f'UPDATE "{table}" SET "{temporary_name}" = SetSRID("{name}", {new_field.srid})',
+            reverse_sql=f'UPDATE "{table}" SET "{name}" = SetSRID("{temporary_name}", {old_field.srid})',
+        ),
+        migrations.RemoveField(model_name, name),
+        # Added as nullable, since the table has rows. It becomes new_field when the table is remade without the
+        # temporary column.
+        migrations.SeparateDatabaseAndState(
+            database_operations=[migrations.AddField(model_name, name, _with_null(new_field))],
+            state_operations=[migrations.AddField(model_name, name, new_field.clone())],
+        ),
+        migrations.RunSQL(
+            f'UPDATE "{table}" SET "{name}" = "{temporary_name}"',
+            reverse_sql=f'UPDATE "{table}" SET "{temporary_name}" = "{name}"',
+        ),
+        migrations.RemoveField(model_name, temporary_name),
+        migrations.RunSQL(
+            f"SELECT RecoverSpatialIndex('{table}', '{name}')",
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
+
+
+def _with_null(field: "GeometryField") -> "GeometryField":
+    _, _, args, kwargs = field.deconstruct()
+    return type(field)(*args, **{**kwargs, "null": True})
@@ -0,0 +1,145 @@
+import functools
+import io
+import logging
+import re
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.handlers.base import BaseHandler
+from django.core.handlers.wsgi import WSGIRequest
+from django.db import transaction
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_string
+
+from core import page_cache
+
+logger = logging.getLogger(__name__)
+
+# The urls of every stored document, so they can be rendered again when they change.
+REGISTRY_KEY = "documents:urls"
+# Set in the environ of requests made by regenerate_documents(), which clients can't do.
+REGENERATE = "tanzawa.regenerate_document"
+
+_accepts_gzip = re.compile(r"\bgzip\b")
+_handler: BaseHandler | None = None
+
+
+@dataclass
+class Document:
+    """
+    A rendered response, stored as is and gzipped.
+    """
+
+    content: bytes
+    gzip_content: bytes
+    headers: dict[str, str]
+
+    def to_response(self, request: HttpRequest) -> HttpResponse:
+        if _accepts_gzip.search(request.META.get("HTTP_ACCEPT_ENCODING", "")):
+            response = HttpResponse(self.gzip_content, headers=self.headers)
+            response["Content-Encoding"] = "gzip"
+        else:
+            response = HttpResponse(self.content, headers=self.headers)
+        patch_vary_headers(response, ("Accept-Encoding",))
+        return response
+
+
+def materialised_document(*tags: str):
+    """
+    Serve the view's output from a stored document to visitors who aren't logged in.
+
+    The document is rendered once and stored with its gzipped bytes until one of its tags, or SITE, is purged. Calling
+    regenerate_documents() after a purge renders it again, so visitors aren't the ones waiting for it. Requests with a
+    query string, e.g. for a later page, and logged in users, who may see private posts, are rendered live.
+    """
+
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(request: HttpRequest, *args, **kwargs):
+            regenerate = request.META.get(REGENERATE, False)
+            if not regenerate and not _is_materialised_request(request):
+                return view(request, *args, **kwargs)
+
+            url = request.build_absolute_uri()
+            key = page_cache.get_key("document", [page_cache.SITE, *tags], [url])
+            if key is None:
+                return view(request, *args, **kwargs)
+            if not regenerate:
+                document = cache.get(key)
+                if document is not None:
+                    return document.to_response(request)
+
+            response = view(request, *args, **kwargs)
+            if response.status_code == 200 and not response.streaming and not response.cookies:
+                document = Document(
+                    content=response.content,
+                    gzip_content=compress_string(response.content),
+                    headers=dict(response.headers),
+                )
+                cache.set(key, document, timeout=settings.PAGE_CACHE_TIMEOUT)
+                _register(url)
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def regenerate_documents() -> None:
+    """
+    Render every stored document again once the current transaction commits.
+
+    Call it after purging the tags the documents depend on, so they are rendered with the new versions.
+    """
+
+    def regenerate():
+        for url in cache.get(REGISTRY_KEY, []):
+            try:
+                _get_handler().get_response(_make_request(url))
+            except Exception:
+                # The document is rendered by the next request instead.
+                logger.exception("Error regenerating %s", url)
+
+    transaction.on_commit(regenerate)
+
+
+def _is_materialised_request(request: HttpRequest) -> bool:
+    return (
+        request.method in ("GET", "HEAD") and not request.META.get("QUERY_STRING") and not request.user.is_authenticated
+    )
+
+
+def _register(url: str) -> None:
+    urls = cache.get(REGISTRY_KEY, [])
+    if url not in urls:
+        cache.set(REGISTRY_KEY, [*urls, url], timeout=None)
+
+
+def _get_handler() -> BaseHandler:
+    global _handler
+    if _handler is None:
+        # A handler runs the middleware, without the request signals that would close the caller's connection.
+        _handler = BaseHandler()
+        _handler.load_middleware()
+    return _handler
+
+
+def _make_request(url: str) -> WSGIRequest:
+    parts = urlsplit(url)
+    return WSGIRequest(
+        {
+            "REQUEST_METHOD": "GET",
+            "SCRIPT_NAME": "",
+            "PATH_INFO": parts.path,
+            "QUERY_STRING": "",
+            "SERVER_NAME": parts.hostname or "",
+            "SERVER_PORT": str(parts.port or (443 if parts.scheme == "https" else 80)),
+            "HTTP_HOST": parts.netloc,
+            "wsgi.url_scheme": parts.scheme,
+            "wsgi.input": io.BytesIO(),
+            REGENERATE: True,
+        }
+    )
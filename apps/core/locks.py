@@ -0,0 +1,34 @@
+import contextlib
+import fcntl
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+# How often a waiting worker tries to take a lock again.
+POLL_INTERVAL = 0.05
+
+
+@contextlib.contextmanager
+def file_lock(path: Path, timeout: float) -> Iterator[bool]:
+    """
+    Hold an exclusive lock on the file at path, waiting up to timeout seconds for it, and yield whether it was taken.
+
+    The lock is shared by every process and thread on the machine, and released when the block exits or the process
+    holding it dies. Lock files are left in place: removing one could let two workers lock different files at once.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a") as lock_file:
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    yield False
+                    return
+                time.sleep(POLL_INTERVAL)
+        try:
+            yield True
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
@@ -1,4 +1,11 @@
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
 from django.db import models
+from django.db.models.fields.related_descriptors import ForwardManyToOneDescriptor
+from django.db.models.signals import post_delete, post_save
 
 
 class TimestampModel(models.Model):
@@ -7,3 +14,109 @@ class TimestampModel(models.Model):
 
     class Meta:
         abstract = True
+
+
+@dataclass
+class _MasterDataRows:
+    by_pk: dict[int, models.Model] = field(default_factory=dict)
+    by_key: dict[str, models.Model] = field(default_factory=dict)
+    loaded_at: float = 0.0
+
+
+# Cached master rows per process, by model label.
+_master_data: dict[str, _MasterDataRows] = {}
+_master_data_lock = threading.Lock()
+
+
+def _invalidate_master_data(sender, **kwargs) -> None:
+    with _master_data_lock:
+        _master_data.pop(sender._meta.label, None)
+
+
+class MasterDataManager(models.Manager):
+    """
+    Manager for master (m_*) tables: a handful of rows that are looked up by their key and rarely change.
+
+    All rows are cached per process. The cache is cleared when a row is saved or deleted in this process, and
+    reloaded after max_age seconds so changes made by other processes are eventually picked up.
+    """
+
+    max_age = 300
+
+    def contribute_to_class(self, cls, name):
+        super().contribute_to_class(cls, name)
+        if not cls._meta.abstract:
+            post_save.connect(_invalidate_master_data, sender=cls, dispatch_uid=f"master_data_{cls._meta.label}")
+            post_delete.connect(_invalidate_master_data, sender=cls, dispatch_uid=f"master_data_{cls._meta.label}")
+
+    def clear_cache(self) -> None:
+        _invalidate_master_data(sender=self.model)
+
+    def _get_rows(self, reload: bool = False) -> _MasterDataRows:
+        label = self.model._meta.label
+        rows = _master_data.get(label)
+        if reload or rows is None or time.monotonic() - rows.loaded_at > self.max_age:
+            instances = list(self.get_queryset())
+            rows = _MasterDataRows(
+                by_pk={instance.pk: instance for instance in instances},
+                by_key={instance.key: instance for instance in instances},
+                loaded_at=time.monotonic(),
+            )
+            with _master_data_lock:
+                _master_data[label] = rows
+        return rows
+
+    def _lookup(self, attr: str, value):
+        instance = getattr(self._get_rows(), attr).get(value)
+        if instance is None:
+            # The row may have been added since the cache was loaded.
+            instance = getattr(self._get_rows(reload=True), attr).get(value)
+        if instance is None:
+            raise self.model.DoesNotExist(f"{self.model._meta.object_name} matching {value} does not exist.")
+        # Callers get their own copy so changes to it don't leak into the cache.
+        fields = self.model._meta.concrete_fields
+        return self.model.from_db(
+            instance._state.db, [f.attname for f in fields], [getattr(instance, f.attname) for f in fields]
+        )
+
+    def get_by_key(self, key: str):
+        return self._lookup("by_key", key)
+
+    def get_by_pk(self, pk: int):
+        return self._lookup("by_pk", pk)
+
+    def id_for_key(self, key: str) -> int:
+        return self.get_by_key(key).pk
+
+    def ids_for_keys(self, keys: Iterable[str]) -> list[int]:
+        """
+        Get the ids for several keys. Keys without a row are skipped, as filtering on them wouldn't match anything.
+        """
+        ids = []
+        for key in keys:
+            try:
+                ids.append(self.id_for_key(key))
+            except self.model.DoesNotExist:
+                continue
+        return ids
+
+
+class _MasterDataForwardDescriptor(ForwardManyToOneDescriptor):
+    def get_object(self, instance):
+        manager = self.field.remote_field.model._default_manager
+        if not isinstance(manager, MasterDataManager):
+            return super().get_object(instance)
+        return manager.get_by_pk(getattr(instance, self.field.attname))
+
+
+class MasterDataForeignKey(models.ForeignKey):
+    """
+    A foreign key to a master table that reads the related row from the MasterDataManager cache instead of the database.
+    """
+
+    forward_related_accessor_class = _MasterDataForwardDescriptor
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        # Only how the row is fetched differs, the column is a plain foreign key.
+        return name, "django.db.models.ForeignKey", args, kwargs
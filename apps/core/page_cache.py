@@ -0,0 +1,268 @@
+import datetime
+import functools
+import hashlib
+import time
+import uuid
+import zlib
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import patch_vary_headers
+from django.views.decorators.http import condition
+
+# Tags a cached page can depend on. A page is stale once any of its tags is purged.
+SITE = "site"
+TIMELINE = "timeline"
+TRIPS = "trips"
+# Files attached to published posts.
+FILES = "files"
+WEBMENTIONS = "webmentions"
+
+# Request headers that change what a page renders, e.g. only the targeted fragment for HTMX.
+VARY_HEADERS = ("HX-Request", "HX-Boosted", "HX-Target", "HX-Trigger", "Turbo-Frame")
+
+
+def post_tag(uuid) -> str:
+    return f"post:{uuid}"
+
+
+def trip_tag(uuid) -> str:
+    return f"trip:{uuid}"
+
+
+def kind_tag(kind: str) -> str:
+    return f"kind:{kind}"
+
+
+def stream_tag(slug: str) -> str:
+    return f"stream:{slug}"
+
+
+def purge(*tags: str) -> None:
+    """
+    Invalidate every page cached with any of the tags, once the current transaction commits.
+
+    Each tag has a random version that is part of the key of the pages using it, so purging only replaces the version
+    and the old pages are never read again.
+    """
+
+    def replace_versions():
+        cache.set_many({_tag_key(tag): _new_version() for tag in tags}, timeout=None)
+
+    transaction.on_commit(replace_versions)
+
+
+def cache_anonymous_page(*tags: str | Callable[..., str]):
+    """
+    Cache the rendered page for visitors who aren't logged in until one of its tags is purged.
+
+    Tags are strings or functions called with the view's keyword arguments, e.g. to tag a permalink with its post.
+    Every page is also tagged with SITE.
+    """
+
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(request: HttpRequest, *args, **kwargs):
+            if not _is_cacheable_request(request):
+                return view(request, *args, **kwargs)
+
+            page_tags = [SITE, *(tag(**kwargs) if callable(tag) else tag for tag in tags)]
+            key = _get_page_key(request, page_tags)
+            if key is None:
+                return view(request, *args, **kwargs)
+
+            cached = cache.get(key)
+            if cached is not None:
+                return _restore_response(cached)
+
+            response = view(request, *args, **kwargs)
+            if callable(getattr(response, "render", None)) and not response.is_rendered:
+                response.add_post_render_callback(lambda rendered: _store_response(request, key, rendered))
+            else:
+                _store_response(request, key, response)
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def conditional_page(*tags: str | Callable[..., str], last_modified: Callable[..., datetime.datetime | None]):
+    """
+    Answer conditional GETs with 304 Not Modified, without running the view, while the page is unchanged.
+
+    last_modified is called with the request and the view's keyword arguments. It should cheaply get when the rows the
+    page shows last changed, or None if the page can't be validated. Purging any of the tags, or SITE, also changes the
+    page, so deletions, webmentions, settings and plugins are covered without querying for them.
+    """
+
+    def get_validators(request: HttpRequest, **kwargs) -> tuple[str, datetime.datetime] | None:
+        if not hasattr(request, "_page_validators"):
+            request._page_validators = None
+            rows_modified = last_modified(request, **kwargs)
+            page_tags = [SITE, *(tag(**kwargs) if callable(tag) else tag for tag in tags)]
+            versions = _get_versions(page_tags)
+            if rows_modified is not None and versions is not None:
+                modified = max([rows_modified, *(_version_time(version) for version in versions)])
+                user = getattr(request, "user", None)
+                etag = hashlib.sha256(
+                    chr(0)
+                    .join(
+                        [
+                            request.get_full_path(),
+                            str(user.pk if user is not None and user.is_authenticated else ""),
+                            modified.isoformat(),
+                            *versions,
+                            *(request.headers.get(header, "") for header in VARY_HEADERS),
+                        ]
+                    )
+                    .encode()
+                ).hexdigest()
+                request._page_validators = (etag, modified)
+        return request._page_validators
+
+    def etag_func(request, *args, **kwargs):
+        validators = get_validators(request, **kwargs)
+        return validators[0] if validators else None
+
+    def last_modified_func(request, *args, **kwargs):
+        validators = get_validators(request, **kwargs)
+        return validators[1] if validators else None
+
+    return condition(etag_func=etag_func, last_modified_func=last_modified_func)
+
+
+def _is_cacheable_request(request: HttpRequest) -> bool:
+    # Checking the cookies instead of request.user avoids loading the session.
+    return (
+        request.method in ("GET", "HEAD")
+        and settings.SESSION_COOKIE_NAME not in request.COOKIES
+        and "messages" not in request.COOKIES
+    )
+
+
+def _get_page_key(request: HttpRequest, tags: list[str]) -> str | None:
+    site_settings = getattr(request, "settings", None)
+    return get_key(
+        "page",
+        tags,
+        [
+            request.build_absolute_uri(),
+            site_settings.theme if site_settings else "",
+            *(request.headers.get(header, "") for header in VARY_HEADERS),
+        ],
+    )
+
+
+def get_key(prefix: str, tags: list[str], parts: list[str]) -> str | None:
+    """
+    Get the cache key for the parts and the current versions of the tags, or None if they can't be read.
+    """
+    versions = _get_versions(tags)
+    if versions is None:
+        return None
+    return f"{prefix}:{hashlib.sha256(chr(0).join([*parts, *versions]).encode()).hexdigest()}"
+
+
+def _get_versions(tags: list[str]) -> list[str] | None:
+    """
+    Get the current version of each tag, or None if they can't be read.
+    """
+    keys = [_tag_key(tag) for tag in tags]
+    versions = cache.get_many(keys)
+    missing = [key for key in keys if key not in versions]
+    if missing:
+        for key in missing:
+            cache.add(key, _new_version(), timeout=None)
+        # Read them back in case another worker added them first.
+        versions.update(cache.get_many(missing))
+        if any(key not in versions for key in keys):
+            return None
+    return [versions[key] for key in keys]
+
+
+def _tag_key(tag: str) -> str:
+    return f"page_tag:{tag}"
+
+
+def _new_version() -> str:
+    # Starts with the time it was made, so a version also says when its pages last changed.
+    return f"{time.time():.6f}:{uuid.uuid4().hex}"
+
+
+def _version_time(version: str) -> datetime.datetime:
+    try:
+        timestamp = float(version.split(":", 1)[0])
+    except ValueError:
+        # Made before versions held their time, so it's at least as old as the rows.
+        timestamp = 0
+    return datetime.datetime.fromtimestamp(timestamp, tz=datetime.timezone.utc)
+
+
+def _store_response(request: HttpRequest, key: str, response: HttpResponse) -> None:
+    patch_vary_headers(response, VARY_HEADERS)
+    if (
+        response.status_code != 200
+        or response.streaming
+        or response.cookies
+        or "private" in response.get("Cache-Control", "")
+        # The page holds a CSRF token meant for this visitor.
+        or request.META.get("CSRF_COOKIE_NEEDS_UPDATE")
+    ):
+        return
+    cached = {
+        "content": zlib.compress(response.content),
+        "headers": dict(response.headers),
+    }
+    cache.set(key, cached, timeout=settings.PAGE_CACHE_TIMEOUT)
+
+
+def _restore_response(cached: dict) -> HttpResponse:
+    return HttpResponse(zlib.decompress(cached["content"]), headers=cached["headers"])
+
+
+@dataclass
+class FragmentStats:
+    """
+    How many fragments a request read from the cache, and the time spent rendering the rest.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    render_duration: float = 0.0
+
+    def server_timing(self) -> str:
+        return f'fragments;dur={self.render_duration * 1000:.1f};desc="{self.hits} hits, {self.misses} misses"'
+
+
+def get_fragment_stats(request: HttpRequest) -> FragmentStats:
+    if not hasattr(request, "fragment_stats"):
+        request.fragment_stats = FragmentStats()
+    return request.fragment_stats
+
+
+def cached_fragment(request: HttpRequest, tags: list[str], parts: list[str], render: Callable[[], str]) -> str:
+    """
+    Get a rendered template fragment from the cache, rendering and storing it on a miss.
+
+    parts must include everything the fragment's output depends on, apart from what the tags cover.
+    """
+    stats = get_fragment_stats(request)
+    key = get_key("fragment", [SITE, *tags], parts)
+    if key is not None:
+        fragment = cache.get(key)
+        if fragment is not None:
+            stats.hits += 1
+            return fragment
+
+    start = time.perf_counter()
+    fragment = render()
+    stats.render_duration += time.perf_counter() - start
+    stats.misses += 1
+    if key is not None:
+        cache.set(key, fragment, timeout=settings.FRAGMENT_CACHE_TIMEOUT)
+    return fragment
@@ -0,0 +1,178 @@
+import base64
+import binascii
+import datetime
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from django.core.exceptions import ValidationError
+from django.core.paginator import InvalidPage
+from django.db.models import BooleanField, Expression, F, QuerySet, Value
+from django.utils.functional import cached_property
+
+
+class InvalidCursor(InvalidPage):
+    pass
+
+
+class RowValueCompare(Expression):
+    """
+    Compare row values, e.g. (dt_published, id) < (%s, %s).
+
+    Unlike the equivalent (a < x) OR (a = x AND b < y) the database can use a composite index to start reading
+    from the cursor, instead of scanning from the start of the index and skipping the rows before it.
+    """
+
+    output_field = BooleanField()
+
+    def __init__(self, lhs: list[Expression], rhs: list[Expression], operator: str):
+        if operator not in ("<", ">"):
+            raise ValueError(f"Unsupported operator {operator}")
+        super().__init__()
+        self.lhs = lhs
+        self.rhs = rhs
+        self.operator = operator
+
+    def get_source_expressions(self):
+        return [*self.lhs, *self.rhs]
+
+    def set_source_expressions(self, exprs):
+        self.lhs, self.rhs = exprs[: len(self.lhs)], exprs[len(self.lhs) :]
+
+    def as_sql(self, compiler, connection):
+        lhs = [compiler.compile(expression) for expression in self.lhs]
+        rhs = [compiler.compile(expression) for expression in self.rhs]
+        sql = "({}) {} ({})".format(", ".join(sql for sql, _ in lhs), self.operator, ", ".join(sql for sql, _ in rhs))
+        return sql, [param for _, params in lhs + rhs for param in params]
+
+
+@dataclass
+class CursorPage:
+    """
+    A page of results with opaque tokens for the pages either side of it.
+    """
+
+    object_list: list[Any]
+    paginator: "CursorPaginator"
+    next_cursor: str | None
+    previous_cursor: str | None
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    def has_previous(self) -> bool:
+        return self.previous_cursor is not None
+
+    def has_other_pages(self) -> bool:
+        return self.has_next() or self.has_previous()
+
+
+class CursorPaginator:
+    """
+    Paginate a queryset by seeking past the last row shown instead of using OFFSET.
+
+    The ordering must be unique, e.g. ("-dt_published", "-pk"), so the index on those columns can be used to start
+    reading at the cursor. Every page costs the same no matter how deep it is and the total count is never needed.
+    """
+
+    def __init__(self, queryset: QuerySet, per_page: int, ordering: Sequence[str] = ("-dt_published", "-pk")):
+        if len({field.startswith("-") for field in ordering}) != 1:
+            raise ValueError("All ordering fields must sort in the same direction")
+        self.queryset = queryset
+        self.per_page = per_page
+        self.ordering = tuple(ordering)
+        self.fields = tuple(field.lstrip("-") for field in ordering)
+        self.descending = ordering[0].startswith("-")
+
+    @cached_property
+    def count(self) -> int:
+        """
+        Total number of rows. This runs a COUNT(*), so it's only evaluated if something asks for it.
+        """
+        return self.queryset.count()
+
+    def page(self, cursor: str | None = None) -> CursorPage:
+        if not cursor:
+            return self._page_after(values=None)
+        values, backwards = self._decode(cursor)
+        if backwards:
+            return self._page_before(values)
+        return self._page_after(values)
+
+    def _page_after(self, values: list | None) -> CursorPage:
+        qs = self.queryset.order_by(*self.ordering)
+        if values is not None:
+            qs = qs.filter(self._seek(values, forwards=True))
+        rows = list(qs[: self.per_page + 1])
+        has_next = len(rows) > self.per_page
+        rows = rows[: self.per_page]
+        return CursorPage(
+            object_list=rows,
+            paginator=self,
+            next_cursor=self._encode(rows[-1], backwards=False) if has_next else None,
+            previous_cursor=self._encode(rows[0], backwards=True) if values is not None and rows else None,
+        )
+
+    def _page_before(self, values: list) -> CursorPage:
+        reverse_ordering = [field[1:] if field.startswith("-") else f"-{field}" for field in self.ordering]
+        qs = self.queryset.order_by(*reverse_ordering).filter(self._seek(values, forwards=False))
+        rows = list(qs[: self.per_page + 1])
+        if not rows:
+            # Everything before the cursor has gone, e.g. posts were unpublished since the link was made.
+            return self._page_after(values=None)
+        has_previous = len(rows) > self.per_page
+        rows = rows[: self.per_page][::-1]
+        return CursorPage(
+            object_list=rows,
+            paginator=self,
+            next_cursor=self._encode(rows[-1], backwards=False),
+            previous_cursor=self._encode(rows[0], backwards=True) if has_previous else None,
+        )
+
+    def _seek(self, values: list, forwards: bool) -> RowValueCompare:
+        operator = "<" if forwards == self.descending else ">"
+        return RowValueCompare(
+            [F(field) for field in self.fields],
+            [Value(value, output_field=self._model_field(field)) for field, value in zip(self.fields, values)],
+            operator,
+        )
+
+    def _encode(self, row: Any, backwards: bool) -> str:
+        values = [getattr(row, field) for field in self.fields]
+        data = json.dumps({"v": values, "b": backwards}, default=_json_default, separators=(",", ":"))
+        return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+    def _decode(self, cursor: str) -> tuple[list, bool]:
+        try:
+            data = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+            values, backwards = data["v"], data["b"]
+        except (binascii.Error, UnicodeDecodeError, ValueError, TypeError, KeyError) as e:
+            raise InvalidCursor("Invalid cursor") from e
+        if not isinstance(values, list) or len(values) != len(self.fields) or None in values:
+            raise InvalidCursor("Invalid cursor")
+        try:
+            values = [self._model_field(name).to_python(value) for name, value in zip(self.fields, values)]
+        except ValidationError as e:
+            raise InvalidCursor("Invalid cursor") from e
+        return values, bool(backwards)
+
+    def _model_field(self, name: str):
+        annotation = self.queryset.query.annotations.get(name)
+        if annotation is not None:
+            return annotation.output_field
+        opts = self.queryset.model._meta
+        return opts.pk if name == "pk" else opts.get_field(name)
+
+
+def _json_default(value: Any) -> str:
+    # Unlike DjangoJSONEncoder keep the microseconds, otherwise the cursor can't match the row exactly.
+    if isinstance(value, datetime.datetime):
+        return value.isoformat()
+    raise TypeError(f"Can't use {type(value).__name__} in a cursor")
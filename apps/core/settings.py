@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/3.1/ref/settings/
 
 import os
 import secrets
+import tempfile
 from pathlib import Path
 
 import django
@@ -90,6 +91,7 @@ INSTALLED_APPS = [
     "data.indieweb",
     "data.wordpress",
     "data.plugins",
+    "data.timeline",
     "interfaces",
 ]
 
@@ -100,8 +102,9 @@ for module in (BASE_DIR / "tanzawa_plugin").iterdir():
 
 
 MIDDLEWARE = [
-    "django.middleware.gzip.GZipMiddleware",
+    "interfaces.common.middleware.gzip.GZipMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "interfaces.common.middleware.queries.QueryBudgetMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django_htmx.middleware.HtmxMiddleware",
     "turbo_response.middleware.TurboMiddleware",
@@ -110,6 +113,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "interfaces.common.middleware.database.ReadOnlyDatabaseMiddleware",
     "interfaces.common.middleware.settings.SettingsMiddleware",
     "webmention.middleware.webmention_middleware",
     "interfaces.common.middleware.plugins.PluginMiddleware",
@@ -137,6 +141,7 @@ TEMPLATES = [
                 "django.template.context_processors.request",
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
+                "interfaces.common.context_processors.navigation",
             ],
             "libraries": {
                 "indieweb": "interfaces.common.templatetags.indieweb",
@@ -152,13 +157,83 @@ WSGI_APPLICATION = "core.wsgi.application"
 
 # Database
 # https://docs.djangoproject.com/en/3.1/ref/settings/#databases
+
+
+def get_sqlite_pragmas() -> dict[str, str | int]:
+    """
+    Get the PRAGMAs applied to every new SQLite connection.
+
+    The defaults let several web workers read while a single writer holds the write lock.
+    """
+    return {
+        # Wait for the write lock instead of failing immediately with "database is locked".
+        "busy_timeout": env.int("DB_BUSY_TIMEOUT", default=5000),
+        "journal_mode": env.str("DB_JOURNAL_MODE", default="WAL"),
+        "synchronous": env.str("DB_SYNCHRONOUS", default="NORMAL"),
+        # Negative values are KiB rather than pages.
+        "cache_size": env.int("DB_CACHE_SIZE", default=-20000),
+        "mmap_size": env.int("DB_MMAP_SIZE", default=268435456),
+        "temp_store": env.str("DB_TEMP_STORE", default="MEMORY"),
+    }
+
+
 DATABASES = {
     "default": {
         "ENGINE": "core.db",
         "NAME": env.str("DB_NAME", default="db.sqlite3"),
-    }
+        # Keep connections open between requests so the SpatiaLite extension isn't reloaded every time.
+        "CONN_MAX_AGE": env.int("DB_CONN_MAX_AGE", default=600),
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {
+            "pragmas": get_sqlite_pragmas(),
+        },
+    },
+}
+
+# Public pages read through a second connection which can never take the write lock.
+DATABASES["readonly"] = {
+    "ENGINE": "core.db",
+    "NAME": f"file:{DATABASES['default']['NAME']}?mode=ro",
+    "CONN_MAX_AGE": DATABASES["default"]["CONN_MAX_AGE"],
+    "CONN_HEALTH_CHECKS": True,
+    "OPTIONS": {
+        "pragmas": {
+            **{
+                name: value
+                for name, value in DATABASES["default"]["OPTIONS"]["pragmas"].items()
+                # The journal mode is a property of the file and can only be changed by the writer.
+                if name != "journal_mode"
+            },
+            "query_only": "ON",
+        },
+    },
+    "TEST": {"MIRROR": "default"},
+}
+
+DATABASE_ROUTERS = ["core.db.routers.ReadWriteRouter"]
+
+# Requests that go over these are logged by QueryBudgetMiddleware.
+DB_QUERY_BUDGET = env.int("DB_QUERY_BUDGET", default=50)
+DB_QUERY_REPEAT_BUDGET = env.int("DB_QUERY_REPEAT_BUDGET", default=5)
+
+
+# Caching
+# Shared by every worker, so a page purged by one worker is purged for all of them.
+
+CACHES = {
+    "default": {
+        "BACKEND": env.str("CACHE_BACKEND", default="django.core.cache.backends.filebased.FileBasedCache"),
+        "LOCATION": env.str("CACHE_LOCATION", default=str(Path(tempfile.gettempdir()) / "tanzawa_cache")),
+        "OPTIONS": {"MAX_ENTRIES": env.int("CACHE_MAX_ENTRIES", default=5000)},
+    },
 }
 
+# Cached pages are purged whenever their content changes. The timeout only catches what changes with time alone, like
+# scheduled posts appearing and relative dates.
+PAGE_CACHE_TIMEOUT = env.int("PAGE_CACHE_TIMEOUT", default=600)
+# Rendered list items are keyed on their post's version, so they can be kept for longer.
+FRAGMENT_CACHE_TIMEOUT = env.int("FRAGMENT_CACHE_TIMEOUT", default=60 * 60 * 24)
+
 
 # Password validation
 # https://docs.djangoproject.com/en/3.1/ref/settings/#auth-password-validators
@@ -205,6 +280,41 @@ STATICFILES_DIRS = [BASE_DIR / "../static/", *THEME_STATICFILE_DIRS]
 
 STATIC_ROOT = Path(env.str("STATIC_ROOT", default="./staticfiles/"))
 MEDIA_ROOT = Path(env.str("MEDIA_ROOT", default="./micropub_media/"))
+# Hand media off to the front server instead of streaming it from Python: "x-accel-redirect" for nginx or
+# "x-sendfile" for Apache and lighttpd.
+MEDIA_SENDFILE = env.str("MEDIA_SENDFILE", default="")
+# The nginx internal location that serves MEDIA_ROOT, for X-Accel-Redirect.
+MEDIA_SENDFILE_URL = env.str("MEDIA_SENDFILE_URL", default="/protected-media/")
+# Uploads are hashed as they're received, so large files are written to disk once and never read again to name them.
+FILE_UPLOAD_HANDLERS = [
+    "interfaces.common.upload_handlers.HashingMemoryFileUploadHandler",
+    "interfaces.common.upload_handlers.HashingTemporaryFileUploadHandler",
+]
+# Where large uploads are streamed to. On the same volume as MEDIA_ROOT, they're moved into place instead of copied.
+FILE_UPLOAD_TEMP_DIR = env.str("FILE_UPLOAD_TEMP_DIR", default=None)
+# The resized and converted copies of each uploaded image made right after it's saved, so visitors don't wait for
+# them. Each is a (longest edge, mime type) pair: None keeps the size, or the image's own format.
+MEDIA_DERIVATIVES: list[tuple[int | None, str | None]] = [
+    # Pictures in posts.
+    (None, "image/webp"),
+    # The media modal.
+    (600, None),
+    # The home page gallery.
+    (128, "image/webp"),
+    (256, "image/webp"),
+    # The dashboard file browser.
+    (208, "image/webp"),
+    (416, "image/webp"),
+]
+# Background threads making them, 0 to make them once the upload is committed, in the same thread.
+MEDIA_DERIVATIVE_WORKERS = env.int("MEDIA_DERIVATIVE_WORKERS", default=2)
+# Only one worker creates each copy at a time. The others wait up to this many seconds for it, then a request is served
+# the original instead.
+MEDIA_DERIVATIVE_WAIT = env.float("MEDIA_DERIVATIVE_WAIT", default=5.0)
+# Where the lock files workers take turns with are kept. It must be shared by every process serving media.
+MEDIA_DERIVATIVE_LOCK_DIR = env.str(
+    "MEDIA_DERIVATIVE_LOCK_DIR", default=str(Path(tempfile.gettempdir()) / "tanzawa_locks")
+)
 
 
 REST_FRAMEWORK = {
@@ -225,6 +335,8 @@ DEFAULT_AUTO_FIELD = "django.db.models.AutoField"
 
 # Homepage Settings
 HIGHLIGHT_STREAM_SLUG: str | None = env.str("HIGHLIGHT_STREAM_SLUG", default=None)
+# Threads building the home page's sections when they're missing from the cache.
+HOME_SECTION_WORKERS = env.int("HOME_SECTION_WORKERS", default=4)
 
 
 FORCE_ENABLED_PLUGINS = env.list("FORCE_ENABLED_PLUGINS", default=[])
@@ -259,6 +371,13 @@ if env.bool("ENABLE_SENTRY", default=False):
 # Sunbottle
 
 SUNBOTTLE_API_URL = env.str("SUNBOTTLE_API_URL", default="")
+# Seconds to wait for a response. Only the first request waits; later ones are made in the background.
+SUNBOTTLE_TIMEOUT = env.float("SUNBOTTLE_TIMEOUT", default=2.0)
+# Seconds the generation is served before it's fetched again. Until the new one arrives, the old one is served.
+SUNBOTTLE_CACHE_TIMEOUT = env.int("SUNBOTTLE_CACHE_TIMEOUT", default=5 * 60)
+# After this many failures in a row, stop asking for SUNBOTTLE_RETRY_AFTER seconds.
+SUNBOTTLE_FAILURE_THRESHOLD = env.int("SUNBOTTLE_FAILURE_THRESHOLD", default=3)
+SUNBOTTLE_RETRY_AFTER = env.int("SUNBOTTLE_RETRY_AFTER", default=60)
 
 
 # Fly.io
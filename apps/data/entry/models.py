@@ -156,7 +156,7 @@ class TLocation(TimestampModel):
     region = models.CharField(max_length=64, blank=True, default="")
     country_name = models.CharField(max_length=64, blank=True, default="")
     postal_code = models.CharField(max_length=16, blank=True, default="")
-    point = geo_models.PointField(geography=True, srid=3857)
+    point = geo_models.PointField(geography=True)
 
     class Meta:
         db_table = "t_location"
@@ -21,7 +21,9 @@ def _md5_sum_for_file(file_field) -> str:
 def upload_to(instance: "TFile", filename: str) -> Path:
     instance.filename = filename
     file_directory = MAIN_DIRECTORY / now().strftime(DATE_DIRECTORY) / str(instance.uuid)
-    file_name = _md5_sum_for_file(instance.file)
+    # Uploads are hashed as they're ingested, see file_ops.ingest_upload().
+    file_name = instance.content_hash or _md5_sum_for_file(instance.file)
+    instance.content_hash = file_name
     return file_directory / file_name
 
 
@@ -0,0 +1,40 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("files", "0005_update_verbose_names"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="tfile",
+            name="width",
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="tfile",
+            name="height",
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="tfile",
+            name="display_width",
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="tfile",
+            name="display_height",
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="tfile",
+            name="byte_size",
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="tfile",
+            name="content_hash",
+            field=models.CharField(blank=True, default="", max_length=32),
+        ),
+    ]
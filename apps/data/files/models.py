@@ -1,7 +1,9 @@
 from django.contrib.gis.db import models as geo_models
 from django.db import models
+from django.db.models.signals import m2m_changed
 from django.urls import reverse
 
+from core import page_cache
 from core.models import TimestampModel
 from data.files._upload import format_upload_to, upload_to
 
@@ -14,6 +16,16 @@ class TFile(TimestampModel):
     exif = models.JSONField(default=dict)
     point = geo_models.PointField(blank=True, null=True)
 
+    # Read once on upload, so requests don't open the file to learn them. Sizes are None for files that aren't images.
+    width = models.IntegerField(blank=True, null=True)
+    height = models.IntegerField(blank=True, null=True)
+    # The size once rotated to its EXIF orientation.
+    display_width = models.IntegerField(blank=True, null=True)
+    display_height = models.IntegerField(blank=True, null=True)
+    byte_size = models.BigIntegerField(blank=True, null=True)
+    # The md5 of the stored file, which it's also named by.
+    content_hash = models.CharField(max_length=32, blank=True, default="")
+
     posts = models.ManyToManyField("post.TPost", through="TFilePost", through_fields=("t_file", "t_post"))
 
     class Meta:
@@ -30,6 +42,7 @@ class TFile(TimestampModel):
     def delete(self, using=None, keep_parents=False):
         self.file.delete()
         super().delete(using=using, keep_parents=keep_parents)
+        page_cache.purge(page_cache.FILES)
 
 
 class TFilePost(TimestampModel):
@@ -63,3 +76,12 @@ class TFormattedImage(TimestampModel):
     def delete(self, using=None, keep_parents=False):
         self.file.delete()
         super().delete(using=using, keep_parents=keep_parents)
+
+
+def _purge_files(sender, action: str, **kwargs) -> None:
+    if action.startswith("post_"):
+        # Attaching or detaching files changes which photos are public.
+        page_cache.purge(page_cache.FILES)
+
+
+m2m_changed.connect(_purge_files, sender=TFilePost, dispatch_uid="files_purge")
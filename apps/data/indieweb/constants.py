@@ -24,6 +24,18 @@ class MPostKinds:
     like = "like"
 
 
+class CommentTypes:
+    """
+    Interactions a webmention can represent, counted separately on each post.
+    """
+
+    like = "like"
+    reply = "reply"
+    repost = "repost"
+    # Anything that isn't one of the above
+    mention = "mention"
+
+
 class Microformats(Enum):
     ENTRY = "h-entry"
     CHECKIN = "checkin"
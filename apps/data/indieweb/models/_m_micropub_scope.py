@@ -1,12 +1,14 @@
 from django.db import models
 
-from core.models import TimestampModel
+from core.models import MasterDataManager, TimestampModel
 
 
 class MMicropubScope(TimestampModel):
     key = models.CharField(max_length=12, unique=True)
     name = models.CharField(max_length=16)
 
+    objects = MasterDataManager()
+
     class Meta:
         db_table = "m_micropub_scope"
         verbose_name = "Micropub Scope"
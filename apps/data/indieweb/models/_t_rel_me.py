@@ -1,8 +1,21 @@
 from django.contrib.auth import get_user_model
 from django.db import models
+from django.db.models.signals import post_delete, post_save
 
+from core import cache_versions, page_cache
 from core.models import TimestampModel
 
+# Version of the rel-me links, shared by every process through the cache and replaced whenever they change.
+VERSION_KEY = "relme:version"
+
+
+class TRelMeManager(models.Manager):
+    def cached(self) -> list["TRelMe"]:
+        """
+        All rel-me links, linked from the head of every page, from a per-process cache kept until one changes.
+        """
+        return list(_relme.get())
+
 
 class TRelMe(TimestampModel):
     user = models.ForeignKey(get_user_model(), on_delete=models.CASCADE, related_name="relme")
@@ -11,6 +24,8 @@ class TRelMe(TimestampModel):
     )
     display_name = models.CharField(max_length=64, blank=True)
 
+    objects = TRelMeManager()
+
     class Meta:
         db_table = "t_rel_me"
         verbose_name = "Relme"
@@ -18,3 +33,15 @@ class TRelMe(TimestampModel):
 
     def __str__(self):
         return self.url
+
+
+_relme = cache_versions.ProcessCache(VERSION_KEY, lambda: list(TRelMe.objects.all()))
+
+
+def _clear_relme(sender, **kwargs) -> None:
+    _relme.clear()
+    page_cache.purge(page_cache.SITE)
+
+
+post_save.connect(_clear_relme, sender=TRelMe, dispatch_uid="relme_save")
+post_delete.connect(_clear_relme, sender=TRelMe, dispatch_uid="relme_delete")
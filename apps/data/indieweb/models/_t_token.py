@@ -5,7 +5,7 @@ import os
 from django.contrib.auth import get_user_model
 from django.db import models
 
-from core.models import TimestampModel
+from core.models import MasterDataForeignKey, TimestampModel
 
 from ._m_micropub_scope import MMicropubScope
 
@@ -59,7 +59,7 @@ class TToken(TimestampModel):
 
 class TTokenMicropubScope(TimestampModel):
     t_token = models.ForeignKey(TToken, on_delete=models.CASCADE)
-    m_micropub_scope = models.ForeignKey(MMicropubScope, on_delete=models.CASCADE)
+    m_micropub_scope = MasterDataForeignKey(MMicropubScope, on_delete=models.CASCADE)
 
     class Meta:
         db_table = "t_token_micropub_scope"
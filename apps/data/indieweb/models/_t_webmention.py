@@ -4,7 +4,9 @@ from django.db import models, transaction
 from picklefield import PickledObjectField
 from webmention.models import WebMentionResponse
 
+from core import page_cache
 from core.models import TimestampModel
+from data.indieweb.constants import CommentTypes
 
 if TYPE_CHECKING:
     from data.post import models as post_models
@@ -27,7 +29,19 @@ class TWebmention(TimestampModel):
     def __str__(self):
         return f"{self.t_post} {self.t_webmention_response}"
 
+    @property
+    def comment_type(self) -> str:
+        """
+        The type of interaction this webmention is counted as on its post.
+        """
+        comment_types = (self.microformat_data or {}).get("comment_type") or []
+        for comment_type in (CommentTypes.reply, CommentTypes.repost, CommentTypes.like):
+            if comment_type in comment_types:
+                return comment_type
+        return CommentTypes.mention
+
     @classmethod
+    @transaction.atomic
     def new(
         cls,
         t_webmention_response: WebMentionResponse,
@@ -35,18 +49,25 @@ class TWebmention(TimestampModel):
         microformat_data,
         approval_status: bool | None = None,
     ) -> "TWebmention":
-        return cls.objects.create(
+        t_webmention = cls.objects.create(
             t_webmention_response=t_webmention_response,
             t_post=t_post,
             microformat_data=microformat_data,
             approval_status=approval_status,
         )
+        if approval_status:
+            t_post.update_interaction_counts()
+            t_webmention._purge_pages()
+        return t_webmention
 
+    @transaction.atomic
     def reset_moderation(self, *, microformat_data):
         """An existing webmention has been updated. Reset the moderation as the content has changed."""
         self.approval_status = None
         self.microformat_data = microformat_data
         self.save()
+        self.t_post.update_interaction_counts()
+        self._purge_pages()
 
     @transaction.atomic
     def set_approval(self, *, approved: bool) -> None:
@@ -54,3 +75,9 @@ class TWebmention(TimestampModel):
         self.t_webmention_response.reviewed = True
         self.t_webmention_response.save()
         self.save()
+        self.t_post.update_interaction_counts()
+        self._purge_pages()
+
+    def _purge_pages(self) -> None:
+        # The post shows its approved webmentions and the lists show its interaction count.
+        page_cache.purge(page_cache.TIMELINE, page_cache.WEBMENTIONS, page_cache.post_tag(self.t_post.uuid))
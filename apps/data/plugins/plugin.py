@@ -2,7 +2,6 @@ import abc
 from typing import Protocol
 
 from django import http, urls
-from django.conf import settings
 from django.db.models import TextChoices
 
 from data.post import models as post_models
@@ -89,13 +88,9 @@ class Plugin(abc.ABC, NavigationProtocol, FeedHook, ContentHook):
     settings_url_name: str = ""
 
     def is_enabled(self) -> bool:
-        from .models import MPlugin
+        from .pool import plugin_pool
 
-        return (
-            MPlugin.objects.filter(identifier=self.identifier).values_list("enabled", flat=True).first()
-            or self.identifier in settings.FORCE_ENABLED_PLUGINS
-            or False
-        )
+        return plugin_pool.is_enabled(self.identifier)
 
     @property
     def plugin_module(self) -> str:
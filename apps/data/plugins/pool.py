@@ -1,13 +1,37 @@
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
 from operator import attrgetter
 
 from django.conf import settings
 from django.core import exceptions
 from django.db import utils
+from django.db.models.signals import post_delete, post_save
 from django.utils.module_loading import autodiscover_modules
 
+from core import cache_versions, documents, page_cache
 from data.plugins import plugin
 
+# Version of the enabled plugins, shared by every process through the cache and replaced whenever they change.
+VERSION_KEY = "plugins:version"
+
+# The places plugins can hook into.
+FEED_HOOK = "feed"
+CONTENT_HOOK = "content"
+PUBLIC_NAVIGATION_HOOK = "public_navigation"
+ADMIN_NAVIGATION_HOOK = "admin_navigation"
+URLS_HOOK = "urls"
+ADMIN_URLS_HOOK = "admin_urls"
+
+# Whether a plugin implements each hook.
+HOOKS: dict[str, Callable[[plugin.Plugin], bool]] = {
+    FEED_HOOK: lambda plugin_: plugin_.has_feed_hooks,
+    CONTENT_HOOK: lambda plugin_: plugin_.has_content_hooks,
+    PUBLIC_NAVIGATION_HOOK: lambda plugin_: plugin_.has_public_top_nav,
+    ADMIN_NAVIGATION_HOOK: lambda plugin_: plugin_.has_admin_left_nav,
+    URLS_HOOK: lambda plugin_: bool(plugin_.urls),
+    ADMIN_URLS_HOOK: lambda plugin_: bool(plugin_.admin_urls),
+}
+
 
 def _get_m_plugin():
     """
@@ -18,10 +42,19 @@ def _get_m_plugin():
     return MPlugin
 
 
+@dataclass
+class _Registry:
+    version: str | None
+    enabled: list[plugin.Plugin] = field(default_factory=list)
+    by_hook: dict[str, list[plugin.Plugin]] = field(default_factory=dict)
+
+
 class PluginPool:
     def __init__(self):
         self.plugins = {}
         self.discovered = False
+        # The enabled plugins for each hook, kept until the version in the cache changes.
+        self._registry: _Registry | None = None
 
     def _clear_cached(self) -> None:
         if "registered_plugins" in self.__dict__:
@@ -53,6 +86,7 @@ class PluginPool:
             raise exceptions.ImproperlyConfigured("Tanzawa Plugins must be subclasses of Plugin, %r is not." % plugin)
         plugin_name = plugin_.name
         self.plugins[plugin_name] = plugin_
+        self._registry = None
         return plugin_
 
     def enable(self, plugin_: plugin.Plugin) -> None:
@@ -64,6 +98,7 @@ class PluginPool:
             MPlugin.objects.filter(identifier=plugin_.identifier).update(enabled=True)
         else:
             MPlugin.new(identifier=plugin_.identifier, enabled=True)
+        self.clear_cache()
 
     def disable(self, plugin_: plugin.Plugin) -> None:
         """
@@ -74,44 +109,99 @@ class PluginPool:
             MPlugin.objects.filter(identifier=plugin_.identifier).update(enabled=False)
         else:
             MPlugin.new(identifier=plugin_.identifier, enabled=False)
+        self.clear_cache()
+
+    def clear_cache(self) -> None:
+        """
+        Make every process reload the enabled plugins, this one straight away and the others once the current
+        transaction commits.
+        """
+        self._registry = None
+        cache_versions.replace_version(VERSION_KEY)
+        # Plugins add to the navigation and content of every page, and to the feeds.
+        page_cache.purge(page_cache.SITE)
+        documents.regenerate_documents()
 
     def urls(self) -> Iterable[str]:
         """
         Yields the import path to urls.py for each enabled plugin.
         """
-        for plugin_ in self.enabled_plugins():
-            if plugin_.urls:
-                yield plugin_.urls
+        for plugin_ in self.hook_plugins(URLS_HOOK):
+            yield plugin_.urls
 
     def admin_urls(self) -> Iterable[str]:
         """
         Yields the import path to admin_urls.py for each enabled plugin.
         """
-        for plugin_ in self.enabled_plugins():
-            if plugin_.admin_urls:
-                yield plugin_.admin_urls
+        for plugin_ in self.hook_plugins(ADMIN_URLS_HOOK):
+            yield plugin_.admin_urls
 
     def enabled_plugins(self) -> Iterable[plugin.Plugin]:
         """
         Yields enabled Plugin instances
         """
+        return self._get_registry().enabled
+
+    def is_enabled(self, identifier: str) -> bool:
+        return any(plugin_.identifier == identifier for plugin_ in self.enabled_plugins())
+
+    def hook_plugins(self, hook: str) -> Iterable[plugin.Plugin]:
+        """
+        Get the enabled plugins that implement the hook, in the order they're dispatched to.
+        """
+        return self._get_registry().by_hook[hook]
+
+    def feed_plugins(self) -> Iterable[plugin.Plugin]:
+        return self.hook_plugins(FEED_HOOK)
+
+    def content_plugins(self) -> Iterable[plugin.Plugin]:
+        return self.hook_plugins(CONTENT_HOOK)
+
+    def public_navigation_plugins(self) -> Iterable[plugin.Plugin]:
+        return self.hook_plugins(PUBLIC_NAVIGATION_HOOK)
+
+    def admin_navigation_plugins(self) -> Iterable[plugin.Plugin]:
+        return self.hook_plugins(ADMIN_NAVIGATION_HOOK)
+
+    def _get_registry(self) -> _Registry:
+        version = cache_versions.get_version(VERSION_KEY)
+        registry = self._registry
+        if registry is None or version is None or registry.version != version:
+            registry = self._load_registry(version)
+        return registry
+
+    def _load_registry(self, version: str | None) -> _Registry:
         self.discover_plugins()
         MPlugin = _get_m_plugin()
         try:
-            enabled = list(MPlugin.objects.enabled().values_list("identifier", flat=True))
+            enabled = set(MPlugin.objects.enabled().values_list("identifier", flat=True))
         except utils.OperationalError:
             # MPlugin table hasn't been migrated yet
-            return []
-        enabled_plugins = []
-        for plugin_ in self.plugins.values():
-            if plugin_.identifier in enabled or plugin_.identifier in settings.FORCE_ENABLED_PLUGINS:
-                enabled_plugins.append(plugin_)
-        return enabled_plugins
-
-    def feed_plugins(self) -> Iterable[plugin.Plugin]:
-        for enabled_plugin in self.enabled_plugins():
-            if enabled_plugin.has_feed_hooks:
-                yield enabled_plugin
+            return _Registry(version=None, by_hook={hook: [] for hook in HOOKS})
+        enabled_plugins = [
+            plugin_
+            for plugin_ in self.plugins.values()
+            if plugin_.identifier in enabled or plugin_.identifier in settings.FORCE_ENABLED_PLUGINS
+        ]
+        registry = _Registry(
+            version=version,
+            enabled=enabled_plugins,
+            by_hook={
+                hook: [plugin_ for plugin_ in enabled_plugins if implements(plugin_)]
+                for hook, implements in HOOKS.items()
+            },
+        )
+        if version is not None:
+            self._registry = registry
+        return registry
 
 
 plugin_pool = PluginPool()
+
+
+def _clear_plugin_pool(sender, **kwargs) -> None:
+    plugin_pool.clear_cache()
+
+
+post_save.connect(_clear_plugin_pool, sender="plugins.MPlugin", dispatch_uid="plugin_pool_save")
+post_delete.connect(_clear_plugin_pool, sender="plugins.MPlugin", dispatch_uid="plugin_pool_delete")
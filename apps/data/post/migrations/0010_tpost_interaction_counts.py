@@ -0,0 +1,58 @@
+from collections import Counter, defaultdict
+
+from django.db import migrations, models
+
+
+def _get_comment_type(microformat_data) -> str:
+    # As TWebmention.comment_type when this migration was written.
+    comment_types = (microformat_data or {}).get("comment_type") or []
+    for comment_type in ("reply", "repost", "like"):
+        if comment_type in comment_types:
+            return comment_type
+    return "mention"
+
+
+def count_interactions(apps, schema_editor):
+    TPost = apps.get_model("post", "TPost")
+    TWebmention = apps.get_model("indieweb", "TWebmention")
+    counts: dict[int, Counter] = defaultdict(Counter)
+    for t_webmention in TWebmention.objects.filter(approval_status=True).only("t_post_id", "microformat_data"):
+        counts[t_webmention.t_post_id][_get_comment_type(t_webmention.microformat_data)] += 1
+    for t_post_id, post_counts in counts.items():
+        TPost.objects.filter(pk=t_post_id).update(
+            like_count=post_counts["like"],
+            reply_count=post_counts["reply"],
+            repost_count=post_counts["repost"],
+            mention_count=post_counts["mention"],
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("indieweb", "0008_twebmentionsend_response_body"),
+        ("post", "0009_tpost_trips"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="tpost",
+            name="like_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="tpost",
+            name="reply_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="tpost",
+            name="repost_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="tpost",
+            name="mention_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(count_interactions, reverse_code=migrations.RunPython.noop),
+    ]
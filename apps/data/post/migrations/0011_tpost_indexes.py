@@ -0,0 +1,22 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("post", "0010_tpost_interaction_counts"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="tpost",
+            index=models.Index(
+                fields=["m_post_status", "dt_published", "visibility"], name="t_post_status_published_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="tpost",
+            index=models.Index(
+                fields=["m_post_kind", "m_post_status", "dt_published"], name="t_post_kind_published_idx"
+            ),
+        ),
+    ]
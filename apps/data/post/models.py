@@ -1,5 +1,6 @@
 import datetime
 import uuid
+from collections import Counter
 
 from django.contrib.auth import get_user_model
 from django.db import models
@@ -10,14 +11,16 @@ from django.utils.timezone import now
 from taggit import managers as taggit_managers
 
 from core.constants import VISIBILITY_CHOICES, Visibility
-from core.models import TimestampModel
-from data.indieweb.constants import MPostKinds, MPostStatuses
+from core.models import MasterDataForeignKey, MasterDataManager, TimestampModel
+from data.indieweb.constants import CommentTypes, MPostKinds, MPostStatuses
 
 
 class MPostStatus(TimestampModel):
     key = models.CharField(max_length=16, unique=True)
     name = models.CharField(max_length=16)
 
+    objects = MasterDataManager()
+
     class Meta:
         db_table = "m_post_status"
         verbose_name = "Post Status"
@@ -31,6 +34,8 @@ class MPostKind(TimestampModel):
     key = models.CharField(max_length=16, unique=True)
     name = models.CharField(max_length=16)
 
+    objects = MasterDataManager()
+
     class Meta:
         db_table = "m_post_kind"
         verbose_name = "Post Kind"
@@ -53,11 +58,13 @@ class MPostKind(TimestampModel):
 
 class TPostManager(models.Manager):
     def published(self):
-        return self.get_queryset().filter(m_post_status__key=MPostStatuses.published, dt_published__lte=now())
+        return self.get_queryset().filter(
+            m_post_status_id=MPostStatus.objects.id_for_key(MPostStatuses.published), dt_published__lte=now()
+        )
 
     def drafts(self):
         return self.get_queryset().filter(
-            m_post_status__key=MPostStatuses.draft,
+            m_post_status_id=MPostStatus.objects.id_for_key(MPostStatuses.draft),
         )
 
     def visible_for_user(self, user_id: int | None):
@@ -68,13 +75,15 @@ class TPostManager(models.Manager):
             return qs.filter(anon_ok_entries | private_entries)
         else:
             # Anonymous users can only see published posts
-            qs = qs.filter(m_post_status__key=MPostStatuses.published, dt_published__lte=now())
+            qs = qs.filter(
+                m_post_status_id=MPostStatus.objects.id_for_key(MPostStatuses.published), dt_published__lte=now()
+            )
         return qs.filter(anon_ok_entries)
 
 
 class TPost(TimestampModel):
-    m_post_status = models.ForeignKey(MPostStatus, on_delete=models.CASCADE)
-    m_post_kind = models.ForeignKey(MPostKind, on_delete=models.CASCADE)
+    m_post_status = MasterDataForeignKey(MPostStatus, on_delete=models.CASCADE)
+    m_post_kind = MasterDataForeignKey(MPostKind, on_delete=models.CASCADE)
     uuid = models.UUIDField(default=uuid.uuid4)
 
     p_author = models.ForeignKey(get_user_model(), on_delete=models.CASCADE)
@@ -92,6 +101,13 @@ class TPost(TimestampModel):
         "trips.TTrip",
         through="trips.TTripPost",
     )
+
+    # Approved webmentions by type, kept up to date as webmentions are moderated.
+    like_count = models.PositiveIntegerField(default=0)
+    reply_count = models.PositiveIntegerField(default=0)
+    repost_count = models.PositiveIntegerField(default=0)
+    mention_count = models.PositiveIntegerField(default=0)
+
     objects = TPostManager()
     tags = taggit_managers.TaggableManager()
 
@@ -99,10 +115,33 @@ class TPost(TimestampModel):
         db_table = "t_post"
         verbose_name = "Post"
         verbose_name_plural = "Posts"
+        indexes = [
+            # Published posts newest first, optionally filtered by visibility without reading the table.
+            models.Index(fields=["m_post_status", "dt_published", "visibility"], name="t_post_status_published_idx"),
+            # A single kind of published post (e.g. bookmarks) newest first.
+            models.Index(fields=["m_post_kind", "m_post_status", "dt_published"], name="t_post_kind_published_idx"),
+        ]
 
     def get_absolute_url(self) -> str:
         return reverse("public:post_detail", args=[self.uuid])
 
+    @property
+    def interaction_count(self) -> int:
+        return self.like_count + self.reply_count + self.repost_count + self.mention_count
+
+    def update_interaction_counts(self) -> None:
+        """
+        Recount the approved webmentions for this post.
+        """
+        counts = Counter(
+            t_webmention.comment_type for t_webmention in self.ref_t_webmention.filter(approval_status=True)
+        )
+        self.like_count = counts[CommentTypes.like]
+        self.reply_count = counts[CommentTypes.reply]
+        self.repost_count = counts[CommentTypes.repost]
+        self.mention_count = counts[CommentTypes.mention]
+        self.save(update_fields=["like_count", "reply_count", "repost_count", "mention_count"])
+
     @property
     def is_draft(self) -> bool:
         return self.m_post_status.key == MPostStatuses.draft
@@ -1,7 +1,45 @@
+import copy
+
 from django.db import models
+from django.db.models.signals import post_delete, post_save
 
+from core import cache_versions, page_cache
 from core.models import TimestampModel
 
+# Version of the site settings, shared by every process through the cache and replaced whenever they change.
+VERSION_KEY = "site_settings:version"
+
+
+class MSiteSettingsManager(models.Manager):
+    """
+    Caches the site settings, with their active trip, per process.
+
+    A process reloads them once the version in the shared cache differs from the one it loaded, so every request
+    costs a cache read instead of queries.
+    """
+
+    _current: tuple[str, "MSiteSettings"] | None = None
+
+    def get_current(self) -> "MSiteSettings":
+        version = cache_versions.get_version(VERSION_KEY)
+        current = MSiteSettingsManager._current
+        if current is None or version is None or current[0] != version:
+            site_settings = self.get_queryset().select_related("active_trip").first() or self.model()
+            if version is not None:
+                MSiteSettingsManager._current = (version, site_settings)
+        else:
+            site_settings = current[1]
+        # Callers get their own copy so changes to it don't leak into the cache.
+        return copy.copy(site_settings)
+
+    def clear_cache(self) -> None:
+        """
+        Make every process reload the settings, this one straight away and the others once the current transaction
+        commits.
+        """
+        MSiteSettingsManager._current = None
+        cache_versions.replace_version(VERSION_KEY)
+
 
 class MSiteSettings(TimestampModel):
     title = models.CharField(max_length=128, default="Tanzawa", blank=True)
@@ -26,6 +64,24 @@ class MSiteSettings(TimestampModel):
         on_delete=models.SET_NULL,
     )
 
+    objects = MSiteSettingsManager()
+
     class Meta:
         verbose_name = "Site Settings"
         verbose_name_plural = "Site Settings"
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        MSiteSettings.objects.clear_cache()
+        # The title, theme and footer are on every page.
+        page_cache.purge(page_cache.SITE)
+
+
+def _clear_site_settings(sender, **kwargs) -> None:
+    MSiteSettings.objects.clear_cache()
+
+
+# The cached settings hold the active trip, which is unset in SQL when the trip is deleted.
+post_delete.connect(_clear_site_settings, sender=MSiteSettings, dispatch_uid="site_settings_delete")
+post_save.connect(_clear_site_settings, sender="trips.TTrip", dispatch_uid="site_settings_trip_save")
+post_delete.connect(_clear_site_settings, sender="trips.TTrip", dispatch_uid="site_settings_trip_delete")
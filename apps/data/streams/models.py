@@ -1,8 +1,13 @@
 from django.db import models
+from django.db.models.signals import post_delete, post_save
 
+from core import cache_versions, page_cache
 from core.constants import VISIBILITY_CHOICES, Visibility
 from core.models import TimestampModel
 
+# Version of the streams, shared by every process through the cache and replaced whenever they change.
+VERSION_KEY = "streams:version"
+
 
 class MStreamManager(models.Manager):
     def visible(self, user):
@@ -11,6 +16,12 @@ class MStreamManager(models.Manager):
         else:
             return super().get_queryset().filter(visibility=Visibility.PUBLIC)
 
+    def navigation(self, user) -> list["MStream"]:
+        """
+        The streams listed in the navigation of every page, from a per-process cache kept until a stream changes.
+        """
+        return [stream for stream in _streams.get() if user.is_authenticated or stream.visibility == Visibility.PUBLIC]
+
 
 class MStream(TimestampModel):
     icon = models.CharField(max_length=2, help_text="Select an emoji")
@@ -39,3 +50,16 @@ class TStreamPost(TimestampModel):
         unique_together = ("m_stream", "t_post")
         verbose_name = "Stream-Post"
         verbose_name_plural = "Stream-Posts"
+
+
+_streams = cache_versions.ProcessCache(VERSION_KEY, lambda: list(MStream.objects.all()))
+
+
+def _clear_streams(sender, **kwargs) -> None:
+    _streams.clear()
+    # The streams are in the navigation of every page.
+    page_cache.purge(page_cache.SITE)
+
+
+post_save.connect(_clear_streams, sender=MStream, dispatch_uid="streams_save")
+post_delete.connect(_clear_streams, sender=MStream, dispatch_uid="streams_delete")
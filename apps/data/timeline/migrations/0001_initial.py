@@ -0,0 +1,68 @@
+# Generated by Django 4.2.16 on 2026-10-18 09:12
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("entry", "0009_bridgypublishurl"),
+        ("post", "0009_tpost_trips"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TTimeline",
+            fields=[
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "t_post",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="ref_t_timeline",
+                        serialize=False,
+                        to="post.tpost",
+                    ),
+                ),
+                ("m_post_kind_key", models.CharField(max_length=16)),
+                ("m_post_status_key", models.CharField(max_length=16)),
+                (
+                    "visibility",
+                    models.SmallIntegerField(choices=[(1, "Everyone"), (2, "Only me"), (3, "People who know the url")]),
+                ),
+                ("dt_published", models.DateTimeField()),
+                ("post_title", models.CharField(blank=True, default="", max_length=512)),
+                ("p_summary", models.CharField(blank=True, default="", max_length=1024)),
+                ("location_summary", models.CharField(blank=True, default="", max_length=512)),
+                ("stream_ids", models.JSONField(default=list)),
+                ("interaction_count", models.PositiveIntegerField(default=0)),
+                (
+                    "p_author",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "t_entry",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="ref_t_timeline",
+                        to="entry.tentry",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Timeline",
+                "verbose_name_plural": "Timeline",
+                "db_table": "t_timeline",
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("timeline", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="ttimeline",
+            index=models.Index(fields=["dt_published"], name="t_timeline_published_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="ttimeline",
+            index=models.Index(fields=["p_author", "dt_published"], name="t_timeline_author_idx"),
+        ),
+    ]
@@ -0,0 +1,59 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+import core.db.fts
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("timeline", "0002_ttimeline_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TTimelineSearch",
+            fields=[
+                (
+                    "t_timeline",
+                    models.OneToOneField(
+                        db_column="rowid",
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        primary_key=True,
+                        related_name="ref_t_timeline_search",
+                        serialize=False,
+                        to="timeline.ttimeline",
+                    ),
+                ),
+                ("document", core.db.fts.FullTextField(db_column="t_timeline_search")),
+                ("rank", models.FloatField()),
+                ("title", models.TextField()),
+                ("summary", models.TextField()),
+                ("content", models.TextField()),
+                ("tags", models.TextField()),
+                ("metadata", models.TextField()),
+            ],
+            options={
+                "verbose_name": "Timeline Search",
+                "verbose_name_plural": "Timeline Search",
+                "db_table": "t_timeline_search",
+                "managed": False,
+            },
+        ),
+        migrations.RunSQL(
+            sql=[
+                # Prefix indexes keep "hik*" style queries as fast as whole words.
+                "CREATE VIRTUAL TABLE t_timeline_search USING fts5("
+                "title, summary, content, tags, metadata, "
+                "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')",
+                # Weight the columns: a match in the title counts for more than one in the body.
+                "INSERT INTO t_timeline_search (t_timeline_search, rank) VALUES ('rank', 'bm25(10.0, 5.0, 1.0, 5.0, 3.0)')",
+                "CREATE TRIGGER t_timeline_search_delete AFTER DELETE ON t_timeline BEGIN "
+                "DELETE FROM t_timeline_search WHERE rowid = old.t_post_id; "
+                "END",
+            ],
+            reverse_sql=[
+                "DROP TRIGGER t_timeline_search_delete",
+                "DROP TABLE t_timeline_search",
+            ],
+        ),
+    ]
@@ -0,0 +1,14 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("timeline", "0003_ttimelinesearch"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="ttimeline",
+            name="stream_ids",
+        ),
+    ]
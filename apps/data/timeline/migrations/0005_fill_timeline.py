@@ -0,0 +1,23 @@
+from django.db import migrations
+
+from domain.timeline import operations as timeline_ops
+
+
+def fill_timeline(apps, schema_editor):
+    # The rows are the same projection refresh_timeline() writes when a post is saved, so this uses the current models
+    # rather than historical ones. The dependencies below must stay on the latest migrations of the tables it reads.
+    # The search index is filled by the next migration.
+    timeline_ops.rebuild_timeline(index=False)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("entry", "0010_tlocation_point_wgs84"),
+        ("post", "0011_tpost_indexes"),
+        ("taggit", "0006_rename_taggeditem_content_type_object_id_taggit_tagg_content_8fc721_idx"),
+        ("timeline", "0004_remove_ttimeline_stream_ids"),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_timeline, reverse_code=migrations.RunPython.noop),
+    ]
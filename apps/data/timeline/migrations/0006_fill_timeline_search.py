@@ -0,0 +1,18 @@
+from django.db import migrations
+
+from domain.timeline import operations as timeline_ops
+
+
+def fill_timeline_search(apps, schema_editor):
+    # Indexes the rows filled by 0005_fill_timeline, with the current models for the same reason.
+    timeline_ops.rebuild_timeline_search()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("timeline", "0005_fill_timeline"),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_timeline_search, reverse_code=migrations.RunPython.noop),
+    ]
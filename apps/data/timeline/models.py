@@ -0,0 +1,105 @@
+from django.contrib.auth import get_user_model
+from django.db import connections, models, router
+from django.db.models import Q
+from django.utils.timezone import now
+
+from core.constants import VISIBILITY_CHOICES, Visibility
+from core.db.fts import FullTextField
+from core.models import TimestampModel
+
+
+class TTimelineManager(models.Manager):
+    def visible_for_user(self, user_id: int | None):
+        qs = self.get_queryset()
+        anon_ok_entries = Q(visibility__in=[Visibility.PUBLIC, Visibility.UNLISTED])
+        if user_id:
+            private_entries = Q(visibility=Visibility.PRIVATE, p_author_id=user_id)
+            return qs.filter(anon_ok_entries | private_entries)
+        # Anonymous users can't see posts scheduled for the future
+        return qs.filter(anon_ok_entries, dt_published__lte=now())
+
+
+class TTimeline(TimestampModel):
+    """
+    A denormalized, read-only copy of each published post with everything list pages filter and sort on.
+
+    Rows are maintained by domain.timeline.operations whenever a post or its interactions change.
+    """
+
+    t_post = models.OneToOneField(
+        "post.TPost", on_delete=models.CASCADE, primary_key=True, related_name="ref_t_timeline"
+    )
+    t_entry = models.OneToOneField("entry.TEntry", on_delete=models.CASCADE, related_name="ref_t_timeline")
+    m_post_kind_key = models.CharField(max_length=16)
+    m_post_status_key = models.CharField(max_length=16)
+    visibility = models.SmallIntegerField(choices=VISIBILITY_CHOICES)
+    p_author = models.ForeignKey(get_user_model(), on_delete=models.CASCADE, related_name="+")
+    dt_published = models.DateTimeField()
+    post_title = models.CharField(max_length=512, blank=True, default="")
+    p_summary = models.CharField(max_length=1024, blank=True, default="")
+    location_summary = models.CharField(max_length=512, blank=True, default="")
+    interaction_count = models.PositiveIntegerField(default=0)
+
+    objects = TTimelineManager()
+
+    class Meta:
+        db_table = "t_timeline"
+        verbose_name = "Timeline"
+        verbose_name_plural = "Timeline"
+        indexes = [
+            # SQLite appends the rowid (t_post_id) to every index, so these also match the tie-break ordering.
+            models.Index(fields=["dt_published"], name="t_timeline_published_idx"),
+            models.Index(fields=["p_author", "dt_published"], name="t_timeline_author_idx"),
+        ]
+
+    def __str__(self):
+        return self.post_title
+
+
+class TTimelineSearchManager(models.Manager):
+    def index(self, t_post_id: int, title: str, summary: str, content: str, tags: str, metadata: str) -> None:
+        """
+        Replace the indexed text for a timeline row.
+
+        FTS5 tables can't be written with save(): the hidden columns would be inserted as commands.
+        """
+        table = self.model._meta.db_table
+        with connections[router.db_for_write(self.model)].cursor() as cursor:
+            cursor.execute(f"DELETE FROM {table} WHERE rowid = %s", [t_post_id])
+            cursor.execute(
+                f"INSERT INTO {table} (rowid, title, summary, content, tags, metadata) VALUES (%s, %s, %s, %s, %s, %s)",
+                [t_post_id, title, summary, content, tags, metadata],
+            )
+
+
+class TTimelineSearch(models.Model):
+    """
+    The SQLite FTS5 full-text index of the timeline, one row per timeline row sharing its rowid.
+
+    The table is created by a migration. Rows are written by domain.timeline.operations and removed by a trigger when
+    their timeline row is deleted.
+    """
+
+    t_timeline = models.OneToOneField(
+        TTimeline,
+        on_delete=models.DO_NOTHING,
+        primary_key=True,
+        db_column="rowid",
+        related_name="ref_t_timeline_search",
+    )
+    document = FullTextField(db_column="t_timeline_search")
+    # BM25 relevance, lower is better. Only set when the query has a match lookup.
+    rank = models.FloatField()
+    title = models.TextField()
+    summary = models.TextField()
+    content = models.TextField()
+    tags = models.TextField()
+    metadata = models.TextField()
+
+    objects = TTimelineSearchManager()
+
+    class Meta:
+        managed = False
+        db_table = "t_timeline_search"
+        verbose_name = "Timeline Search"
+        verbose_name_plural = "Timeline Search"
@@ -0,0 +1,19 @@
+import django.contrib.gis.db.models.fields
+from django.db import migrations
+
+from core.db import spatial
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("trips", "0002_auto_20220404_0621"),
+    ]
+
+    # The points were always longitude/latitude, declared as SRID 3857.
+    operations = spatial.change_srid(
+        "ttriplocation",
+        "t_trip_location",
+        "point",
+        django.contrib.gis.db.models.fields.PointField(geography=True, srid=3857),
+        django.contrib.gis.db.models.fields.PointField(geography=True, srid=4326),
+    )
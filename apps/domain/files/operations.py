@@ -1,47 +1,256 @@
+import hashlib
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from django.conf import settings
+from django.core.files.uploadedfile import TemporaryUploadedFile, UploadedFile
+from django.db import connections, transaction
+
+from core import locks
 from data.files import models as file_models
 from domain.files import queries as file_queries
+from domain.images import exif as exif_ops
 from domain.images import images as image_ops
 
+logger = logging.getLogger(__name__)
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
 
 class UnprocessableFile(Exception): ...
 
 
+class DerivativeBusy(Exception):
+    """
+    Another worker is creating the processed file asked for, and didn't finish within MEDIA_DERIVATIVE_WAIT.
+    """
+
+
 def get_file(
     t_file: file_models.TFile, target_mime: str, longest_edge: int | None = None
 ) -> file_models.TFile | file_models.TFormattedImage:
     """
     Return the file or a processed (resized/format changed) file.
+
+    :raises DerivativeBusy
+    """
+    return_file, _ = _get_or_create_file(t_file, target_mime, longest_edge)
+    return return_file
+
+
+def set_metadata(t_file: file_models.TFile, file) -> None:
+    """
+    Set the sizes and byte size of t_file from file, its upload or stored file, without saving it.
+    """
+    t_file.byte_size = file.size
+    metadata = image_ops.get_image_metadata(file) if t_file.mime_type.startswith("image") else None
+    t_file.width = metadata.width if metadata else None
+    t_file.height = metadata.height if metadata else None
+    t_file.display_width = metadata.display_width if metadata else None
+    t_file.display_height = metadata.display_height if metadata else None
+
+
+def ingest_upload(t_file: file_models.TFile, upload: UploadedFile) -> UploadedFile:
+    """
+    Prepare an upload to be stored as t_file's file, setting t_file's exif, location, sizes and content hash from it.
+
+    Images are decoded once, to rotate them upright and leave their metadata out, and written to a temporary file
+    that's hashed as it's written and moved into place when t_file is saved. Other files are stored as uploaded,
+    without any image work, and aren't read again if they were hashed as they were received.
+    """
+    file = upload
+    metadata = None
+    content_hash = getattr(upload, "content_hash", None)
+    t_file.exif, t_file.point = {}, None
+    if t_file.mime_type.startswith("image"):
+        t_file.exif = exif_ops.extract_exif_from_header(upload)
+        t_file.point = exif_ops.get_location(t_file.exif)
+        upright = TemporaryUploadedFile(upload.name, upload.content_type, 0, upload.charset)
+        writer = _HashingWriter(upright.file)
+        metadata = image_ops.save_upright(upload, t_file.mime_type, writer)
+        if metadata is None:
+            # Pillow can't read it, e.g. an SVG, so it's stored as it is.
+            upright.close()
+        else:
+            upright.size = writer.size
+            upright.seek(0)
+            file, content_hash = upright, writer.hexdigest()
+
+    t_file.content_hash = content_hash or _md5_sum(file)
+    t_file.byte_size = file.size
+    t_file.width = metadata.width if metadata else None
+    t_file.height = metadata.height if metadata else None
+    t_file.display_width = metadata.display_width if metadata else None
+    t_file.display_height = metadata.display_height if metadata else None
+    return file
+
+
+class _HashingWriter:
+    """
+    Write to a file and hash what's written. Without a fileno(), Pillow's encoders write through write().
+    """
+
+    def __init__(self, file) -> None:
+        self.file = file
+        self.md5 = hashlib.md5()
+        self.position = 0
+        self.size = 0
+        # Set when an encoder goes back to patch what it wrote, e.g. TIFF offsets, so the file is hashed again.
+        self.rewound = False
+
+    def write(self, data: bytes) -> int:
+        written = self.file.write(data)
+        self.md5.update(data)
+        self.position += len(data)
+        self.size = max(self.size, self.position)
+        return written
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        self.position = self.file.seek(offset, whence)
+        if self.position != self.size:
+            self.rewound = True
+        return self.position
+
+    def tell(self) -> int:
+        return self.position
+
+    def flush(self) -> None:
+        self.file.flush()
+
+    def hexdigest(self) -> str:
+        if self.rewound:
+            self.file.flush()
+            return _md5_sum(self.file)
+        return self.md5.hexdigest()
+
+
+def _md5_sum(file) -> str:
+    hash_md5 = hashlib.md5()
+    file.seek(0)
+    while chunk := file.read(64 * 1024):
+        hash_md5.update(chunk)
+    file.seek(0)
+    return hash_md5.hexdigest()
+
+
+def update_metadata(t_file: file_models.TFile) -> None:
     """
-    return_file = t_file
+    Read and save the metadata of a file uploaded before it was stored.
+    """
+    with t_file.file.open("rb") as file:
+        t_file.content_hash = _md5_sum(file)
+        set_metadata(t_file, file)
+    t_file.save(
+        update_fields=["width", "height", "display_width", "display_height", "byte_size", "content_hash", "updated_at"]
+    )
+
+
+def create_derivatives(t_file: file_models.TFile) -> int:
+    """
+    Create the processed files in MEDIA_DERIVATIVES that t_file doesn't have yet, and return how many were created.
+    """
+    if not file_queries.can_process_file(t_file.mime_type):
+        return 0
+    created_count = 0
+    for longest_edge, target_mime in settings.MEDIA_DERIVATIVES:
+        try:
+            _, created = _get_or_create_file(t_file, target_mime or t_file.mime_type, longest_edge)
+        except DerivativeBusy:
+            # A request for it is still creating it.
+            continue
+        created_count += created
+    return created_count
+
+
+def schedule_derivatives(t_file: file_models.TFile) -> None:
+    """
+    Create the derivatives of t_file with create_derivatives() in a background worker, once the current transaction
+    commits.
+    """
+    if not settings.MEDIA_DERIVATIVES or not file_queries.can_process_file(t_file.mime_type):
+        return
+    if settings.MEDIA_DERIVATIVE_WORKERS:
+        transaction.on_commit(lambda: _get_executor().submit(_create_derivatives_in_background, t_file.pk))
+    else:
+        transaction.on_commit(lambda: _create_derivatives_for_pk(t_file.pk))
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.MEDIA_DERIVATIVE_WORKERS, thread_name_prefix="media-derivatives"
+            )
+        return _executor
+
+
+def _create_derivatives_in_background(t_file_pk: int) -> None:
+    try:
+        _create_derivatives_for_pk(t_file_pk)
+    finally:
+        connections.close_all()
+
+
+def _create_derivatives_for_pk(t_file_pk: int) -> None:
+    try:
+        t_file = file_models.TFile.objects.filter(pk=t_file_pk).first()
+        if t_file is not None:
+            create_derivatives(t_file)
+    except Exception:
+        # They're created by the first request for each instead.
+        logger.exception("Error creating derivatives of file %s", t_file_pk)
+
+
+def _get_or_create_file(
+    t_file: file_models.TFile, target_mime: str, longest_edge: int | None = None
+) -> tuple[file_models.TFile | file_models.TFormattedImage, bool]:
     if target_mime == t_file.mime_type and longest_edge is None:
         # They're requesting the original file so return early
-        return return_file
+        return t_file, False
 
     try:
         if file_queries.can_process_file(target_mime):
-            return_file, _ = _get_or_create_processed_file(t_file, target_mime, longest_edge)
+            return _get_or_create_processed_file(t_file, target_mime, longest_edge)
         elif longest_edge:
-            return_file, _ = _get_or_create_processed_file(
-                t_file, target_mime=t_file.mime_type, longest_edge=longest_edge
-            )
+            return _get_or_create_processed_file(t_file, target_mime=t_file.mime_type, longest_edge=longest_edge)
     except UnprocessableFile:
-        return t_file
-    else:
-        return return_file
+        pass
+    return t_file, False
 
 
 def _get_or_create_processed_file(
     t_file: file_models.TFile, target_mime: str, longest_edge: int | None = None
 ) -> tuple[file_models.TFormattedImage, bool]:
-    if processed_file := file_queries.get_processed_file(t_file, mime_type=target_mime, longest_edge=longest_edge):
+    if processed_file := _get_existing_processed_file(t_file, target_mime, longest_edge):
         return processed_file, False
 
+    # Only one worker decodes the original for each processed file, the rest wait for it rather than all creating it.
+    # It's saved in autocommit before the lock is released, so the next to take the lock finds it.
+    lock_path = _get_lock_path(t_file, target_mime, longest_edge)
+    with locks.file_lock(lock_path, timeout=settings.MEDIA_DERIVATIVE_WAIT) as locked:
+        if not locked:
+            raise DerivativeBusy(f"{target_mime} {longest_edge} of {t_file.uuid}")
+        if processed_file := _get_existing_processed_file(t_file, target_mime, longest_edge):
+            return processed_file, False
+        return _create_processed_file(t_file, target_mime=target_mime, longest_edge=longest_edge), True
+
+
+def _get_existing_processed_file(
+    t_file: file_models.TFile, target_mime: str, longest_edge: int | None
+) -> file_models.TFormattedImage | None:
+    if processed_file := file_queries.get_processed_file(t_file, mime_type=target_mime, longest_edge=longest_edge):
+        return processed_file
+
     width, height = image_ops.get_maybe_resized_size(t_file, longest_edge)
-    if processed_file := file_queries.get_processed_file(
-        t_file, mime_type=target_mime, longest_edge=max([width, height])
-    ):
-        return processed_file, False
-    return _create_processed_file(t_file, target_mime=target_mime, longest_edge=longest_edge), True
+    return file_queries.get_processed_file(t_file, mime_type=target_mime, longest_edge=max([width, height]))
+
+
+def _get_lock_path(t_file: file_models.TFile, target_mime: str, longest_edge: int | None) -> Path:
+    return Path(settings.MEDIA_DERIVATIVE_LOCK_DIR) / f"{t_file.uuid}-{target_mime.replace('/', '-')}-{longest_edge}"
 
 
 def _create_processed_file(
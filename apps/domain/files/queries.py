@@ -16,7 +16,7 @@ def get_public_photos(limit: int = 10) -> QuerySet[file_models.TFile]:
     """
     qs = (
         file_models.TFile.objects.filter(mime_type__startswith="image")
-        .filter(posts__m_post_status__key=MPostStatuses.published)
+        .filter(posts__m_post_status_id=post_models.MPostStatus.objects.id_for_key(MPostStatuses.published))
         .exclude(posts__visibility=Visibility.UNLISTED)
         .order_by("-posts__dt_published")
     )
@@ -40,12 +40,17 @@ def get_size_for_file(t_file: file_models.TFile) -> Size:
     """
     Return the size for a given file.
     """
-    try:
-        with Image.open(t_file.file) as image:
-            return Size(width=image.width, height=image.height)
-    except UnidentifiedImageError:
-        # Return a fixed size if case we upload a PDF or some non-Image file.
-        return Size(width=600, height=600)
+    if t_file.width and t_file.height:
+        return Size(width=t_file.width, height=t_file.height)
+    if t_file.byte_size is None:
+        # Uploaded before sizes were stored, see the update_file_metadata command.
+        try:
+            with Image.open(t_file.file) as image:
+                return Size(width=image.width, height=image.height)
+        except UnidentifiedImageError:
+            pass
+    # Return a fixed size if case we upload a PDF or some non-Image file.
+    return Size(width=600, height=600)
 
 
 def can_process_file(mime_type: str | None) -> bool:
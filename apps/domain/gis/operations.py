@@ -0,0 +1,25 @@
+from django.db import connections, router
+
+from domain.gis import queries as gis_queries
+
+
+def rebuild_spatial_indexes() -> list[str]:
+    """
+    Create any missing spatial index in SPATIAL_INDEXES and rebuild those that don't match their table.
+
+    Returns the "table.column" of each index that was created or rebuilt.
+    """
+    rebuilt = []
+    for model, field_name in gis_queries.SPATIAL_INDEXES:
+        table, column = model._meta.db_table, model._meta.get_field(field_name).column
+        with connections[router.db_for_write(model)].cursor() as cursor:
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s", [f"idx_{table}_{column}"])
+            if cursor.fetchone() is None:
+                cursor.execute("SELECT CreateSpatialIndex(%s, %s)", [table, column])
+            else:
+                cursor.execute("SELECT CheckSpatialIndex(%s, %s)", [table, column])
+                if cursor.fetchone()[0] == 1:
+                    continue
+                cursor.execute("SELECT RecoverSpatialIndex(%s, %s)", [table, column])
+        rebuilt.append(f"{table}.{column}")
+    return rebuilt
@@ -5,6 +5,14 @@ Adapted from: https://wiki.openstreetmap.org/wiki/Mercator
 
 import math
 
+from django.db import models
+from django.db.models import QuerySet
+
+from core.db import spatial
+from data.entry import models as entry_models
+from data.files import models as file_models
+from data.trips import models as trip_models
+
 EARTH_RADIUS_KM = 6378137.0
 
 
@@ -22,3 +30,61 @@ def x2lng(x):
 
 def lon2x(lon):
     return math.radians(lon) * EARTH_RADIUS_KM
+
+
+# Point fields with a SpatiaLite R*Tree index.
+SPATIAL_INDEXES: list[tuple[type[models.Model], str]] = [
+    (entry_models.TLocation, "point"),
+    (file_models.TFile, "point"),
+    (trip_models.TTripLocation, "point"),
+]
+
+# The first radius nearest() tries, grown until it finds enough points.
+NEAREST_INITIAL_RADIUS_KM = 1.0
+
+
+def within_radius(qs: QuerySet, point_field: str, lat: float, lon: float, radius_km: float) -> QuerySet:
+    """
+    Filter a queryset to rows whose point is within radius_km of lat/lon, annotating each with its distance_km.
+
+    point_field may follow relations, e.g. "t_entry__t_location__point". Candidates are read from the point's spatial
+    index using the circle's bounding box, then filtered on their exact distance.
+    """
+    pk_path, table, column = _get_spatial_index(qs.model, point_field)
+    box = spatial.bounding_box(lat, lon, radius_km)
+    return (
+        qs.filter(**{f"{pk_path}__in": spatial.index_lookup(table, column, box)})
+        .annotate(distance_km=spatial.Distance(point_field, lat, lon))
+        .filter(distance_km__lte=radius_km)
+    )
+
+
+def nearest(
+    qs: QuerySet, point_field: str, lat: float, lon: float, k: int, max_radius_km: float = spatial.MAX_DISTANCE_KM
+) -> list:
+    """
+    Get the k rows whose point is closest to lat/lon, nearest first, annotated with their distance_km.
+
+    The search radius starts small and grows until k rows are found, so only the index near the point is read.
+    """
+    max_radius_km = min(max_radius_km, spatial.MAX_DISTANCE_KM)
+    radius_km = min(NEAREST_INITIAL_RADIUS_KM, max_radius_km)
+    while True:
+        rows = list(within_radius(qs, point_field, lat, lon, radius_km).order_by("distance_km")[:k])
+        # Everything outside the radius is further away than these, so they are the nearest.
+        if len(rows) == k or radius_km >= max_radius_km:
+            return rows
+        radius_km = min(radius_km * 4, max_radius_km)
+
+
+def _get_spatial_index(model: type[models.Model], point_field: str) -> tuple[str, str, str]:
+    """
+    Get the path to the primary key of the point's model, and the table and column of its spatial index.
+    """
+    *relations, field_name = point_field.split("__")
+    for relation in relations:
+        model = model._meta.get_field(relation).related_model
+    field = model._meta.get_field(field_name)
+    if (model, field_name) not in SPATIAL_INDEXES:
+        raise ValueError(f"{model._meta.label}.{field_name} doesn't have a spatial index")
+    return "__".join([*relations, "pk"]), model._meta.db_table, field.column
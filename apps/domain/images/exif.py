@@ -3,6 +3,10 @@ from typing import Any
 
 from django.contrib.gis.geos import Point
 from exif import Image
+from plum import exceptions as plum_exceptions
+
+# EXIF is stored in a JPEG's APP1 segment, which is at most 64KiB and comes right after the start of the file.
+EXIF_HEADER_SIZE = 128 * 1024
 
 
 def extract_exif(image) -> dict[str, Any]:
@@ -14,7 +18,7 @@ def extract_exif(image) -> dict[str, Any]:
     if not img.has_exif:
         return exif
 
-    for key in dir(img):
+    for key in img.list_all():
         value = img.get(key)
         if not value:
             continue
@@ -30,6 +34,19 @@ def extract_exif(image) -> dict[str, Any]:
     return exif
 
 
+def extract_exif_from_header(file) -> dict[str, Any]:
+    """
+    Extract the exif information of a file from its first bytes, without reading all of it.
+    """
+    file.seek(0)
+    header = file.read(EXIF_HEADER_SIZE)
+    file.seek(0)
+    try:
+        return extract_exif(header)
+    except (plum_exceptions.UnpackError, ValueError):
+        return {}
+
+
 def scrub_exif(image: BytesIO) -> BytesIO | None:
     img = Image(image)
     if not img.has_exif:
@@ -1,55 +1,132 @@
 import io
 import math
 import mimetypes
+from dataclasses import dataclass
 from pathlib import Path
 
 import fitz
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.utils.timezone import now
-from PIL import Image, ImageOps
+from PIL import Image, ImageOps, UnidentifiedImageError
 
 from data.files import models as file_models
 
-
-def rotate_image(image_bytes: io.BytesIO, mime_type: str) -> io.BytesIO:
-    if not mime_type.startswith("image"):
-        return image_bytes
-
+# The EXIF orientation tag.
+ORIENTATION = 274
+# The orientations that turn an image by a quarter turn, so its width and height are swapped once it's upright.
+QUARTER_TURNS = (5, 6, 7, 8)
+# Images are decoded, and reduced, to no less than this many times the size they're resized to, then resampled down
+# with RESAMPLE. Image.thumbnail() uses the same: at 3 a 12MP photo can't be decoded at half size for an 800px copy.
+REDUCING_GAP = 2.0
+RESAMPLE = Image.Resampling.LANCZOS
+# Encoder settings per Pillow format. WEBP's slower methods save little for twice the time, on the request path.
+SAVE_OPTIONS: dict[str, dict] = {
+    "JPEG": {"quality": 85, "optimize": True, "progressive": True},
+    "PNG": {"optimize": True},
+    "WEBP": {"quality": 80, "method": 4},
+}
+
+
+@dataclass(frozen=True)
+class ImageMetadata:
+    width: int
+    height: int
+    # The size once rotated to its EXIF orientation, as it's shown and resized.
+    display_width: int
+    display_height: int
+
+
+def get_image_metadata(file) -> ImageMetadata | None:
+    """
+    Read the size of an image from its header, without decoding it. Returns None for files Pillow can't read.
+    """
+    file.seek(0)
     try:
-        image = Image.open(image_bytes)
-    except Exception:
-        image_bytes.seek(0)
-        return image_bytes
-
-    rotated_image = ImageOps.exif_transpose(image)
-    rotated_bytes = io.BytesIO()
-    rotated_image.save(rotated_bytes, mime_type.split("/")[1])
-    rotated_bytes.seek(0)
-    return rotated_bytes
+        with Image.open(file) as image:
+            display_width, display_height = _get_display_size(image)
+            return ImageMetadata(
+                width=image.width, height=image.height, display_width=display_width, display_height=display_height
+            )
+    except (UnidentifiedImageError, OSError):
+        return None
+    finally:
+        file.seek(0)
+
+
+def save_upright(file, mime_type: str, out) -> ImageMetadata | None:
+    """
+    Decode an image once, rotate it to its EXIF orientation and write it to out without its metadata.
+
+    Returns None, without writing anything, for files Pillow can't read.
+    """
+    file.seek(0)
+    try:
+        image = Image.open(file)
+    except UnidentifiedImageError:
+        file.seek(0)
+        return None
+    with image:
+        image_format = _get_save_format(image, mime_type)
+        ImageOps.exif_transpose(image, in_place=True)
+        # Only what's passed to save() is written, so the EXIF, and the location in it, is left out.
+        save_image(image, out, image_format)
+        return ImageMetadata(
+            width=image.width, height=image.height, display_width=image.width, display_height=image.height
+        )
+
+
+def _get_save_format(image: Image, mime_type: str) -> str:
+    # Saved in the format it was uploaded as, which Pillow may know by another name, e.g. MPO for iPhone photos.
+    extension = mimetypes.guess_extension(mime_type)
+    return Image.registered_extensions().get(extension or "", image.format)
 
 
 def convert_image_format(
     t_file: file_models.TFile, target_mime: str, longest_edge: int | None = None
 ) -> tuple[SimpleUploadedFile, int, int] | tuple[None, None, None]:
-    image = _get_image(t_file)
     file_extension = mimetypes.guess_extension(target_mime)
-    if not file_extension:
+    image_format = Image.registered_extensions().get(file_extension or "")
+    if not file_extension or not image_format:
         # unknown mimetype, can't convert
         return None, None, None
 
-    image = _get_rotated_image(image)
-
-    image, width, height = _get_maybe_resized_image_and_size(image, longest_edge)
-
-    new_format_data = _change_image_format(image, format=file_extension[1:])
+    new_format_data = io.BytesIO()
+    with _get_image(t_file) as image:
+        image = resize_image(image, longest_edge)
+        save_image(image, new_format_data, image_format)
 
-    new_image = Image.open(new_format_data)
     new_filename = t_file.filename.replace(Path(t_file.filename).suffix, file_extension)
-    new_format_data.seek(0)
+    upload_file = SimpleUploadedFile(new_filename, new_format_data.getvalue(), target_mime)
+
+    return upload_file, image.width, image.height
+
+
+def resize_image(image: Image.Image, longest_edge: int | None = None) -> Image.Image:
+    """
+    Rotate an opened image to its EXIF orientation and resize it to get_resized_size(), decoding no more than needed.
+
+    JPEGs are decoded scaled down by up to 8 times in draft mode, then reduced and resampled with RESAMPLE.
+    """
+    width, height = _get_display_size(image)
+    size = get_resized_size(width, height, longest_edge)
+    if size != (width, height):
+        # The draft is decoded before it's rotated.
+        draft_size = size[::-1] if _get_orientation(image) in QUARTER_TURNS else size
+        image.draft(None, (int(draft_size[0] * REDUCING_GAP), int(draft_size[1] * REDUCING_GAP)))
+    ImageOps.exif_transpose(image, in_place=True)
+    if image.size != size:
+        image = image.resize(size, RESAMPLE, reducing_gap=REDUCING_GAP)
+    return image
 
-    upload_file = SimpleUploadedFile(new_filename, new_format_data.read(), target_mime)
 
-    return upload_file, new_image.width, new_image.height
+def save_image(image: Image.Image, out, image_format: str) -> None:
+    """
+    Encode image to out with the SAVE_OPTIONS for image_format, keeping its colour profile.
+    """
+    options = dict(SAVE_OPTIONS.get(image_format, {}))
+    if icc_profile := image.info.get("icc_profile"):
+        options["icc_profile"] = icc_profile
+    image.save(out, format=image_format, **options)
 
 
 def _get_image(t_file: file_models.TFile) -> Image:
@@ -60,21 +137,38 @@ def _get_image(t_file: file_models.TFile) -> Image:
 
 
 def get_maybe_resized_size(t_file: file_models.TFile, longest_edge: int | None = None) -> tuple[int, int]:
-    image = _get_image(t_file)
-    image = _get_rotated_image(image)
-    # Would be great to refactor this to not rely on using .thumbnail() just for the size,
-    # as that requires us to actually resize the image just to get the final width/height.
-    _, width, height = _get_maybe_resized_image_and_size(image, longest_edge)
-    return width, height
+    if t_file.display_width and t_file.display_height:
+        return get_resized_size(t_file.display_width, t_file.display_height, longest_edge)
+    with _get_image(t_file) as image:
+        return get_resized_size(*_get_display_size(image), longest_edge)
 
 
-def _get_maybe_resized_image_and_size(image: Image, longest_edge: int | None = None) -> tuple[Image, int, int]:
+def get_resized_size(width: int, height: int, longest_edge: int | None = None) -> tuple[int, int]:
+    """
+    The size an image of width x height is resized to by resize_image, worked out without it.
+    """
     if longest_edge:
-        image = _get_thumbnail(image, longest_edge)
-    elif image.width >= 1200 or image.height >= 1200:
-        width, height = (math.floor(image.width * 0.75), math.floor(image.height * 0.75))
-        image = image.resize((width, height))
-    return image, image.width, image.height
+        return _get_thumbnail_size(width, height, longest_edge)
+    elif width >= 1200 or height >= 1200:
+        return math.floor(width * 0.75), math.floor(height * 0.75)
+    return width, height
+
+
+def _get_thumbnail_size(width: int, height: int, longest_edge: int) -> tuple[int, int]:
+    # The same as Image.thumbnail(), which made the copies already stored: it only shrinks, and keeps the aspect ratio
+    # rounding to the closest pixel.
+    if longest_edge >= width and longest_edge >= height:
+        return width, height
+
+    def round_aspect(number: float, key) -> int:
+        return max(min(math.floor(number), math.ceil(number), key=key), 1)
+
+    aspect = width / height
+    if aspect <= 1:
+        return round_aspect(longest_edge * aspect, key=lambda n: abs(aspect - n / longest_edge)), longest_edge
+    return longest_edge, round_aspect(
+        longest_edge / aspect, key=lambda n: 0 if n == 0 else abs(aspect - longest_edge / n)
+    )
 
 
 def _get_first_page_of_pdf_as_png(t_file: file_models.TFile) -> io.BytesIO:
@@ -90,53 +184,15 @@ def _get_first_page_of_pdf_as_png(t_file: file_models.TFile) -> io.BytesIO:
             raise ValueError("No pages in the PDF")
 
 
-def _get_thumbnail(image: Image, longest_edge: int) -> Image:
-    image = image.copy()
-    # thumbnail resizes in place. resize returns a new image instance
-    image.thumbnail((longest_edge, longest_edge))
-    return image
-
-
-def _change_image_format(image: Image, format: str) -> io.BytesIO:
-    new_image_data = io.BytesIO()
-
-    if format == "jpg":
-        # .jpg fails but jpeg works ¯\_(ツ)_/¯
-        format = "jpeg"
-    image.save(new_image_data, format=format)
-    new_image_data.seek(0)
-    return new_image_data
+def _get_display_size(image: Image.Image) -> tuple[int, int]:
+    if _get_orientation(image) in QUARTER_TURNS:
+        return image.height, image.width
+    return image.width, image.height
 
 
-def _get_rotated_image(image: Image) -> Image:
-    orientation = 274
-    try:
-        exif = image._getexif()
-    except (AttributeError, KeyError):
-        # There is AttributeError: _getexif sometimes.
-        pass
-    else:
-        if exif:
-            try:
-                return _maybe_rotate_image(image, exif, orientation)
-            except KeyError:
-                pass
-    return image
-
-
-def _maybe_rotate_image(
-    image: Image,
-    exif: dict,
-    orientation: int,
-) -> Image:
-    exif = dict(exif.items())
-    if exif[orientation] == 3:
-        image = image.rotate(180, expand=True)
-    elif exif[orientation] == 6:
-        image = image.rotate(270, expand=True)
-    elif exif[orientation] == 8:
-        image = image.rotate(90, expand=True)
-    return image
+def _get_orientation(image: Image.Image) -> int | None:
+    # Read from the header the same way as ImageOps.exif_transpose, so images are sized the way they're rotated.
+    return image.getexif().get(ORIENTATION)
 
 
 def bytes_as_upload_image(
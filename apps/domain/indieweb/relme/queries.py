@@ -5,4 +5,4 @@ from data.indieweb import models
 
 def get_relme() -> Iterable[models.TRelMe]:
     """Get all relme records"""
-    return models.TRelMe.objects.all()
+    return models.TRelMe.objects.cached()
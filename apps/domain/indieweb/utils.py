@@ -16,9 +16,9 @@ from mf2util import (
     interpret_entry,
     parse_author,
 )
-from PIL import Image
 
 from data.files.models import TFile
+from domain.files import queries as file_queries
 from domain.images.images import bytes_as_upload_image
 from interfaces.public.files.forms import MediaUploadForm
 
@@ -153,22 +153,22 @@ def render_attachment(request, attachment: TFile) -> str:
     """
     Render an attachment to be inserted into a trix editor
     """
-    img = Image.open(attachment.file)
+    size = file_queries.get_size_for_file(attachment)
     img_src = request.build_absolute_uri(attachment.get_absolute_url())
     context = {
         "mime": attachment.mime_type,
         "src": img_src,
-        "width": img.width,
-        "height": img.height,
+        "width": size.width,
+        "height": size.height,
         "trix_attachment_data": json.dumps(
             {
                 "contentType": attachment.mime_type,
                 "filename": attachment.filename,
                 "filesize": attachment.file.size,
-                "height": img.height,
+                "height": size.height,
                 "href": f"{img_src}?content-disposition=attachment",
                 "url": img_src,
-                "width": img.width,
+                "width": size.width,
             }
         ),
     }
@@ -7,8 +7,8 @@ def get_t_post_by_uuid(uuid: str) -> models.TPost:
 
 
 def get_post_status(status: MPostStatuses) -> models.MPostStatus:
-    return models.MPostStatus.objects.get(key=status)
+    return models.MPostStatus.objects.get_by_key(status)
 
 
 def get_post_kind(kind: MPostKinds) -> models.MPostKind:
-    return models.MPostKind.objects.get(key=kind)
+    return models.MPostKind.objects.get_by_key(kind)
@@ -19,17 +19,17 @@ def get_public_posts_for_user(
     user_id = user.id if user else None
     posts = post_models.TPost.objects.visible_for_user(user_id=user_id)
     if stream:
-        posts = posts.filter(streams=stream, m_post_status__key=MPostStatuses.published)
-    else:
-        posts = posts.filter(m_post_status__key=MPostStatuses.published)
+        posts = posts.filter(streams=stream)
+    posts = posts.filter(m_post_status_id=post_models.MPostStatus.objects.id_for_key(MPostStatuses.published))
     if kinds:
-        posts = posts.filter(m_post_kind__key__in=kinds)
+        posts = posts.filter(m_post_kind_id__in=post_models.MPostKind.objects.ids_for_keys(kinds))
     return (
         posts.exclude(visibility=Visibility.UNLISTED)
-        .select_related("ref_t_entry")
+        .select_related("ref_t_entry", "p_author")
         .prefetch_related(
             "ref_t_entry",
             "ref_t_entry__t_reply",
+            "ref_t_entry__t_bookmark",
             "ref_t_entry__t_location",
             "ref_t_entry__t_checkin",
         )
@@ -53,10 +53,9 @@ def is_published(post_id: int) -> bool:
     """
     Return if the post is published.
     """
-    return (
-        post_models.TPost.objects.filter(id=post_id).values_list("m_post_status__key", flat=True).first()
-        == MPostStatuses.published
-    )
+    return post_models.TPost.objects.filter(id=post_id).values_list(
+        "m_post_status_id", flat=True
+    ).first() == post_models.MPostStatus.objects.id_for_key(MPostStatuses.published)
 
 
 def determine_published_at(post: post_models.TPost, occurred_at: datetime.datetime) -> datetime.datetime | None:
@@ -15,8 +15,10 @@ def get_theme_choices() -> list[list[str]]:
 def get_site_settings() -> settings_models.MSiteSettings:
     """
     Get user configurable site settings.
+
+    They are cached per process, see MSiteSettingsManager.
     """
-    return settings_models.MSiteSettings.objects.first() or settings_models.MSiteSettings()
+    return settings_models.MSiteSettings.objects.get_current()
 
 
 def get_active_trip() -> trip_models.TTrip | None:
@@ -8,7 +8,7 @@ class SunbottleClientError(Exception):
 
 class SunbottleClient:
     """
-    A client for interacting with Strava.
+    A client for interacting with Sunbottle.
     """
 
     auth_token: str
@@ -17,9 +17,12 @@ class SunbottleClient:
         super().__init__()
         self.auth_token = auth_token or ""
 
-    def get_generation(self) -> list[dict]:
+    def get_generation(self) -> dict:
         summary_url = f"{settings.SUNBOTTLE_API_URL}generation_summary"
-        response = requests.get(summary_url, headers=self._get_headers())
+        try:
+            response = requests.get(summary_url, headers=self._get_headers(), timeout=settings.SUNBOTTLE_TIMEOUT)
+        except requests.RequestException as e:
+            raise SunbottleClientError() from e
         if response.status_code == 200:
             return response.json()
         raise SunbottleClientError()
@@ -1,15 +1,106 @@
-import functools
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from datetime import timezone as dt_timezone
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
 
 from domain.sunbottle import client as sunbottle_client
 
+logger = logging.getLogger(__name__)
+
+GENERATION_KEY = "sunbottle:generation"
+# Held while a worker fetches the generation, so the others keep serving the old one.
+REFRESH_LOCK_KEY = "sunbottle:refreshing"
+FAILURES_KEY = "sunbottle:failures"
+# Set while requests are stopped after repeated failures.
+CIRCUIT_OPEN_KEY = "sunbottle:circuit_open"
+
+
+@dataclass
+class Generation:
+    value: dict
+    fetched_at: float
+
+    @property
+    def is_stale(self) -> bool:
+        return time.time() - self.fetched_at > settings.SUNBOTTLE_CACHE_TIMEOUT
+
 
-@functools.lru_cache(maxsize=2)
-def get_generation(hour: int):
+def get_generation() -> dict:
     """
     Get the total generation from the configured Sunbottle instance.
+
+    The last generation fetched is kept in the cache shared by every worker. Once it's older than
+    SUNBOTTLE_CACHE_TIMEOUT it's still returned, and fetched again in the background. Only when there is none yet does
+    the caller wait, for up to SUNBOTTLE_TIMEOUT seconds.
+    """
+    generation = cache.get(GENERATION_KEY)
+    if generation is None:
+        generation = refresh_generation()
+        return generation.value if generation else {}
+    if generation.is_stale:
+        _refresh_in_background()
+    return generation.value
+
+
+def get_fetched_at() -> datetime | None:
+    """
+    Get when the generation returned by get_generation() was fetched.
     """
-    client = sunbottle_client.get_client()
+    generation = cache.get(GENERATION_KEY)
+    if generation is None:
+        return None
+    return datetime.fromtimestamp(generation.fetched_at, tz=dt_timezone.utc)
+
+
+def refresh_generation() -> Generation | None:
+    """
+    Fetch the generation and store it, unless requests are stopped after repeated failures.
+    """
+    if cache.get(CIRCUIT_OPEN_KEY):
+        return None
     try:
-        return client.get_generation()
+        value = sunbottle_client.get_client().get_generation()
     except sunbottle_client.SunbottleClientError:
-        return {}
+        logger.warning("Error fetching the Sunbottle generation", exc_info=True)
+        _record_failure()
+        return None
+    cache.delete(FAILURES_KEY)
+    generation = Generation(value=value, fetched_at=time.time())
+    cache.set(GENERATION_KEY, generation, timeout=None)
+    return generation
+
+
+def _record_failure() -> None:
+    cache.add(FAILURES_KEY, 0, timeout=None)
+    try:
+        failures = cache.incr(FAILURES_KEY)
+    except ValueError:
+        # A request succeeded in the meantime.
+        return
+    # The count is kept until a request succeeds, so a single failure after a pause stops them again.
+    if failures >= settings.SUNBOTTLE_FAILURE_THRESHOLD:
+        cache.set(CIRCUIT_OPEN_KEY, True, timeout=settings.SUNBOTTLE_RETRY_AFTER)
+
+
+def _refresh_in_background() -> threading.Thread | None:
+    # The lock expires on its own, should the worker holding it die.
+    if not cache.add(REFRESH_LOCK_KEY, True, timeout=int(settings.SUNBOTTLE_TIMEOUT) + 5):
+        return None
+
+    def refresh():
+        try:
+            refresh_generation()
+        finally:
+            cache.delete(REFRESH_LOCK_KEY)
+            # The cache may be backed by the database.
+            connections.close_all()
+
+    thread = threading.Thread(target=refresh, name="sunbottle-refresh", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,125 @@
+import html
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import QuerySet
+from django.utils.html import strip_tags
+
+from core import page_cache
+from data.entry import models as entry_models
+from data.indieweb.constants import MPostStatuses
+from data.post import models as post_models
+from data.timeline import models as timeline_models
+
+
+def refresh_timeline(post_id: int, index: bool = True) -> timeline_models.TTimeline | None:
+    """
+    Create, update or remove the timeline row for a post so it matches the post.
+
+    Only published posts are on the timeline. With index=False the row isn't indexed for search, see
+    rebuild_timeline_search().
+
+    The pages listing the timeline are purged, which also tells their validators that it changed.
+    """
+    page_cache.purge(page_cache.TIMELINE)
+    try:
+        t_post = _get_posts().get(pk=post_id)
+        t_entry = t_post.ref_t_entry
+    except (post_models.TPost.DoesNotExist, entry_models.TEntry.DoesNotExist):
+        timeline_models.TTimeline.objects.filter(t_post_id=post_id).delete()
+        return None
+
+    if t_post.m_post_status.key != MPostStatuses.published or t_post.dt_published is None:
+        timeline_models.TTimeline.objects.filter(t_post_id=post_id).delete()
+        return None
+
+    t_timeline, _ = timeline_models.TTimeline.objects.update_or_create(
+        t_post=t_post,
+        defaults={
+            "t_entry": t_entry,
+            "m_post_kind_key": t_post.m_post_kind.key,
+            "m_post_status_key": t_post.m_post_status.key,
+            "visibility": t_post.visibility,
+            "p_author_id": t_post.p_author_id,
+            "dt_published": t_post.dt_published,
+            "post_title": t_post.post_title[:512],
+            "p_summary": t_entry.p_summary,
+            "location_summary": _get_location_summary(t_entry),
+            "interaction_count": t_post.interaction_count,
+        },
+    )
+    if index:
+        _index_for_search(t_post)
+    return t_timeline
+
+
+def rebuild_timeline(index: bool = True) -> int:
+    """
+    Rebuild the timeline row for every post.
+
+    Returns the number of posts on the timeline.
+    """
+    refreshed = [
+        refresh_timeline(post_id, index=index) for post_id in post_models.TPost.objects.values_list("pk", flat=True)
+    ]
+    return len([t_timeline for t_timeline in refreshed if t_timeline])
+
+
+def rebuild_timeline_search() -> int:
+    """
+    Index every post on the timeline for search.
+
+    Returns the number of posts indexed.
+    """
+    count = 0
+    for t_post in _get_posts().filter(ref_t_timeline__isnull=False).iterator(chunk_size=100):
+        _index_for_search(t_post)
+        count += 1
+    return count
+
+
+def _get_posts() -> QuerySet[post_models.TPost]:
+    return post_models.TPost.objects.select_related(
+        "ref_t_entry",
+        "ref_t_entry__t_location",
+        "ref_t_entry__t_bookmark",
+        "ref_t_entry__t_reply",
+        "ref_t_entry__t_checkin",
+    )
+
+
+def _index_for_search(t_post: post_models.TPost) -> None:
+    t_entry = t_post.ref_t_entry
+    timeline_models.TTimelineSearch.objects.index(
+        t_post.pk,
+        title=t_entry.p_name,
+        summary=t_entry.p_summary,
+        # Index the text readers see, not the markup.
+        content=html.unescape(strip_tags(t_entry.e_content)),
+        tags=" ".join(t_post.tags.names()),
+        metadata=_get_search_metadata(t_entry),
+    )
+
+
+def _get_location_summary(t_entry: entry_models.TEntry) -> str:
+    try:
+        return t_entry.t_location.summary
+    except entry_models.TLocation.DoesNotExist:
+        return ""
+
+
+def _get_search_metadata(t_entry: entry_models.TEntry) -> str:
+    """
+    Get the text of what the entry refers to: the place, a checkin, or the page it bookmarks or replies to.
+    """
+    parts = [_get_location_summary(t_entry)]
+    for relation, fields in (
+        ("t_checkin", ["name"]),
+        ("t_bookmark", ["title", "quote", "author"]),
+        ("t_reply", ["title", "quote", "author"]),
+    ):
+        try:
+            related = getattr(t_entry, relation)
+        except ObjectDoesNotExist:
+            continue
+        parts.extend(getattr(related, field) for field in fields)
+    return "\n".join(part for part in parts if part)
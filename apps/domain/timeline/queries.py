@@ -0,0 +1,122 @@
+import datetime
+import re
+from collections.abc import Iterable
+
+from django.contrib.auth import models as auth_models
+from django.db.models import Exists, F, OuterRef, QuerySet
+from django.utils.html import escape
+from django.utils.safestring import SafeString, mark_safe
+
+from core.constants import Visibility
+from core.db import fts
+from data.entry import models as entry_models
+from data.indieweb.constants import MPostKinds
+from data.streams import models as stream_models
+from data.timeline import models as timeline_models
+
+# Unique, so it can be used as a pagination cursor.
+TIMELINE_ORDERING = ("-dt_published", "-t_post_id")
+# Best match first, see search_timeline.
+SEARCH_ORDERING = ("search_rank", "t_post_id")
+
+# A "quoted phrase" or a single word, optionally ending in * to match it as a prefix.
+_SEARCH_TERM = re.compile(r'"([^"]*)"(\*?)|([^\s"]+)')
+
+
+def get_timeline_for_user(
+    user: auth_models.User | auth_models.AnonymousUser | None,
+    stream: stream_models.MStream | None = None,
+    author_username: str | None = None,
+    kinds: list[MPostKinds] | None = None,
+) -> QuerySet[timeline_models.TTimeline]:
+    """
+    Get the listed posts visible to a user in reverse chronological order.
+    """
+    user_id = user.id if user else None
+    qs = timeline_models.TTimeline.objects.visible_for_user(user_id).exclude(visibility=Visibility.UNLISTED)
+    if stream:
+        # EXISTS lets the timeline be read in published order instead of sorting every post in the stream.
+        qs = qs.filter(Exists(stream_models.TStreamPost.objects.filter(m_stream=stream, t_post=OuterRef("pk"))))
+    if author_username:
+        qs = qs.filter(p_author__username=author_username)
+    if kinds:
+        qs = qs.filter(m_post_kind_key__in=kinds)
+    return qs.order_by(*TIMELINE_ORDERING)
+
+
+def get_last_modified(qs: QuerySet[timeline_models.TTimeline]) -> datetime.datetime | None:
+    """
+    Get when the timeline last changed by itself: the publication of its newest post, which may have been scheduled.
+
+    Rows which were refreshed or removed aren't covered. refresh_timeline() purges the TIMELINE tag instead, whose
+    version says when, so this only reads the newest row through the index on dt_published.
+    """
+    return qs.order_by("-dt_published").values_list("dt_published", flat=True).first()
+
+
+def search_timeline(qs: QuerySet[timeline_models.TTimeline], query: str) -> QuerySet[timeline_models.TTimeline]:
+    """
+    Filter a timeline to the entries matching a search, ordered by relevance.
+
+    Each row gets a search_rank to paginate on and a search_snippet of the text that matched.
+    """
+    match = to_match_query(query)
+    qs = qs.annotate(
+        search_rank=F("ref_t_timeline_search__rank"),
+        search_snippet=fts.Snippet("ref_t_timeline_search__document"),
+    )
+    if not match:
+        return qs.none()
+    return qs.filter(ref_t_timeline_search__document__match=match).order_by(*SEARCH_ORDERING)
+
+
+def to_match_query(query: str) -> str:
+    """
+    Convert a search box query into an FTS5 query that matches entries containing every term.
+
+    "Quoted phrases" are matched as phrases and terms ending in * as prefixes. Everything else is quoted, so
+    punctuation and FTS5 operators in the query can't cause a syntax error.
+    """
+    terms = []
+    for phrase, phrase_prefix, word in _SEARCH_TERM.findall(query):
+        if word:
+            prefix = "*" if word.endswith("*") else ""
+            phrase, phrase_prefix = word.rstrip("*"), prefix
+        if phrase.strip():
+            terms.append(f'"{phrase}"{phrase_prefix}')
+    return " ".join(terms)
+
+
+def highlight_snippet(snippet: str) -> SafeString:
+    """
+    Escape a search snippet and mark the matched terms.
+    """
+    return mark_safe(escape(snippet).replace(fts.SNIPPET_START, "<mark>").replace(fts.SNIPPET_END, "</mark>"))
+
+
+def get_entries_for_timeline(t_timelines: Iterable[timeline_models.TTimeline]) -> list[entry_models.TEntry]:
+    """
+    Load the entries for a page of the timeline, in timeline order, ready for rendering.
+    """
+    t_timelines = list(t_timelines)
+    entries = (
+        entry_models.TEntry.objects.select_related(
+            "t_post",
+            "t_post__p_author",
+            "t_location",
+            "t_bookmark",
+            "t_reply",
+            "t_checkin",
+        )
+        # Linked from each item's footer.
+        .prefetch_related("bridgy_publish_url").in_bulk([t_timeline.t_entry_id for t_timeline in t_timelines])
+    )
+
+    page = []
+    for t_timeline in t_timelines:
+        t_entry = entries[t_timeline.t_entry_id]
+        t_entry.interaction_count = t_timeline.interaction_count
+        if getattr(t_timeline, "search_snippet", None):
+            t_entry.search_snippet = highlight_snippet(t_timeline.search_snippet)
+        page.append(t_entry)
+    return page
@@ -0,0 +1,107 @@
+import io
+import multiprocessing
+import resource
+import sys
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+from PIL import Image, ImageOps
+
+from domain.images import images as image_ops
+
+
+class Command(BaseCommand):
+    help = "Compare the time and peak memory per megapixel of resizing images with draft mode against a full decode"
+
+    def add_arguments(self, parser):
+        parser.add_argument("paths", nargs="*", help="Images to resize, instead of generated JPEGs")
+        parser.add_argument(
+            "--megapixels", type=int, nargs="+", default=[2, 12, 24, 48], help="Sizes of the generated JPEGs"
+        )
+        parser.add_argument("--longest-edge", type=int, default=800)
+        parser.add_argument("--format", default="WEBP", help="The Pillow format to encode to")
+        parser.add_argument("--repeat", type=int, default=3, help="Runs of each, of which the fastest is shown")
+
+    def handle(self, *args, **options):
+        if options["paths"]:
+            images = [(Path(path).name, Path(path).read_bytes()) for path in options["paths"]]
+        else:
+            images = [(f"{megapixels}MP.jpg", _make_jpeg(megapixels)) for megapixels in options["megapixels"]]
+
+        self.stdout.write(f"{'image':<16}{'path':<14}{'seconds':>10}{'s/MP':>10}{'peak MB':>10}{'MB/MP':>10}")
+        for name, data in images:
+            with Image.open(io.BytesIO(data)) as image:
+                megapixels = image.width * image.height / 1_000_000
+            for path, resize in (("full decode", _resize_with_full_decode), ("draft", _resize_with_draft)):
+                runs = [
+                    _measure(resize, data, options["format"], options["longest_edge"]) for _ in range(options["repeat"])
+                ]
+                seconds = min(seconds for seconds, _ in runs)
+                peak = max(peak for _, peak in runs) / 1024 / 1024
+                self.stdout.write(
+                    f"{name:<16}{path:<14}{seconds:>10.3f}{seconds / megapixels:>10.4f}"
+                    f"{peak:>10.1f}{peak / megapixels:>10.2f}"
+                )
+
+
+def _resize_with_full_decode(data: bytes, image_format: str, longest_edge: int) -> bytes:
+    # How copies were made before resize_image: decoded in full, rotated, then shrunk and encoded with the defaults.
+    image = ImageOps.exif_transpose(Image.open(io.BytesIO(data)))
+    image = image.copy()
+    image.thumbnail((longest_edge, longest_edge))
+    out = io.BytesIO()
+    image.save(out, format=image_format)
+    return out.getvalue()
+
+
+def _resize_with_draft(data: bytes, image_format: str, longest_edge: int) -> bytes:
+    out = io.BytesIO()
+    with Image.open(io.BytesIO(data)) as image:
+        image_ops.save_image(image_ops.resize_image(image, longest_edge), out, image_format)
+    return out.getvalue()
+
+
+def _measure(resize, data: bytes, image_format: str, longest_edge: int) -> tuple[float, int]:
+    """
+    Run resize in a forked process, so its peak memory isn't hidden by what this process has already used, and return
+    how long it took and how many bytes its peak resident memory grew by.
+    """
+    context = multiprocessing.get_context("fork")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=_run, args=(sender, resize, data, image_format, longest_edge))
+    process.start()
+    result = receiver.recv()
+    process.join()
+    return result
+
+
+def _run(sender, resize, data: bytes, image_format: str, longest_edge: int) -> None:
+    before = _get_peak_memory()
+    start = time.perf_counter()
+    resize(data, image_format, longest_edge)
+    seconds = time.perf_counter() - start
+    sender.send((seconds, _get_peak_memory() - before))
+
+
+def _get_peak_memory() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _make_jpeg(megapixels: int) -> bytes:
+    # A photo sized 4:3 with enough detail to take a photo's time to decode.
+    height = int((megapixels * 1_000_000 * 3 / 4) ** 0.5)
+    size = (height * 4 // 3, height)
+    image = Image.merge(
+        "RGB",
+        [
+            Image.effect_noise(size, 48),
+            Image.linear_gradient("L").resize(size),
+            Image.radial_gradient("L").resize(size),
+        ],
+    )
+    data = io.BytesIO()
+    image.save(data, format="jpeg", quality=90)
+    return data.getvalue()
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from data.files import models as file_models
+from domain.files import operations as file_ops
+
+
+class Command(BaseCommand):
+    help = "Create the resized and converted copies in MEDIA_DERIVATIVES missing from uploaded images"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--regenerate",
+            action="store_true",
+            help="Delete every existing copy first, e.g. after changing how they're made",
+        )
+
+    def handle(self, *args, **options):
+        if options["regenerate"]:
+            deleted = 0
+            for t_formatted_image in file_models.TFormattedImage.objects.iterator():
+                # Delete one at a time so the stored files are deleted too.
+                t_formatted_image.delete()
+                deleted += 1
+            self.stdout.write(f"Deleted {deleted} existing copies")
+
+        created = 0
+        for t_file in file_models.TFile.objects.order_by("-pk").iterator():
+            try:
+                created += file_ops.create_derivatives(t_file)
+            except Exception as e:
+                self.stderr.write(f"Unable to process {t_file.uuid} ({t_file.filename}): {e}")
+        self.stdout.write(self.style.SUCCESS(f"Created {created} copies"))
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from data.post import models as post_models
+from domain.timeline import operations as timeline_ops
+
+
+class Command(BaseCommand):
+    help = "Recount the approved webmentions on every post"
+
+    def handle(self, *args, **options):
+        count = 0
+        for t_post in post_models.TPost.objects.iterator():
+            with transaction.atomic():
+                t_post.update_interaction_counts()
+                timeline_ops.refresh_timeline(t_post.pk)
+            count += 1
+        self.stdout.write(self.style.SUCCESS(f"Recounted interactions on {count} posts"))
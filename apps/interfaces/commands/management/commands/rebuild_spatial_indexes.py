@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from domain.gis import operations as gis_ops
+
+
+class Command(BaseCommand):
+    help = "Create or rebuild the spatial indexes used by geo searches"
+
+    def handle(self, *args, **options):
+        rebuilt = gis_ops.rebuild_spatial_indexes()
+        for index in rebuilt:
+            self.stdout.write(f"Rebuilt spatial index on {index}")
+        self.stdout.write(self.style.SUCCESS(f"{len(rebuilt)} spatial indexes rebuilt"))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from domain.timeline import operations as timeline_ops
+
+
+class Command(BaseCommand):
+    help = "Rebuild the timeline used by the public list pages"
+
+    def handle(self, *args, **options):
+        count = timeline_ops.rebuild_timeline()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt timeline with {count} posts"))
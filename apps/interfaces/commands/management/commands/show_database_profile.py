@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+
+class Command(BaseCommand):
+    help = "Show the effective SQLite connection settings for each database"
+
+    def handle(self, *args, **options):
+        for alias in connections:
+            connection = connections[alias]
+            if not hasattr(connection, "effective_pragmas"):
+                continue
+            self.stdout.write(self.style.MIGRATE_HEADING(alias))
+            for name, value in connection.effective_pragmas().items():
+                self.stdout.write(f"  {name}: {value}")
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from data.files import models as file_models
+from domain.files import operations as file_ops
+
+
+class Command(BaseCommand):
+    help = "Store the size, byte size and content hash of files uploaded before they were stored"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--all", action="store_true", help="Read every file again, not only those missing them")
+
+    def handle(self, *args, **options):
+        t_files = file_models.TFile.objects.all()
+        if not options["all"]:
+            t_files = t_files.filter(byte_size__isnull=True)
+        count = 0
+        for t_file in t_files.iterator():
+            try:
+                file_ops.update_metadata(t_file)
+            except OSError as e:
+                self.stderr.write(f"Unable to read {t_file.uuid} ({t_file.filename}): {e}")
+                continue
+            count += 1
+        self.stdout.write(self.style.SUCCESS(f"Updated the metadata of {count} files"))
@@ -0,0 +1,12 @@
+from django.utils.functional import SimpleLazyObject
+
+from data.streams.models import MStream
+
+
+def navigation(request) -> dict:
+    """
+    The navigation shown on every public page.
+
+    It's loaded from a per-process cache only when a template uses it, so the chrome of a page costs no queries.
+    """
+    return {"streams": SimpleLazyObject(lambda: MStream.objects.navigation(request.user))}
@@ -0,0 +1,25 @@
+from core.db import routers
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class ReadOnlyDatabaseMiddleware:
+    """
+    Read from the read-only database connection while handling public, read-only requests.
+
+    Writes, such as creating a resized image, still go to the writer.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        try:
+            return self.get_response(request)
+        finally:
+            routers.set_read_only(False)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if request.method in SAFE_METHODS and "public" in request.resolver_match.namespaces:
+            routers.set_read_only(True)
+        return None
@@ -0,0 +1,14 @@
+from django.middleware import gzip
+
+
+class GZipMiddleware(gzip.GZipMiddleware):
+    """
+    Compress responses, except those served in byte ranges.
+
+    Media is already compressed, and the ranges a client asks for are offsets into the file, not into a gzip stream.
+    """
+
+    def process_response(self, request, response):
+        if response.has_header("Accept-Ranges"):
+            return response
+        return super().process_response(request, response)
@@ -0,0 +1,45 @@
+import logging
+
+from django.conf import settings
+
+from core.db import instrumentation
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetMiddleware:
+    """
+    Record the queries each request makes.
+
+    Requests that run more queries than DB_QUERY_BUDGET, or the same statement more than DB_QUERY_REPEAT_BUDGET
+    times, are logged. Staff see the totals, and how many template fragments came from the cache, in a Server-Timing
+    header in their browser's developer tools.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with instrumentation.record_queries() as recorder:
+            response = self.get_response(request)
+
+        problems = recorder.over_budget(settings.DB_QUERY_BUDGET, settings.DB_QUERY_REPEAT_BUDGET)
+        if problems:
+            view_name = getattr(request.resolver_match, "view_name", None) or request.path
+            logger.warning("%s exceeded its query budget: %s", view_name, "; ".join(problems))
+
+        user = getattr(request, "user", None)
+        if user is not None and user.is_staff:
+            add_server_timing(response, recorder.server_timing())
+            fragment_stats = getattr(request, "fragment_stats", None)
+            if fragment_stats is not None:
+                add_server_timing(response, fragment_stats.server_timing())
+        return response
+
+
+def add_server_timing(response, metric: str) -> None:
+    """
+    Add a metric to the response's Server-Timing header.
+    """
+    existing = response.get("Server-Timing")
+    response["Server-Timing"] = f"{existing}, {metric}" if existing else metric
@@ -1,3 +1,5 @@
+from django.utils.functional import SimpleLazyObject
+
 from domain.settings import queries
 
 
@@ -11,7 +13,8 @@ class SettingsMiddleware:
     def __call__(self, request):
         # Code to be executed for each request before
         # the view (and later middleware) are called.
-        request.settings = queries.get_site_settings()
+        # Only loaded when used, so media and other requests that don't need them skip it.
+        request.settings = SimpleLazyObject(queries.get_site_settings)
         response = self.get_response(request)
 
         # Code to be executed for each request/response after
@@ -1,8 +1,19 @@
 from django import template
 from django.urls import reverse
+from django.utils.safestring import mark_safe
+
+from core import page_cache
+from data.indieweb.constants import MPostKinds
 
 register = template.Library()
 
+# The related object each kind's item template expects, by kind.
+ITEM_RELATIONS = {
+    MPostKinds.reply: "t_reply",
+    MPostKinds.bookmark: "t_bookmark",
+    MPostKinds.checkin: "t_checkin",
+}
+
 
 @register.simple_tag(takes_context=True)
 def abs_url(context, view_name, *args, **kwargs):
@@ -12,3 +23,43 @@ def abs_url(context, view_name, *args, **kwargs):
 @register.filter
 def as_abs_url(path, request):
     return request.build_absolute_uri(path)
+
+
+@register.simple_tag(takes_context=True)
+def entry_item(context, t_entry):
+    """
+    Render an entry as a list item with the template for its kind.
+
+    The rendered item is cached and reused by every page listing the entry until the entry or its webmentions change.
+    """
+    t_post = t_entry.t_post
+    kind = t_post.m_post_kind.key
+    request = context["request"]
+    now = context.get("now")
+    interaction_count = getattr(t_entry, "interaction_count", None)
+
+    def render() -> str:
+        item_context = {"t_entry": t_entry, "t_post": t_post}
+        if kind in ITEM_RELATIONS:
+            item_context[ITEM_RELATIONS[kind]] = getattr(t_entry, ITEM_RELATIONS[kind])
+        with context.push(**item_context):
+            return context.template.engine.get_template(f"public/entry/{kind}_item.html").render(context)
+
+    fragment = page_cache.cached_fragment(
+        request,
+        tags=[page_cache.post_tag(t_post.uuid)],
+        parts=[
+            "entry_item",
+            str(t_entry.pk),
+            t_entry.updated_at.isoformat(),
+            t_post.updated_at.isoformat(),
+            str(interaction_count),
+            # Items show an edit link to logged in users and use absolute urls.
+            str(request.user.is_authenticated),
+            request.get_host(),
+            # Only a post's detail page passes now, to show relative times for posts published today.
+            now.date().isoformat() if now else "",
+        ],
+        render=render,
+    )
+    return mark_safe(fragment)
@@ -0,0 +1,46 @@
+import hashlib
+
+from django.core.files.uploadhandler import (
+    MemoryFileUploadHandler,
+    TemporaryFileUploadHandler,
+)
+
+
+class HashingMemoryFileUploadHandler(MemoryFileUploadHandler):
+    """
+    Keep small uploads in memory, with the md5 of their content as content_hash.
+    """
+
+    def new_file(self, *args, **kwargs):
+        self.md5 = hashlib.md5()
+        super().new_file(*args, **kwargs)
+
+    def receive_data_chunk(self, raw_data, start):
+        if self.activated:
+            self.md5.update(raw_data)
+        return super().receive_data_chunk(raw_data, start)
+
+    def file_complete(self, file_size):
+        file = super().file_complete(file_size)
+        if file is not None:
+            file.content_hash = self.md5.hexdigest()
+        return file
+
+
+class HashingTemporaryFileUploadHandler(TemporaryFileUploadHandler):
+    """
+    Stream larger uploads to a temporary file, hashing them as they're written, so they needn't be read again.
+    """
+
+    def new_file(self, *args, **kwargs):
+        self.md5 = hashlib.md5()
+        super().new_file(*args, **kwargs)
+
+    def receive_data_chunk(self, raw_data, start):
+        self.md5.update(raw_data)
+        return super().receive_data_chunk(raw_data, start)
+
+    def file_complete(self, file_size):
+        file = super().file_complete(file_size)
+        file.content_hash = self.md5.hexdigest()
+        return file
@@ -0,0 +1,26 @@
+from django.http import Http404
+from django.views.generic import ListView
+
+from core.pagination import CursorPaginator, InvalidCursor
+from domain.timeline import queries as timeline_queries
+
+
+class TimelineListView(ListView):
+    """
+    List entries by paginating a timeline queryset with a cursor.
+
+    Only the entries on the current page are loaded, so the cost of a page doesn't depend on the size of the archive
+    or how far into it the reader is.
+    """
+
+    cursor_kwarg = "cursor"
+    ordering = timeline_queries.TIMELINE_ORDERING
+
+    def paginate_queryset(self, queryset, page_size):
+        paginator = CursorPaginator(queryset, page_size, ordering=self.get_ordering())
+        try:
+            page = paginator.page(self.request.GET.get(self.cursor_kwarg))
+        except InvalidCursor as e:
+            raise Http404(str(e)) from e
+        page.object_list = timeline_queries.get_entries_for_timeline(page.object_list)
+        return paginator, page, page.object_list, page.has_other_pages()
@@ -72,7 +72,7 @@ class CreateStatusForm(forms.ModelForm):
 
     def clean(self):
         try:
-            self.cleaned_data["m_post_kind"] = post_models.MPostKind.objects.get(key=self.m_post_kind)
+            self.cleaned_data["m_post_kind"] = post_models.MPostKind.objects.get_by_key(self.m_post_kind)
         except post_models.MPostKind.DoesNotExist:
             raise forms.ValidationError(f"m_post_kind: {self.m_post_kind} does not exist")
 
@@ -125,7 +125,9 @@ class UpdateEntryView(UpdateView):
     original_content = ""
 
     def get_queryset(self):
-        return models.TEntry.objects.select_related("t_post").filter(t_post__m_post_kind__key=self.m_post_kind)
+        return models.TEntry.objects.select_related("t_post").filter(
+            t_post__m_post_kind_id=post_models.MPostKind.objects.id_for_key(self.m_post_kind)
+        )
 
     def get_object(self, queryset=None):
         obj = super().get_object(queryset=queryset)
@@ -594,7 +596,7 @@ def status_detail(request, pk: int):
 def status_delete(request, pk: int):
     status = get_object_or_404(models.TEntry.objects, pk=pk)
     webmentions.send_webmention(request, status.t_post, status.e_content)
-    status.delete()
+    entry_app.delete_entry(status)
     # TODO: Should we also delete the t_post ?
     messages.success(request, "Status Deleted")
     return redirect(resolve_url("posts"))
@@ -616,8 +618,6 @@ class TEntryListView(ListView):
     def get_queryset(self):
         qs = models.TEntry.objects.all().select_related(
             "t_post",
-            "t_post__m_post_status",
-            "t_post__m_post_kind",
             "t_post__p_author",
             "t_location",
             "t_bookmark",
@@ -643,7 +643,7 @@ class TEntryListView(ListView):
 def article_delete(request, pk: int):
     status = get_object_or_404(models.TEntry.objects, pk=pk)
     webmentions.send_webmention(request, status.t_post, status.e_content)
-    status.delete()
+    entry_app.delete_entry(status)
     # TODO: Should we also delete the t_post ?
     messages.success(request, "Article Deleted")
     return redirect(resolve_url("posts"))
@@ -651,7 +651,7 @@ def article_delete(request, pk: int):
 
 @login_required
 def edit_post(request, pk: int):
-    t_entry = get_object_or_404(models.TEntry.objects.select_related("t_post", "t_post__m_post_kind"), pk=pk)
+    t_entry = get_object_or_404(models.TEntry.objects.select_related("t_post"), pk=pk)
     if t_entry.t_post.m_post_kind.key == MPostKinds.article:
         return redirect(reverse("article_edit", args=[pk]))
     elif t_entry.t_post.m_post_kind.key == MPostKinds.note:
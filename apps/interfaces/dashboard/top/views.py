@@ -10,9 +10,7 @@ from data.post import models as post_models
 def dashboard(request):
     t_entry_select_related_fields = (
         "t_post",
-        "t_post__m_post_kind",
         "t_post__p_author",
-        "t_post__m_post_status",
         "t_location",
         "t_bookmark",
         "t_reply",
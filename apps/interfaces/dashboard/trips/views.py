@@ -6,6 +6,7 @@ from django.views.generic import CreateView, DeleteView, ListView, UpdateView
 from django.views.generic.base import ContextMixin
 from django.views.generic.edit import ProcessFormView, SingleObjectTemplateResponseMixin
 
+from core import page_cache
 from data.trips.models import TTrip
 from interfaces.dashboard.trips.forms import TLocationModelForm, TTripModelForm
 
@@ -43,6 +44,7 @@ class ProcessNamedFormMixin(SingleObjectTemplateResponseMixin, ContextMixin, Pro
             for named_form in named_forms.values():
                 named_form.prepare_data(instance)
                 named_form.save()
+            page_cache.purge(page_cache.TRIPS, page_cache.trip_tag(instance.uuid))
         return redirect(resolve_url(self.redirect_url, pk=instance.pk))
 
     def form_invalid(self, form, named_forms=None):
@@ -102,3 +104,7 @@ class DeleteTripView(DeleteView):
 
     def get_context_data(self, *args, **kwargs):
         return super().get_context_data(*args, nav="trips", **kwargs)
+
+    def form_valid(self, form):
+        page_cache.purge(page_cache.TRIPS, page_cache.trip_tag(self.object.uuid))
+        return super().form_valid(form)
@@ -1,7 +1,13 @@
 from django.urls import path
 
+from core import page_cache
+
 from . import views
 
 urlpatterns = [
-    path("author/<str:username>/", views.AuthorDetail.as_view(), name="author"),
+    path(
+        "author/<str:username>/",
+        page_cache.cache_anonymous_page(page_cache.TIMELINE)(views.AuthorDetail.as_view()),
+        name="author",
+    ),
 ]
@@ -1,37 +1,10 @@
-from django.db.models import Count, Q
-from django.views.generic import ListView
+from domain.timeline import queries as timeline_queries
+from interfaces.common.views import TimelineListView
 
-from core.constants import Visibility
-from data.entry.models import TEntry
-from data.indieweb.constants import MPostStatuses
 
-
-class AuthorDetail(ListView):
+class AuthorDetail(TimelineListView):
     template_name = "public/index.html"
     paginate_by = 10
 
     def get_queryset(self):
-        return (
-            TEntry.objects.visible_for_user(self.request.user.id)
-            .exclude(t_post__visibility=Visibility.UNLISTED)
-            .select_related(
-                "t_post",
-                "t_post__m_post_kind",
-                "t_post__p_author",
-                "t_location",
-                "t_bookmark",
-                "t_reply",
-                "t_checkin",
-            )
-            .filter(
-                t_post__m_post_status__key=MPostStatuses.published,
-                t_post__p_author__username__exact=self.kwargs["username"],
-            )
-            .annotate(
-                interaction_count=Count(
-                    "t_post__ref_t_webmention",
-                    filter=Q(t_post__ref_t_webmention__approval_status=True),
-                )
-            )
-            .order_by("-t_post__dt_published")
-        )
+        return timeline_queries.get_timeline_for_user(self.request.user, author_username=self.kwargs["username"])
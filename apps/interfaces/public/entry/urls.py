@@ -1,8 +1,18 @@
 from django.urls import path
 
+from core import page_cache
+
 from . import views
 
 urlpatterns = [
-    path("<uuid:uuid>", views.status_detail, name="post_detail"),
-    path("bookmarks/", views.Bookmarks.as_view(), name="bookmarks"),
+    path(
+        "<uuid:uuid>",
+        page_cache.conditional_page(page_cache.post_tag, last_modified=views.get_post_last_modified)(
+            page_cache.cache_anonymous_page(page_cache.post_tag)(views.status_detail)
+        ),
+        name="post_detail",
+    ),
+    path(
+        "bookmarks/", page_cache.cache_anonymous_page(page_cache.TIMELINE)(views.Bookmarks.as_view()), name="bookmarks"
+    ),
 ]
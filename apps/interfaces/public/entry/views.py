@@ -1,6 +1,6 @@
 from django.db.models import Count
 from django.shortcuts import get_object_or_404, render
-from django.utils.timezone import now
+from django.utils.timezone import localdate, now
 from django.views import generic
 from meta import views as meta_views
 from taggit import models as taggit_models
@@ -9,17 +9,31 @@ from application import entry as entry_application
 from data.entry import models as entry_models
 from data.indieweb.constants import MPostKinds, MPostStatuses
 from data.post import models as post_models
-from data.streams.models import MStream
 
 from . import forms
 
 
+def get_post_last_modified(request, uuid):
+    """
+    When a post last changed. Webmentions purge the post's pages, so they're covered by its tag.
+    """
+    t_post = (
+        post_models.TPost.objects.visible_for_user(request.user.id)
+        .filter(uuid=uuid)
+        .values("dt_published", "updated_at", "ref_t_entry__updated_at")
+        .first()
+    )
+    # Posts published today show how long ago they were published, which changes on every request.
+    if t_post is None or t_post["dt_published"] is None or localdate(t_post["dt_published"]) == localdate():
+        return None
+    return max(timestamp for timestamp in t_post.values() if timestamp is not None)
+
+
 def status_detail(request, uuid):
     t_post: post_models.TPost = get_object_or_404(
         post_models.TPost.objects.visible_for_user(request.user.id)
-        .filter(m_post_status__key=MPostStatuses.published)
+        .filter(m_post_status_id=post_models.MPostStatus.objects.id_for_key(MPostStatuses.published))
         .select_related(
-            "m_post_kind",
             "ref_t_entry",
             "ref_t_entry__t_reply",
             "ref_t_entry__t_bookmark",
@@ -42,7 +56,6 @@ def status_detail(request, uuid):
         "now": now(),
         "selected": [stream.slug for stream in t_post.streams.all()],
         "title": t_entry.p_name if t_entry.p_name else t_entry.p_summary[:140],
-        "streams": MStream.objects.visible(request.user),
         "public": True,
         "meta": entry_application.get_open_graph_meta_for_entry(request, t_entry),
         "open_interactions": request.GET.get("o"),
@@ -61,7 +74,7 @@ class Bookmarks(generic.ListView):
         form = forms.BookmarksSearchForm({"tag": tag_names})
         if form.is_valid():
             if form.cleaned_data["tag"]:
-                qs = qs.filter(t_post__tags__name__in=form.cleaned_data["tag"])
+                qs = qs.filter(t_post__tags__name__in=form.cleaned_data["tag"]).distinct()
         return qs
 
     def _get_base_queryset(self):
@@ -69,16 +82,14 @@ class Bookmarks(generic.ListView):
             entry_models.TEntry.objects.visible_for_user(self.request.user.id)
             .select_related(
                 "t_post",
-                "t_post__m_post_kind",
                 "t_post__p_author",
                 "t_location",
                 "t_bookmark",
             )
-            .filter(t_post__m_post_status__key=MPostStatuses.published)
-            .filter(t_post__m_post_kind__key=MPostKinds.bookmark)
+            .filter(t_post__m_post_status_id=post_models.MPostStatus.objects.id_for_key(MPostStatuses.published))
+            .filter(t_post__m_post_kind_id=post_models.MPostKind.objects.id_for_key(MPostKinds.bookmark))
             .exclude(t_post__visibility=post_models.Visibility.UNLISTED)
             .order_by("-t_post__dt_published")
-            .distinct()
         )
 
     def get_context_data(self, *, object_list=None, **kwargs):
@@ -87,7 +98,9 @@ class Bookmarks(generic.ListView):
             {
                 "selected": ["bookmarks"],
                 "title": "Bookmarks",
-                "tags": taggit_models.Tag.objects.filter(tpost__m_post_kind__key=MPostKinds.bookmark)
+                "tags": taggit_models.Tag.objects.filter(
+                    tpost__m_post_kind_id=post_models.MPostKind.objects.id_for_key(MPostKinds.bookmark)
+                )
                 .annotate(count=Count("tpost"))
                 .order_by("name"),
                 "meta": meta_views.Meta(
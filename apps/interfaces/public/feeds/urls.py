@@ -1,8 +1,21 @@
 from django.urls import path
 
+from core import documents, page_cache
 from interfaces.public.feeds import views
 
 urlpatterns = [
-    path("feed/", views.AllEntriesFeed(), name="feed"),
-    path("<slug:stream_slug>/feed/", views.StreamFeed(), name="stream_feed"),
+    path(
+        "feed/",
+        page_cache.conditional_page(page_cache.TIMELINE, last_modified=views.get_feed_last_modified)(
+            documents.materialised_document(page_cache.TIMELINE)(views.AllEntriesFeed())
+        ),
+        name="feed",
+    ),
+    path(
+        "<slug:stream_slug>/feed/",
+        page_cache.conditional_page(page_cache.TIMELINE, last_modified=views.get_feed_last_modified)(
+            documents.materialised_document(page_cache.TIMELINE)(views.StreamFeed())
+        ),
+        name="stream_feed",
+    ),
 ]
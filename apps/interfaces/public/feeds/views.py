@@ -1,12 +1,27 @@
 from django.contrib.syndication.views import Feed
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 from django.urls import reverse
 from django.utils.feedgenerator import Rss201rev2Feed, rfc2822_date
 
 from application.feeds import content as feed_content
+from core.pagination import CursorPage, CursorPaginator, InvalidCursor
 from data.post.models import TPost
 from data.streams.models import MStream
 from domain.posts import queries as post_queries
+from domain.timeline import queries as timeline_queries
+
+
+def get_feed_last_modified(request, stream_slug: str | None = None):
+    """
+    When the posts in a feed last changed, so polling feed readers can be answered with 304s.
+    """
+    stream = None
+    if stream_slug:
+        stream = MStream.objects.visible(request.user).filter(slug=stream_slug).first()
+        if stream is None:
+            return None
+    return timeline_queries.get_last_modified(timeline_queries.get_timeline_for_user(request.user, stream=stream))
 
 
 class ExtendedRSSFeed(Rss201rev2Feed):
@@ -19,6 +34,12 @@ class ExtendedRSSFeed(Rss201rev2Feed):
         attrs["xmlns:content"] = "http://purl.org/rss/1.0/modules/content/"
         return attrs
 
+    def add_root_elements(self, handler):
+        super().add_root_elements(handler)
+        # RFC 5005 paged feed, so readers can walk back through the archive.
+        if self.feed.get("next_url"):
+            handler.addQuickElement("atom:link", None, {"rel": "next", "href": self.feed["next_url"]})
+
     def add_item_elements(self, handler, item):  # noqa: C901
         """
         Overrides the base class because there's no hook around the title tag.
@@ -82,9 +103,11 @@ class ExtendedRSSFeed(Rss201rev2Feed):
 class AllEntriesFeed(Feed):
     feed_type = ExtendedRSSFeed
     item_guid_is_permalink = False
+    page_size = 10
 
     def __call__(self, request, *args, **kwargs):
         self.request = request
+        self.page: CursorPage | None = None
         return super().__call__(request, *args, **kwargs)
 
     def title(self):
@@ -93,8 +116,26 @@ class AllEntriesFeed(Feed):
     def link(self):
         return reverse("public:home")
 
-    def items(self):
-        return post_queries.get_public_posts_for_user(user=self.request.user)[:10]
+    def get_posts(self, obj):
+        return post_queries.get_public_posts_for_user(user=self.request.user)
+
+    def get_page(self, obj) -> CursorPage:
+        if self.page is None:
+            paginator = CursorPaginator(self.get_posts(obj), self.page_size, ordering=("-dt_published", "-pk"))
+            try:
+                self.page = paginator.page(self.request.GET.get("cursor"))
+            except InvalidCursor as e:
+                raise Http404(str(e)) from e
+        return self.page
+
+    def feed_extra_kwargs(self, obj):
+        page = self.get_page(obj)
+        if not page.has_next():
+            return {}
+        return {"next_url": self.request.build_absolute_uri(f"{self.request.path}?cursor={page.next_cursor}")}
+
+    def items(self, obj):
+        return self.get_page(obj).object_list
 
     def item_title(self, item: TPost):
         if item.ref_t_entry.is_article:
@@ -128,5 +169,5 @@ class StreamFeed(AllEntriesFeed):
     def get_object(self, request, stream_slug: str):
         return get_object_or_404(MStream.objects.visible(request.user), slug=stream_slug)
 
-    def items(self, obj):
-        return post_queries.get_public_posts_for_user(self.request.user, stream=obj)[:10]
+    def get_posts(self, obj):
+        return post_queries.get_public_posts_for_user(self.request.user, stream=obj)
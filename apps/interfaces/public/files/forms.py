@@ -2,12 +2,9 @@ import uuid
 
 from django import forms
 from django.contrib.gis.geos import Point
-from django.core.files.uploadedfile import SimpleUploadedFile
-from plum import exceptions as plum_exceptions
 
 from data.files.models import TFile
-from domain.images.exif import extract_exif, get_location, scrub_exif
-from domain.images.images import rotate_image
+from domain.files import operations as file_ops
 
 
 class MediaUploadForm(forms.ModelForm):
@@ -20,24 +17,17 @@ class MediaUploadForm(forms.ModelForm):
         self.point: Point | None = None
 
     def clean(self):
+        upload = self.cleaned_data.get("file")
+        if upload is None:
+            return
         self.instance.uuid = uuid.uuid4()
-        self.instance.mime_type = self.files["file"].content_type
-        try:
-            exif = extract_exif(self.cleaned_data["file"].file)
-
-            self.instance.exif = exif
-            self.instance.point = get_location(exif)
-            self.cleaned_data["file"].seek(0)
-
-            rotated_image = rotate_image(self.cleaned_data["file"].file, self.cleaned_data["file"].content_type)
-            scrubbed_image_data = scrub_exif(rotated_image)
-            image_data = scrubbed_image_data if scrubbed_image_data else rotated_image
-            image_data.seek(0)
-            upload_file = SimpleUploadedFile(
-                self.cleaned_data["file"].name,
-                image_data.read(),
-                self.cleaned_data["file"].content_type,
-            )
-            self.cleaned_data["file"] = upload_file
-        except plum_exceptions.UnpackError:
-            pass
+        self.instance.mime_type = upload.content_type
+        # Rotated and without its exif, with the exif and location kept on the instance instead.
+        self.cleaned_data["file"] = file_ops.ingest_upload(self.instance, upload)
+
+    def save(self, commit=True):
+        t_file = super().save(commit=commit)
+        if commit:
+            # Resize and convert it now, instead of when the first visitor asks for it.
+            file_ops.schedule_derivatives(t_file)
+        return t_file
@@ -1,11 +1,19 @@
+import re
+from pathlib import Path
+from urllib.parse import quote
+
+from django.conf import settings
 from django.http import (
     FileResponse,
     HttpResponse,
     HttpResponseForbidden,
     HttpResponseNotAllowed,
+    HttpResponseNotModified,
     JsonResponse,
+    StreamingHttpResponse,
 )
 from django.shortcuts import get_object_or_404, render
+from django.utils.http import content_disposition_header, parse_etags
 from django.views.decorators.csrf import csrf_exempt
 
 from data.files import models as file_models
@@ -13,6 +21,17 @@ from domain.files import operations as file_ops
 
 from .forms import MediaUploadForm
 
+# What a media url serves never changes: each upload gets a new uuid and derivatives are named by their md5.
+MEDIA_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# The original served in place of a copy that's still being created is checked again next time.
+BUSY_CACHE_CONTROL = "no-cache"
+# A single byte range, "bytes=0-499", "bytes=500-" or the last bytes, "bytes=-500".
+_BYTE_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+_CHUNK_SIZE = 64 * 1024
+
+
+class UnsatisfiableRange(Exception): ...
+
 
 @csrf_exempt
 def micropub_media(request):
@@ -42,19 +61,111 @@ def get_media(request, uuid):
     file_format = request.GET.get("f") or t_file.mime_type
     size = int(request.GET.get("s")) if request.GET.get("s") else None
 
-    return_file = file_ops.get_file(t_file, file_format, size)
+    cache_control = MEDIA_CACHE_CONTROL
+    try:
+        return_file = file_ops.get_file(t_file, file_format, size)
+    except file_ops.DerivativeBusy:
+        return_file, cache_control = t_file, BUSY_CACHE_CONTROL
+    # Stored files are named by the md5 of their content.
+    etag = f'"{Path(return_file.file.name).name}"'
 
-    # Ensure we always return the entire file, despite potential processing.
-    return_file.file.seek(0)
-    response = FileResponse(
-        return_file.file,
-        return_file.mime_type,
-        filename=return_file.filename,
-        as_attachment=as_attachment,
-    )
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match and (if_none_match.strip() == "*" or etag in parse_etags(if_none_match)):
+        response = HttpResponseNotModified()
+    elif settings.MEDIA_SENDFILE:
+        response = _sendfile_response(return_file, as_attachment)
+    else:
+        response = _file_response(request, return_file, as_attachment, etag)
+    response["ETag"] = etag
+    response["Cache-Control"] = cache_control
     return response
 
 
+def _sendfile_response(return_file: file_models.TFile | file_models.TFormattedImage, as_attachment: bool):
+    """
+    Let the front server send the file, and handle ranges, instead of streaming it through the worker.
+    """
+    response = HttpResponse(content_type=return_file.mime_type)
+    response["Content-Disposition"] = content_disposition_header(as_attachment, return_file.filename)
+    if settings.MEDIA_SENDFILE == "x-accel-redirect":
+        response["X-Accel-Redirect"] = f"{settings.MEDIA_SENDFILE_URL.rstrip('/')}/{quote(return_file.file.name)}"
+    else:
+        response["X-Sendfile"] = return_file.file.path
+    return response
+
+
+def _file_response(
+    request, return_file: file_models.TFile | file_models.TFormattedImage, as_attachment: bool, etag: str
+) -> HttpResponse | StreamingHttpResponse:
+    """
+    Stream the file, or the byte range asked for so video can be seeked without downloading all of it.
+    """
+    file_size = return_file.file.size
+    try:
+        byte_range = _get_byte_range(request, file_size, etag)
+    except UnsatisfiableRange:
+        response = HttpResponse(status=416)
+        response["Content-Range"] = f"bytes */{file_size}"
+        return response
+
+    if byte_range is None:
+        return_file.file.open("rb")
+        response = FileResponse(
+            return_file.file,
+            return_file.mime_type,
+            filename=return_file.filename,
+            as_attachment=as_attachment,
+        )
+    else:
+        start, end = byte_range
+        response = StreamingHttpResponse(
+            _read_range(return_file.file, start, end), status=206, content_type=return_file.mime_type
+        )
+        response["Content-Range"] = f"bytes {start}-{end - 1}/{file_size}"
+        response["Content-Length"] = str(end - start)
+        response["Content-Disposition"] = content_disposition_header(as_attachment, return_file.filename)
+    response["Accept-Ranges"] = "bytes"
+    return response
+
+
+def _get_byte_range(request, file_size: int, etag: str) -> tuple[int, int] | None:
+    """
+    Get the [start, end) byte range requested, or None to send the whole file.
+
+    Requests for several ranges get the whole file, as does an If-Range for another version of it.
+
+    :raises UnsatisfiableRange
+    """
+    match = _BYTE_RANGE.match(request.headers.get("Range", "").replace(" ", ""))
+    if match is None or request.headers.get("If-Range", etag) != etag:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        start, end = max(file_size - int(last), 0), file_size
+    else:
+        start, end = int(first), min(int(last) + 1, file_size) if last else file_size
+    if start >= end:
+        raise UnsatisfiableRange(f"{start}-{end} is outside of {file_size} bytes")
+    return start, end
+
+
+def _read_range(file, start: int, end: int):
+    file.open("rb")
+    try:
+        file.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            chunk = file.read(min(_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+    finally:
+        file.close()
+
+
 def get_media_modal(request, uuid):
     t_file: file_models.TFile = get_object_or_404(file_models.TFile, uuid=uuid)
     return render(request, "public/files/modal.html", {"t_file": t_file})
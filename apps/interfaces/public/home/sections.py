@@ -0,0 +1,152 @@
+import contextvars
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+
+from core import page_cache
+from data.indieweb.constants import MPostKinds
+from data.post.models import MPostKind
+from data.streams.models import MStream
+from domain.files import queries as file_queries
+from domain.indieweb.webmention import approved_webmentions
+from domain.posts import queries as post_queries
+from domain.sunbottle import queries as sunbottle_queries
+
+# The kinds shown in the status section.
+STATUS_KINDS = [MPostKinds.note, MPostKinds.reply, MPostKinds.bookmark]
+
+
+@dataclass(frozen=True)
+class Section:
+    """
+    A part of the home page, built by build(user) and cached until any of the tags it depends on is purged.
+    """
+
+    name: str
+    build: Callable[[Any], Any]
+    tags: Callable[[], list[str]]
+    # Anything else the section changes with, e.g. the hour for hourly data.
+    parts: Callable[[], list[str]] = lambda: []
+    # Seconds before it's built again anyway, PAGE_CACHE_TIMEOUT by default.
+    timeout: int | None = None
+    # False for sections that are cheap to build, or cache their data themselves.
+    cached: bool = True
+
+
+def _get_highlight_stream() -> MStream | None:
+    if not settings.HIGHLIGHT_STREAM_SLUG:
+        return None
+    return MStream.objects.filter(slug=settings.HIGHLIGHT_STREAM_SLUG).first()
+
+
+def _build_posts(user) -> list:
+    return list(post_queries.get_public_posts_for_user(user, kinds=STATUS_KINDS)[:3])
+
+
+def _build_highlight_kind(user) -> dict:
+    return {
+        "kind": MPostKind.objects.get_by_key(MPostKinds.article),
+        "posts": list(
+            post_queries.get_public_posts_for_user(user, kinds=[MPostKinds.article]).exclude(
+                streams__slug=settings.HIGHLIGHT_STREAM_SLUG
+            )[:5]
+        ),
+    }
+
+
+def _build_highlight_stream(user) -> dict:
+    stream = _get_highlight_stream()
+    return {
+        "posts": list(post_queries.get_public_posts_for_user(user, stream=stream)[:5]),
+        "stream": stream,
+    }
+
+
+def _build_last_seen(user) -> dict:
+    return {
+        "last_location_post": post_queries.get_last_post_with_location(user),
+        "checkins": list(
+            zip(
+                post_queries.get_public_posts_for_user(user, kinds=[MPostKinds.checkin])[1:5],
+                ["text-lg", "text-md", "text-sm", "text-xs"],
+            )
+        ),
+    }
+
+
+def _build_generation(user) -> dict | None:
+    if not settings.SUNBOTTLE_API_URL:
+        return None
+    return sunbottle_queries.get_generation()
+
+
+SECTIONS = [
+    Section("posts", _build_posts, lambda: [page_cache.kind_tag(kind) for kind in STATUS_KINDS]),
+    Section(
+        "highlight_kind",
+        _build_highlight_kind,
+        # Posts in the highlighted stream are left out.
+        lambda: [page_cache.kind_tag(MPostKinds.article), page_cache.stream_tag(settings.HIGHLIGHT_STREAM_SLUG or "")],
+    ),
+    Section(
+        "highlight_stream",
+        _build_highlight_stream,
+        lambda: [page_cache.stream_tag(settings.HIGHLIGHT_STREAM_SLUG or "")],
+    ),
+    # Any post can have a location.
+    Section("last_seen", _build_last_seen, lambda: [page_cache.TIMELINE]),
+    Section("photo_gallery", lambda user: list(file_queries.get_public_photos(limit=10)), lambda: [page_cache.FILES]),
+    Section("webmentions", lambda user: list(approved_webmentions()[:10]), lambda: [page_cache.WEBMENTIONS]),
+    # The generation is served from its own cache, which refreshes it in the background.
+    Section("generation", _build_generation, lambda: [], cached=False),
+]
+
+
+def get_sections(user, sections: list[Section] = SECTIONS) -> dict[str, Any]:
+    """
+    Get the context for each section, from the cache or built on a miss.
+
+    Sections missing from the cache are built concurrently, with up to HOME_SECTION_WORKERS threads.
+    """
+    # Logged in users may see private posts.
+    user_part = str(user.pk) if user.is_authenticated else ""
+    keys = {
+        section.name: (
+            page_cache.get_key(f"home:{section.name}", section.tags(), [user_part, *section.parts()])
+            if section.cached
+            else None
+        )
+        for section in sections
+    }
+    cached = cache.get_many([key for key in keys.values() if key is not None])
+    context = {section.name: cached[keys[section.name]] for section in sections if keys[section.name] in cached}
+
+    missing = [section for section in sections if section.name not in context]
+    if settings.HOME_SECTION_WORKERS > 1 and len(missing) > 1:
+        with ThreadPoolExecutor(max_workers=settings.HOME_SECTION_WORKERS) as executor:
+            # Each is built in a copy of this context, so its reads are routed like the request's.
+            futures = [
+                executor.submit(_build_in_thread, contextvars.copy_context(), section, user) for section in missing
+            ]
+            built = [future.result() for future in futures]
+    else:
+        built = [section.build(user) for section in missing]
+
+    for section, value in zip(missing, built):
+        context[section.name] = value
+        if keys[section.name] is not None:
+            cache.set(keys[section.name], value, timeout=section.timeout or settings.PAGE_CACHE_TIMEOUT)
+    return context
+
+
+def _build_in_thread(context: contextvars.Context, section: Section, user) -> Any:
+    try:
+        return context.run(section.build, user)
+    finally:
+        # Each thread opens its own connections.
+        connections.close_all()
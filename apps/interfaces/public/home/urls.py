@@ -1,8 +1,22 @@
 from django.urls import path
 
+from core import page_cache
+
 from . import views
 
 urlpatterns = [
-    path("blog/", views.BlogListView.as_view(), name="blog"),
-    path("", views.HomeView.as_view(), name="home"),
+    path(
+        "blog/",
+        page_cache.conditional_page(page_cache.TIMELINE, last_modified=views.get_timeline_last_modified)(
+            page_cache.cache_anonymous_page(page_cache.TIMELINE)(views.BlogListView.as_view())
+        ),
+        name="blog",
+    ),
+    path(
+        "",
+        page_cache.conditional_page(page_cache.TIMELINE, last_modified=views.get_home_last_modified)(
+            page_cache.cache_anonymous_page(page_cache.TIMELINE)(views.HomeView.as_view())
+        ),
+        name="home",
+    ),
 ]
@@ -2,12 +2,13 @@ from django.shortcuts import render
 
 from core.constants import Visibility
 from data.indieweb.constants import MPostKinds, MPostStatuses
-from data.post.models import TPost
+from data.post.models import MPostKind, MPostStatus, TPost
 
 
 def cluster_map(request):
     posts = TPost.objects.visible_for_user(request.user.id).filter(
-        m_post_status__key=MPostStatuses.published, m_post_kind__key=MPostKinds.checkin
+        m_post_status_id=MPostStatus.objects.id_for_key(MPostStatuses.published),
+        m_post_kind_id=MPostKind.objects.id_for_key(MPostKinds.checkin),
     )
     if not request.user.is_authenticated:
         posts = posts.exclude(visibility=Visibility.UNLISTED)
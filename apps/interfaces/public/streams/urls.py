@@ -1,7 +1,15 @@
 from django.urls import path
 
+from core import page_cache
+
 from . import views
 
 urlpatterns = [
-    path("<slug:stream_slug>/", views.StreamView.as_view(), name="stream"),
+    path(
+        "<slug:stream_slug>/",
+        page_cache.conditional_page(page_cache.TIMELINE, last_modified=views.get_stream_last_modified)(
+            page_cache.cache_anonymous_page(page_cache.TIMELINE)(views.StreamView.as_view())
+        ),
+        name="stream",
+    ),
 ]
@@ -1,8 +1,14 @@
 from django.urls import path
 
+from core import page_cache
+
 from . import views
 
 urlpatterns = [
-    path("trips/", views.TripListView.as_view(), name="trips"),
-    path("trips/<uuid:uuid>", views.trip_detail, name="trip_detail"),
+    path("trips/", page_cache.cache_anonymous_page(page_cache.TRIPS)(views.TripListView.as_view()), name="trips"),
+    path(
+        "trips/<uuid:uuid>",
+        page_cache.cache_anonymous_page(page_cache.trip_tag)(views.trip_detail),
+        name="trip_detail",
+    ),
 ]
@@ -3,8 +3,7 @@ from django.views.generic import ListView
 
 from core.constants import Visibility
 from data.indieweb.constants import MPostStatuses
-from data.post.models import TPost
-from data.streams.models import MStream
+from data.post.models import MPostStatus, TPost
 from data.trips.models import TTrip
 from domain.trips import queries
 
@@ -14,7 +13,6 @@ def trip_detail(request, uuid):
         (
             TTrip.objects.visible_for_user(request.user.id).prefetch_related(
                 "posts",
-                "posts__m_post_kind",
                 "posts__p_author",
                 "posts__ref_t_entry",
                 "posts__ref_t_entry__t_location",
@@ -27,9 +25,8 @@ def trip_detail(request, uuid):
     )
     posts = (
         TPost.objects.visible_for_user(request.user.id)
-        .filter(m_post_status__key=MPostStatuses.published, trips=t_trip)
+        .filter(m_post_status_id=MPostStatus.objects.id_for_key(MPostStatuses.published), trips=t_trip)
         .select_related(
-            "m_post_kind",
             "ref_t_entry",
             "ref_t_entry__t_reply",
             "ref_t_entry__t_bookmark",
@@ -56,7 +53,6 @@ class TripListView(ListView):
         context.update(
             {
                 "selected": ["trips"],
-                "streams": MStream.objects.visible(self.request.user),
                 "t_location_points": t_location_points,
                 "title": "Trips",
             }
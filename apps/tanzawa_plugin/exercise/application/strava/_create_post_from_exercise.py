@@ -8,12 +8,15 @@ from django.conf import settings
 from django.core.files import uploadedfile
 from django.db import transaction
 
+from application import entry as entry_application
 from data.entry import models as entry_models
 from data.files import models as file_models
 from data.indieweb.constants import MPostKinds, MPostStatuses
 from data.post import models as post_models
 from domain.entry import operations as entry_ops
+from domain.files import operations as file_ops
 from domain.post import queries as post_queries
+from domain.timeline import operations as timeline_ops
 from tanzawa_plugin.exercise.data.exercise import models as exercise_models
 from tanzawa_plugin.exercise.data.strava import models as strava_models
 from tanzawa_plugin.exercise.domain.strava import client as strava_client
@@ -92,6 +95,8 @@ def _create_post_from_activity(
         _store_photos(activity, activity_detail)
 
     _create_syndication_link(activity, entry)
+    timeline_ops.refresh_timeline(entry.t_post_id)
+    entry_application.purge_pages_for_post(entry.t_post)
     return entry
 
 
@@ -132,18 +137,19 @@ def _get_photo(activity: exercise_models.Activity, photo: dict) -> exercise_mode
 def _download_photo(url: str) -> uploadedfile.SimpleUploadedFile:
     response = requests.get(url)
     file_name = pathlib.Path(url).name
-    content_type = response.headers.get("content-type", mimetypes.guess_type(file_name))
+    content_type = response.headers.get("content-type") or mimetypes.guess_type(file_name)[0] or "image/jpeg"
     upload_file = uploadedfile.SimpleUploadedFile(file_name, response.content, content_type)
     return upload_file
 
 
-def _store_photo(upload_file: uploadedfile.SimpleUploadedFile):
-    return file_models.TFile.objects.create(
-        file=upload_file,
-        uuid=uuid.uuid4(),
-        filename=upload_file.name,
-        mime_type=upload_file.content_type,
-    )
+def _store_photo(upload_file: uploadedfile.SimpleUploadedFile) -> file_models.TFile:
+    t_file = file_models.TFile(uuid=uuid.uuid4(), filename=upload_file.name, mime_type=upload_file.content_type)
+    # Rotated and without its exif, with its sizes and content hash stored, like any other upload.
+    t_file.file = file_ops.ingest_upload(t_file, upload_file)
+    t_file.save()
+    # Resize and convert it now, instead of when the first visitor asks for it.
+    file_ops.schedule_derivatives(t_file)
+    return t_file
 
 
 def _create_syndication_link(activity: exercise_models.Activity, entry: entry_models.TSyndication) -> None:
@@ -24,8 +24,8 @@ class Activity(models.Model):
     elevation_low = models.FloatField()
     activity_type = models.CharField(max_length=64, choices=constants.ActivityTypeChoices.choices)
     started_at = models.DateTimeField()
-    start_point = geo_models.PointField(geography=True, srid=3857)
-    end_point = geo_models.PointField(geography=True, srid=3857)
+    start_point = geo_models.PointField(geography=True)
+    end_point = geo_models.PointField(geography=True)
     average_speed = models.FloatField(help_text="Average speed in meters per second")
     max_speed = models.FloatField()
     average_heartrate = models.FloatField(null=True)
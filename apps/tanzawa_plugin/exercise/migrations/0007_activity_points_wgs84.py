@@ -0,0 +1,23 @@
+import django.contrib.gis.db.models.fields
+from django.db import migrations
+
+from core.db import spatial
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("exercise", "0006_map_svg"),
+    ]
+
+    # The points were always longitude/latitude, declared as SRID 3857.
+    operations = [
+        operation
+        for field_name in ("start_point", "end_point")
+        for operation in spatial.change_srid(
+            "activity",
+            "exercise_activity",
+            field_name,
+            django.contrib.gis.db.models.fields.PointField(geography=True, srid=3857),
+            django.contrib.gis.db.models.fields.PointField(geography=True, srid=4326),
+        )
+    ]
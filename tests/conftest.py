@@ -1,3 +1,5 @@
+import contextlib
+
 import pytest
 from django.core.management import call_command
 from django.db import connection
@@ -6,6 +8,13 @@ from model_bakery import baker
 from data.indieweb.constants import MPostStatuses
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    from django.core.cache import cache
+
+    cache.clear()
+
+
 @pytest.fixture
 def client():
     from rest_framework.test import APIClient
@@ -81,3 +90,30 @@ def django_db_setup(django_db_blocker):
             # refs: https://code.djangoproject.com/ticket/32935
             c.execute("SELECT InitSpatialMetaData(1);")
         call_command("migrate", interactive=False)
+
+
+@pytest.fixture
+def query_budget(request):
+    """
+    Fail the test if the block runs too many queries or repeats a statement too often.
+
+        with query_budget(max_queries=10, max_repeats=1):
+            client.get(url)
+
+    Defaults can be declared on the test with @pytest.mark.query_budget(max_queries=..., max_repeats=...).
+    """
+    from core.db import instrumentation
+
+    marker = request.node.get_closest_marker("query_budget")
+    defaults = {"max_queries": None, "max_repeats": 1, **(marker.kwargs if marker else {})}
+
+    @contextlib.contextmanager
+    def budget(**kwargs):
+        limits = {**defaults, **kwargs}
+        with instrumentation.record_queries() as recorder:
+            yield recorder
+        problems = recorder.over_budget(limits["max_queries"], limits["max_repeats"])
+        if problems:
+            pytest.fail("Query budget exceeded:\n" + "\n".join(problems))
+
+    return budget
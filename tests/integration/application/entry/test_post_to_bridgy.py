@@ -0,0 +1,29 @@
+from unittest import mock
+
+import pytest
+
+from application.entry import post_to_bridgy
+from core.constants import Visibility
+from data.entry.constants import BridgySyndicationUrls
+
+SYNDICATION_URL = "https://mastodon.social/@tanzawa/1"
+
+
+@pytest.mark.django_db
+class TestPostToBridgy:
+    def test_cached_permalink_links_to_bridgy(self, client, factory, django_capture_on_commit_callbacks):
+        t_entry = factory.StatusEntry(t_post=factory.PublishedNotePost(visibility=Visibility.PUBLIC))
+        target_url = t_entry.t_post.get_absolute_url()
+        assert BridgySyndicationUrls.mastodon not in client.get(target_url).content.decode()
+
+        with mock.patch("ronkyuu.sendWebmention") as send_webmention:
+            send_webmention.return_value.status_code = 201
+            send_webmention.return_value.json.return_value = {}
+            send_webmention.return_value.headers = {"location": SYNDICATION_URL}
+            with django_capture_on_commit_callbacks(execute=True):
+                post_to_bridgy(t_entry, f"http://testserver{target_url}", BridgySyndicationUrls.mastodon)
+
+        # Bridgy fetches the permalink without logging in.
+        content = client.get(target_url).content.decode()
+        assert BridgySyndicationUrls.mastodon in content
+        assert SYNDICATION_URL in content
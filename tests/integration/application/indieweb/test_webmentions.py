@@ -0,0 +1,87 @@
+import importlib
+
+import pytest
+from django.apps import apps
+from model_bakery import baker
+
+from application.indieweb.webmentions import moderate_webmention
+from data.indieweb import models as indieweb_models
+from data.timeline import models as timeline_models
+from tests import factories
+
+
+@pytest.mark.django_db
+class TestModerateWebmention:
+    @pytest.fixture
+    def entry(self):
+        return factories.StatusEntry()
+
+    def _webmention(self, t_post, comment_type: list[str]) -> indieweb_models.TWebmention:
+        return indieweb_models.TWebmention.new(
+            t_webmention_response=baker.make("webmention.WebMentionResponse"),
+            t_post=t_post,
+            microformat_data={"comment_type": comment_type},
+        )
+
+    def test_counts_approved_interactions(self, entry) -> None:
+        """
+        Given webmentions of each type
+        Expect only the approved ones to be counted on the post and its timeline row
+        """
+        t_post = entry.t_post
+        like = self._webmention(t_post, ["like"])
+        reply = self._webmention(t_post, ["reply"])
+        mention = self._webmention(t_post, [])
+        self._webmention(t_post, ["repost"])
+
+        moderate_webmention(like, approval=True)
+        moderate_webmention(reply, approval=True)
+        moderate_webmention(mention, approval=True)
+        moderate_webmention(reply, approval=False)
+
+        t_post.refresh_from_db()
+        assert (t_post.like_count, t_post.reply_count, t_post.repost_count, t_post.mention_count) == (1, 0, 0, 1)
+        assert timeline_models.TTimeline.objects.get(t_post=t_post).interaction_count == 2
+
+    def test_reset_moderation_removes_from_count(self, entry) -> None:
+        """
+        Given an approved webmention that is updated by its sender
+        Expect it to stop counting until it is approved again
+        """
+        t_webmention = self._webmention(entry.t_post, ["like"])
+        moderate_webmention(t_webmention, approval=True)
+
+        t_webmention.reset_moderation(microformat_data={"comment_type": ["like"]})
+
+        entry.t_post.refresh_from_db()
+        assert entry.t_post.like_count == 0
+
+
+@pytest.mark.django_db
+class TestCountInteractionsMigration:
+    def test_counts_existing_approved_webmentions(self) -> None:
+        """
+        Given webmentions approved before posts had interaction counts
+        Expect migrating to count the approved ones on each post
+        """
+        t_post = factories.StatusEntry().t_post
+        for comment_type, approval_status in (
+            (["like"], True),
+            (["like"], True),
+            (["in-reply-to", "reply"], True),
+            ([], True),
+            (["repost"], False),
+            (["repost"], None),
+        ):
+            baker.make(
+                indieweb_models.TWebmention,
+                t_post=t_post,
+                microformat_data={"comment_type": comment_type},
+                approval_status=approval_status,
+            )
+        migration = importlib.import_module("data.post.migrations.0010_tpost_interaction_counts")
+
+        migration.count_interactions(apps, None)
+
+        t_post.refresh_from_db()
+        assert (t_post.like_count, t_post.reply_count, t_post.repost_count, t_post.mention_count) == (2, 1, 0, 1)
@@ -0,0 +1,33 @@
+import pytest
+from django.conf import settings
+from django.db import connection
+
+from core.db import base
+
+
+@pytest.mark.django_db
+class TestConnectionProfile:
+    def test_applies_configured_pragmas(self):
+        configured = settings.DATABASES["default"]["OPTIONS"]["pragmas"]
+
+        pragmas = connection.effective_pragmas()
+
+        assert pragmas["busy_timeout"] == str(configured["busy_timeout"])
+        assert pragmas["mmap_size"] == str(configured["mmap_size"])
+        assert pragmas["journal_mode"] == configured["journal_mode"].lower()
+
+
+class TestPragmaStatement:
+    def test_builds_statement(self):
+        assert base._pragma_statement("cache_size", -20000) == "PRAGMA cache_size = -20000"
+
+    @pytest.mark.parametrize(
+        "name,value",
+        [
+            ("user_version", 1),
+            ("journal_mode", "WAL; DROP TABLE t_post"),
+        ],
+    )
+    def test_rejects_unknown_names_and_values(self, name, value):
+        with pytest.raises(ValueError):
+            base._pragma_statement(name, value)
@@ -0,0 +1,52 @@
+import pytest
+
+from data.indieweb.constants import MPostKinds, MPostStatuses
+from data.post import models as post_models
+
+
+@pytest.mark.django_db
+class TestMasterDataManager:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        yield
+        # Rows changed by a test are rolled back, so don't leave them in the cache for other tests.
+        post_models.MPostKind.objects.clear_cache()
+        post_models.MPostStatus.objects.clear_cache()
+
+    def test_id_for_key(self):
+        assert post_models.MPostStatus.objects.id_for_key(MPostStatuses.published) == (
+            post_models.MPostStatus.objects.get(key=MPostStatuses.published).pk
+        )
+
+    def test_ids_for_keys_skips_unknown_keys(self):
+        ids = post_models.MPostKind.objects.ids_for_keys([MPostKinds.note, "unknown"])
+
+        assert ids == [post_models.MPostKind.objects.get(key=MPostKinds.note).pk]
+
+    def test_unknown_key(self):
+        with pytest.raises(post_models.MPostKind.DoesNotExist):
+            post_models.MPostKind.objects.get_by_key("unknown")
+
+    def test_related_row_read_from_cache(self, factory, django_assert_num_queries):
+        t_post = factory.PublishedArticlePost()
+        post_models.MPostKind.objects.get_by_key(MPostKinds.article)
+        t_post = post_models.TPost.objects.get(pk=t_post.pk)
+
+        with django_assert_num_queries(0):
+            assert t_post.m_post_kind.key == MPostKinds.article
+            assert t_post.m_post_kind.icon() == "✏️"
+
+    def test_saving_a_row_clears_the_cache(self):
+        m_post_kind = post_models.MPostKind.objects.get(key=MPostKinds.note)
+        post_models.MPostKind.objects.get_by_key(MPostKinds.note)
+
+        m_post_kind.name = "Status"
+        m_post_kind.save()
+
+        assert post_models.MPostKind.objects.get_by_key(MPostKinds.note).name == "Status"
+
+    def test_changes_to_a_row_do_not_leak_into_the_cache(self):
+        m_post_kind = post_models.MPostKind.objects.get_by_key(MPostKinds.note)
+        m_post_kind.name = "Changed"
+
+        assert post_models.MPostKind.objects.get_by_key(MPostKinds.note).name != "Changed"
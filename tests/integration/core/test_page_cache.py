@@ -0,0 +1,118 @@
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory
+from model_bakery import baker
+
+from application import entry as entry_application
+from core import page_cache
+from data.indieweb import models as indieweb_models
+from data.settings import models as settings_models
+from tests import factories
+
+
+class TestCacheAnonymousPage:
+    @pytest.fixture
+    def rendered(self):
+        return []
+
+    @pytest.fixture
+    def view(self, rendered):
+        @page_cache.cache_anonymous_page(page_cache.TIMELINE, page_cache.post_tag)
+        def view(request, uuid):
+            rendered.append(uuid)
+            return HttpResponse(f"Render {len(rendered)}", status=int(request.GET.get("status", 200)))
+
+        return view
+
+    def get(self, view, path="/post", **headers) -> str:
+        return view(RequestFactory().get(path, **headers), uuid="abc").content.decode()
+
+    def test_caches_page(self, view):
+        assert self.get(view) == "Render 1"
+        assert self.get(view) == "Render 1"
+
+    def test_varies_on_htmx(self, view):
+        self.get(view)
+
+        assert self.get(view, HTTP_HX_REQUEST="true", HTTP_HX_TARGET="main") == "Render 2"
+
+    def test_skips_visitors_with_a_session(self, view):
+        self.get(view)
+
+        assert self.get(view, HTTP_COOKIE="sessionid=123") == "Render 2"
+
+    def test_skips_errors(self, view):
+        self.get(view, path="/post?status=500")
+
+        assert self.get(view, path="/post?status=500") == "Render 2"
+
+    @pytest.mark.parametrize(
+        "tag,rerendered",
+        [
+            (page_cache.post_tag("abc"), True),
+            (page_cache.SITE, True),
+            (page_cache.post_tag("xyz"), False),
+        ],
+    )
+    def test_purges_tagged_pages(self, view, tag, rerendered):
+        self.get(view)
+
+        page_cache.purge(tag)
+
+        assert (self.get(view) == "Render 2") == rerendered
+
+
+@pytest.mark.django_db
+class TestPurges:
+    @pytest.fixture
+    def timeline_version(self):
+        def version():
+            return page_cache.cache.get(page_cache._tag_key(page_cache.TIMELINE))
+
+        page_cache.cache.set(page_cache._tag_key(page_cache.TIMELINE), "before", timeout=None)
+        return version
+
+    def test_site_settings(self, django_capture_on_commit_callbacks):
+        page_cache.cache.set(page_cache._tag_key(page_cache.SITE), "before", timeout=None)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            settings_models.MSiteSettings.objects.create(title="New title")
+
+        assert page_cache.cache.get(page_cache._tag_key(page_cache.SITE)) != "before"
+
+    def test_webmention_approval(self, django_capture_on_commit_callbacks, timeline_version):
+        t_webmention = indieweb_models.TWebmention.new(
+            t_webmention_response=baker.make("webmention.WebMentionResponse"),
+            t_post=factories.StatusEntry().t_post,
+            microformat_data={},
+        )
+
+        with django_capture_on_commit_callbacks(execute=True):
+            t_webmention.set_approval(approved=True)
+
+        assert timeline_version() != "before"
+
+    def test_entry_deletion(self, django_capture_on_commit_callbacks, timeline_version):
+        entry = factories.StatusEntry()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            entry_application.delete_entry(entry)
+
+        assert timeline_version() != "before"
+
+
+class TestCachedFragment:
+    def test_reuses_fragment_until_purged(self):
+        request = RequestFactory().get("/")
+        rendered = []
+
+        def get():
+            return page_cache.cached_fragment(
+                request, [page_cache.post_tag("abc")], ["1"], lambda: rendered.append(1) or f"Render {len(rendered)}"
+            )
+
+        assert get() == "Render 1"
+        assert get() == "Render 1"
+        page_cache.purge(page_cache.post_tag("abc"))
+        assert get() == "Render 2"
+        assert (request.fragment_stats.hits, request.fragment_stats.misses) == (1, 2)
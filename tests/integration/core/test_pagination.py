@@ -0,0 +1,41 @@
+import datetime
+
+import pytest
+from django.utils import timezone
+
+from core.pagination import CursorPaginator, InvalidCursor
+from data.post import models as post_models
+from tests import factories
+
+
+@pytest.mark.django_db
+class TestCursorPaginator:
+    @pytest.fixture
+    def t_posts(self):
+        now = timezone.now()
+        # Pairs of posts share a publish time so the primary key has to break the tie.
+        return [factories.PublishedNotePost(dt_published=now - datetime.timedelta(days=i // 2)) for i in range(7)]
+
+    @pytest.fixture
+    def paginator(self, t_posts):
+        return CursorPaginator(post_models.TPost.objects.all(), per_page=3, ordering=("-dt_published", "-pk"))
+
+    def test_walks_forwards_and_backwards(self, paginator, t_posts):
+        expected = list(post_models.TPost.objects.order_by("-dt_published", "-pk"))
+
+        pages = [paginator.page()]
+        while pages[-1].has_next():
+            pages.append(paginator.page(pages[-1].next_cursor))
+
+        assert [t_post for page in pages for t_post in page] == expected
+        assert not pages[0].has_previous()
+        assert [len(page) for page in pages] == [3, 3, 1]
+
+        previous = paginator.page(pages[-1].previous_cursor)
+        assert previous.object_list == pages[1].object_list
+        assert previous.has_next()
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", "e30", "eyJ2IjpbIm5vcGUiLDFdLCJiIjpmYWxzZX0"])
+    def test_invalid_cursor(self, paginator, cursor):
+        with pytest.raises(InvalidCursor):
+            paginator.page(cursor)
@@ -0,0 +1,45 @@
+import pytest
+from django.contrib.gis import geos
+
+from data.entry import models as entry_models
+from data.timeline import models as timeline_models
+from domain.gis import queries as gis_queries
+from tests import factories
+
+KAWAUCHI = (37.3142, 140.8007)
+
+
+@pytest.mark.django_db
+class TestGeoQueries:
+    @pytest.fixture
+    def locations(self):
+        """
+        Locations roughly 0, 1, 5 and 50 km north of Kawauchi.
+        """
+        lat, lon = KAWAUCHI
+        return [factories.Location(point=geos.Point(lon, lat + km / 111.2)) for km in (0, 1, 5, 50)]
+
+    def test_within_radius(self, locations):
+        qs = gis_queries.within_radius(entry_models.TLocation.objects.all(), "point", *KAWAUCHI, radius_km=6)
+
+        assert sorted(qs.values_list("pk", flat=True)) == [location.pk for location in locations[:3]]
+
+    def test_within_radius_follows_relations(self, locations):
+        qs = gis_queries.within_radius(entry_models.TEntry.objects.all(), "t_location__point", *KAWAUCHI, radius_km=2)
+
+        assert sorted(qs.values_list("pk", flat=True)) == [location.t_entry_id for location in locations[:2]]
+
+    def test_nearest(self, locations):
+        rows = gis_queries.nearest(entry_models.TLocation.objects.all(), "point", *KAWAUCHI, k=3)
+
+        assert rows == locations[:3]
+        assert rows[2].distance_km == pytest.approx(5, abs=0.1)
+
+    def test_nearest_expands_to_far_points(self, locations):
+        rows = gis_queries.nearest(entry_models.TLocation.objects.all(), "point", *KAWAUCHI, k=10)
+
+        assert rows == locations
+
+    def test_rejects_fields_without_index(self):
+        with pytest.raises(ValueError):
+            gis_queries.within_radius(timeline_models.TTimeline.objects.all(), "t_entry__p_name", *KAWAUCHI, 1)
@@ -0,0 +1,48 @@
+import pytest
+from django.core.cache import cache
+
+from data.settings import models as settings_models
+from domain.settings import queries as settings_queries
+from tests import factories
+
+
+@pytest.mark.django_db
+class TestGetSiteSettings:
+    @pytest.fixture(autouse=True)
+    def clear_settings(self):
+        settings_models.MSiteSettingsManager._current = None
+
+    def test_cached_until_changed(self, django_assert_num_queries, django_capture_on_commit_callbacks):
+        trip = factories.Trip()
+        with django_capture_on_commit_callbacks(execute=True):
+            factories.Settings(title="Tanzawa", active_trip=trip)
+        settings_queries.get_site_settings()
+
+        with django_assert_num_queries(0):
+            assert settings_queries.get_site_settings().title == "Tanzawa"
+            assert settings_queries.get_active_trip() == trip
+
+        with django_capture_on_commit_callbacks(execute=True):
+            settings_models.MSiteSettings.objects.update(title="Changed")
+            settings_models.MSiteSettings.objects.clear_cache()
+
+        assert settings_queries.get_site_settings().title == "Changed"
+
+    def test_reloads_when_another_process_changes_them(self):
+        factories.Settings(title="Tanzawa")
+        settings_queries.get_site_settings()
+        settings_models.MSiteSettings.objects.update(title="Changed")
+
+        cache.set(settings_models.VERSION_KEY, "another process", timeout=None)
+
+        assert settings_queries.get_site_settings().title == "Changed"
+
+    def test_deleting_the_active_trip(self, django_capture_on_commit_callbacks):
+        trip = factories.Trip()
+        factories.Settings(active_trip=trip)
+        settings_queries.get_site_settings()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            trip.delete()
+
+        assert settings_queries.get_active_trip() is None
@@ -0,0 +1,108 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+from django.core.cache import cache
+
+from domain.sunbottle import queries as sunbottle_queries
+
+GENERATION = {"today_generation": 12, "total_generation": 3400}
+
+
+@pytest.fixture
+def sunbottle(settings):
+    """
+    A local Sunbottle, counting the requests it answers.
+    """
+    state = SimpleNamespace(requests=0, delay=0.0, status=200, body=GENERATION)
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            state.requests += 1
+            time.sleep(state.delay)
+            content = json.dumps(state.body).encode()
+            self.send_response(state.status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    settings.SUNBOTTLE_API_URL = f"http://127.0.0.1:{server.server_port}/"
+    settings.SUNBOTTLE_TIMEOUT = 0.5
+    settings.SUNBOTTLE_CACHE_TIMEOUT = 60
+    settings.SUNBOTTLE_FAILURE_THRESHOLD = 3
+    settings.SUNBOTTLE_RETRY_AFTER = 60
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def stale_generation(settings):
+    generation = sunbottle_queries.Generation(
+        value={"today_generation": 1, "total_generation": 1000},
+        fetched_at=time.time() - settings.SUNBOTTLE_CACHE_TIMEOUT - 1,
+    )
+    cache.set(sunbottle_queries.GENERATION_KEY, generation, timeout=None)
+    return generation
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+class TestGetGeneration:
+    def test_fetched_once_while_fresh(self, sunbottle):
+        assert sunbottle_queries.get_generation() == GENERATION
+        assert sunbottle_queries.get_generation() == GENERATION
+        assert sunbottle.requests == 1
+
+    def test_stale_generation_served_while_fetched_in_background(self, sunbottle, stale_generation):
+        sunbottle.delay = 0.3
+
+        started = time.monotonic()
+        assert sunbottle_queries.get_generation() == stale_generation.value
+        assert sunbottle_queries.get_generation() == stale_generation.value
+        assert time.monotonic() - started < sunbottle.delay
+
+        wait_for(lambda: sunbottle_queries.get_generation() == GENERATION)
+        # Only one worker fetches it.
+        assert sunbottle.requests == 1
+
+    def test_slow_response_times_out(self, sunbottle):
+        sunbottle.delay = 1
+
+        started = time.monotonic()
+        assert sunbottle_queries.get_generation() == {}
+        assert time.monotonic() - started < sunbottle.delay
+
+    def test_last_generation_served_when_failing(self, sunbottle, stale_generation):
+        sunbottle.status = 500
+
+        assert sunbottle_queries.get_generation() == stale_generation.value
+        wait_for(lambda: cache.get(sunbottle_queries.REFRESH_LOCK_KEY) is None)
+        assert cache.get(sunbottle_queries.GENERATION_KEY) == stale_generation
+        assert cache.get(sunbottle_queries.FAILURES_KEY) == 1
+
+    def test_stops_asking_after_repeated_failures(self, sunbottle):
+        sunbottle.status = 500
+
+        for _ in range(5):
+            assert sunbottle_queries.get_generation() == {}
+        assert sunbottle.requests == 3
+
+        sunbottle.status = 200
+        cache.delete(sunbottle_queries.CIRCUIT_OPEN_KEY)
+        assert sunbottle_queries.get_generation() == GENERATION
+        assert cache.get(sunbottle_queries.FAILURES_KEY) is None
@@ -0,0 +1,75 @@
+import importlib
+
+import pytest
+from django.apps import apps
+
+from core.constants import Visibility
+from data.timeline import models as timeline_models
+from domain.timeline import operations as timeline_ops
+from domain.timeline import queries as timeline_queries
+from tests import factories
+
+
+@pytest.mark.django_db
+class TestRefreshTimeline:
+    def test_adds_published_post(self) -> None:
+        """
+        Given a published entry
+        Expect a timeline row with the entry's list view details
+        """
+        entry = factories.ArticleEntry(t_post__visibility=Visibility.PUBLIC)
+
+        t_timeline = timeline_ops.refresh_timeline(entry.t_post_id)
+
+        assert t_timeline is not None
+        assert t_timeline.t_entry == entry
+        assert t_timeline.m_post_kind_key == "article"
+        assert t_timeline.post_title == "My title"
+        assert t_timeline.dt_published == entry.t_post.dt_published
+        assert t_timeline.interaction_count == 0
+
+    def test_removes_unpublished_post(self) -> None:
+        """
+        Given a published entry which is moved back to draft
+        Expect the timeline row to be removed
+        """
+        entry = factories.StatusEntry()
+        timeline_ops.refresh_timeline(entry.t_post_id)
+        entry.t_post.m_post_status = factories.Draft()
+        entry.t_post.save()
+
+        assert timeline_ops.refresh_timeline(entry.t_post_id) is None
+        assert not timeline_models.TTimeline.objects.filter(t_post_id=entry.t_post_id).exists()
+
+
+@pytest.mark.django_db
+class TestFillTimelineMigration:
+    def test_adds_existing_posts(self) -> None:
+        """
+        Given published entries saved before the timeline existed
+        Expect migrating to add them to the timeline
+        """
+        entries = [factories.StatusEntry(), factories.ArticleEntry()]
+        timeline_models.TTimeline.objects.all().delete()
+        migration = importlib.import_module("data.timeline.migrations.0005_fill_timeline")
+
+        migration.fill_timeline(apps, None)
+
+        assert set(timeline_models.TTimeline.objects.values_list("t_entry", flat=True)) == {
+            entry.pk for entry in entries
+        }
+
+    def test_indexes_existing_posts_for_search(self) -> None:
+        """
+        Given the timeline filled by migrating, without search
+        Expect the next migration to index it for search
+        """
+        entry = factories.ArticleEntry()
+        timeline_models.TTimeline.objects.all().delete()
+        importlib.import_module("data.timeline.migrations.0005_fill_timeline").fill_timeline(apps, None)
+        timeline = timeline_models.TTimeline.objects.all()
+        assert not timeline_queries.search_timeline(timeline, "title").exists()
+
+        importlib.import_module("data.timeline.migrations.0006_fill_timeline_search").fill_timeline_search(apps, None)
+
+        assert list(timeline_queries.search_timeline(timeline, "title").values_list("t_entry", flat=True)) == [entry.pk]
@@ -0,0 +1,88 @@
+import pytest
+
+from core.constants import Visibility
+from core.db import fts
+from data.timeline import models as timeline_models
+from domain.timeline import operations as timeline_ops
+from domain.timeline import queries as timeline_queries
+from tests import factories
+
+
+@pytest.mark.django_db
+class TestSearchTimeline:
+    def search(self, query: str) -> list[int]:
+        qs = timeline_queries.search_timeline(timeline_models.TTimeline.objects.all(), query)
+        return list(qs.values_list("t_post_id", flat=True))
+
+    def test_matches_text_outside_the_title(self) -> None:
+        """
+        Given a bookmark with tags
+        Expect it to be found by its body, tags and the bookmarked page's details
+        """
+        entry = factories.BookmarkEntry(e_content="<p>Climbing <b>Mount Fuji</b> &amp; more</p>", tags=["hiking"])
+        timeline_ops.refresh_timeline(entry.t_post_id)
+
+        assert self.search("fuji") == [entry.t_post_id]
+        assert self.search("hiking") == [entry.t_post_id]
+        assert self.search("John Smith") == [entry.t_post_id]
+        assert self.search("nothing") == []
+
+    def test_phrase_and_prefix(self) -> None:
+        """
+        Given an entry
+        Expect quoted phrases to match in order and terms ending in * to match as prefixes
+        """
+        entry = factories.ArticleEntry(e_content="<p>Climbing Mount Fuji</p>")
+        timeline_ops.refresh_timeline(entry.t_post_id)
+
+        assert self.search('"mount fuji"') == [entry.t_post_id]
+        assert self.search('"fuji mount"') == []
+        assert self.search("clim*") == [entry.t_post_id]
+
+    def test_ranks_title_matches_first(self) -> None:
+        """
+        Given one entry mentioning the term in its body and a newer one with it in the title
+        Expect the title match first
+        """
+        body = factories.ArticleEntry(p_name="A walk", e_content="<p>Tanzawa</p>")
+        title = factories.ArticleEntry(p_name="Tanzawa", e_content="<p>A walk</p>")
+        for entry in (body, title):
+            timeline_ops.refresh_timeline(entry.t_post_id)
+
+        assert self.search("tanzawa") == [title.t_post_id, body.t_post_id]
+
+    def test_removes_deleted_entries(self) -> None:
+        """
+        Given an indexed entry which is unpublished
+        Expect it to no longer match
+        """
+        entry = factories.ArticleEntry(t_post__visibility=Visibility.PUBLIC)
+        timeline_ops.refresh_timeline(entry.t_post_id)
+        entry.t_post.m_post_status = factories.Draft()
+        entry.t_post.save()
+
+        timeline_ops.refresh_timeline(entry.t_post_id)
+
+        assert self.search("title") == []
+        assert not timeline_models.TTimelineSearch.objects.filter(t_timeline_id=entry.t_post_id).exists()
+
+
+class TestToMatchQuery:
+    @pytest.mark.parametrize(
+        "query,expected",
+        [
+            ("mount fuji", '"mount" "fuji"'),
+            ('"mount fuji" hik*', '"mount fuji" "hik"*'),
+            ("NOT -fuji:", '"NOT" "-fuji:"'),
+            ('"unclosed', '"unclosed"'),
+            ('* ""', ""),
+        ],
+    )
+    def test_quotes_terms(self, query, expected) -> None:
+        assert timeline_queries.to_match_query(query) == expected
+
+
+def test_highlight_snippet_escapes_text() -> None:
+    snippet = f"<b> {fts.SNIPPET_START}fuji{fts.SNIPPET_END}"
+
+    assert timeline_queries.highlight_snippet(snippet) == "&lt;b&gt; <mark>fuji</mark>"
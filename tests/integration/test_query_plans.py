@@ -0,0 +1,132 @@
+"""
+Check the query plan for queries that run on every public page.
+
+A full table scan or a temporary B-tree sort means the query gets slower as the archive grows, usually because an
+index is missing or a change to the query stopped SQLite from using it.
+"""
+
+import re
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.db import connection
+from django.db.models import Q
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from core.constants import Visibility
+from core.pagination import CursorPaginator
+from data.entry import models as entry_models
+from data.files import models as file_models
+from data.indieweb.constants import MPostKinds, MPostStatuses
+from data.post import models as post_models
+from domain.posts import queries as post_queries
+from domain.timeline import queries as timeline_queries
+
+FULL_SCAN = re.compile(r"\bSCAN (?!CONSTANT ROW)\S+$")
+
+
+def assert_uses_indexes(queryset) -> None:
+    _assert_plan_uses_indexes(queryset.explain())
+
+
+def assert_queries_use_indexes(func: Callable[[], Any]) -> None:
+    """
+    Check the plan of every query func runs, for functions that return a value rather than a queryset.
+    """
+    with CaptureQueriesContext(connection) as context:
+        func()
+    assert context.captured_queries
+    for query in context.captured_queries:
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {query['sql']}")
+            _assert_plan_uses_indexes("\n".join(row[-1] for row in cursor.fetchall()))
+
+
+def _assert_plan_uses_indexes(plan: str) -> None:
+    for line in plan.splitlines():
+        assert not FULL_SCAN.search(line), f"Full table scan:\n{plan}"
+        assert "USE TEMP B-TREE" not in line, f"Temporary sort:\n{plan}"
+
+
+@pytest.mark.django_db
+class TestPublicPostQueryPlans:
+    @pytest.fixture
+    def anonymous(self):
+        return AnonymousUser()
+
+    def test_public_posts_anonymous(self, anonymous):
+        assert_uses_indexes(post_queries.get_public_posts_for_user(anonymous)[:10])
+
+    def test_public_posts_author(self, user):
+        assert_uses_indexes(post_queries.get_public_posts_for_user(user)[:10])
+
+    def test_public_posts_by_kind(self, anonymous):
+        qs = post_queries.get_public_posts_for_user(anonymous, kinds=[MPostKinds.note, MPostKinds.reply])
+        assert_uses_indexes(qs[:3])
+
+    def test_public_posts_in_stream(self, anonymous, factory):
+        assert_uses_indexes(post_queries.get_public_posts_for_user(anonymous, stream=factory.Stream())[:5])
+
+    def test_published(self):
+        assert_uses_indexes(post_models.TPost.objects.published().order_by("-dt_published")[:5])
+
+    def test_bookmarks(self):
+        qs = (
+            entry_models.TEntry.objects.visible_for_user(None)
+            .filter(t_post__m_post_status_id=post_models.MPostStatus.objects.id_for_key(MPostStatuses.published))
+            .filter(t_post__m_post_kind_id=post_models.MPostKind.objects.id_for_key(MPostKinds.bookmark))
+            .exclude(t_post__visibility=Visibility.UNLISTED)
+            .order_by("-t_post__dt_published")
+        )
+        assert_uses_indexes(qs[:5])
+
+
+@pytest.mark.django_db
+class TestTimelineQueryPlans:
+    @pytest.fixture
+    def anonymous(self):
+        return AnonymousUser()
+
+    def test_timeline_anonymous(self, anonymous):
+        assert_uses_indexes(timeline_queries.get_timeline_for_user(anonymous)[:11])
+
+    def test_timeline_author(self, user):
+        assert_uses_indexes(timeline_queries.get_timeline_for_user(user)[:11])
+
+    def test_timeline_for_author_page(self, anonymous, user):
+        assert_uses_indexes(timeline_queries.get_timeline_for_user(anonymous, author_username=user.username)[:11])
+
+    def test_timeline_in_stream(self, anonymous, factory):
+        assert_uses_indexes(timeline_queries.get_timeline_for_user(anonymous, stream=factory.Stream())[:11])
+
+    def test_last_modified_anonymous(self, anonymous):
+        qs = timeline_queries.get_timeline_for_user(anonymous)
+        assert_queries_use_indexes(lambda: timeline_queries.get_last_modified(qs))
+
+    def test_last_modified_author(self, user):
+        qs = timeline_queries.get_timeline_for_user(user)
+        assert_queries_use_indexes(lambda: timeline_queries.get_last_modified(qs))
+
+    def test_last_modified_in_stream(self, anonymous, factory):
+        qs = timeline_queries.get_timeline_for_user(anonymous, stream=factory.Stream())
+        assert_queries_use_indexes(lambda: timeline_queries.get_last_modified(qs))
+
+    @pytest.mark.parametrize("forwards", [True, False])
+    def test_timeline_cursor(self, anonymous, forwards):
+        qs = timeline_queries.get_timeline_for_user(anonymous)
+        paginator = CursorPaginator(qs, 10, ordering=timeline_queries.TIMELINE_ORDERING)
+        if not forwards:
+            qs = qs.reverse()
+        assert_uses_indexes(qs.filter(paginator._seek([timezone.now(), 1], forwards=forwards))[:11])
+
+
+@pytest.mark.django_db
+class TestFileQueryPlans:
+    def test_formatted_image(self):
+        qs = file_models.TFormattedImage.objects.filter(
+            Q(width=800) | Q(height=800), t_file_id=1, mime_type="image/webp"
+        )
+        assert_uses_indexes(qs[:1])
@@ -1 +1,10 @@
 from core.settings import *
+
+# Tests run inside a transaction on the default connection, which a second read-only connection can't see.
+DATABASES.pop("readonly")
+
+CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+# Threads get their own connections, outside the test's transaction.
+HOME_SECTION_WORKERS = 1
+MEDIA_DERIVATIVE_WORKERS = 0
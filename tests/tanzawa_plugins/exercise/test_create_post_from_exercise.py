@@ -0,0 +1,108 @@
+import datetime
+import hashlib
+import io
+from unittest import mock
+
+import pytest
+from django.contrib.gis.geos import Point
+from django.urls import reverse
+from django.utils import timezone
+from exif import Image as ExifImage
+from model_bakery import baker
+from PIL import Image
+
+from tanzawa_plugin.exercise.application import strava as strava_application
+
+ACTIVITY_DETAIL = {
+    "name": "Morning Run",
+    "description": "Along the river",
+    "timezone": "(GMT+09:00) Asia/Tokyo",
+    "start_date_local": "2020-09-28T07:00:00Z",
+    "photos": {},
+}
+PHOTO = {"unique_id": "photo-1", "urls": {"600": "https://dgtzuqphqg23d.cloudfront.net/photo-1.jpg"}}
+
+
+def make_png() -> bytes:
+    data = io.BytesIO()
+    Image.new("RGB", (800, 600), "green").save(data, format="png")
+    return data.getvalue()
+
+
+@pytest.mark.django_db
+class TestCreatePostFromActivity:
+    @pytest.fixture
+    def athlete(self, factory):
+        athlete = baker.make("exercise.Athlete", user=factory.User())
+        baker.make("exercise.AccessToken", athlete=athlete, expires_at=timezone.now() + datetime.timedelta(hours=1))
+        return athlete
+
+    @pytest.fixture
+    def activity(self):
+        return baker.make("exercise.Activity", entry=None, start_point=Point(139.0, 35.0), end_point=Point(139.1, 35.1))
+
+    @pytest.fixture
+    def create_post(self, athlete, activity, django_capture_on_commit_callbacks):
+        def create_post(activity_detail=ACTIVITY_DETAIL):
+            with mock.patch("tanzawa_plugin.exercise.domain.strava.client.get_client") as get_client:
+                get_client.return_value.get_activity.return_value = activity_detail
+                with django_capture_on_commit_callbacks(execute=True):
+                    return strava_application.create_post_from_activity(athlete, activity)
+
+        return create_post
+
+    def test_purges_cached_pages(self, client, create_post):
+        target_url = reverse("public:home")
+        with mock.patch("interfaces.public.home.sections.sunbottle_queries"):
+            assert "Morning Run" not in client.get(target_url).content.decode()
+
+            create_post()
+
+            assert "Morning Run" in client.get(target_url).content.decode()
+
+    def test_regenerates_feed_documents(self, client, create_post, django_assert_max_num_queries):
+        target_url = reverse("public:feed")
+        client.get(target_url)
+
+        create_post()
+
+        # Served from the document stored on publish, not rendered by this request.
+        with django_assert_max_num_queries(1):
+            response = client.get(target_url)
+        assert "Morning Run" in response.content.decode()
+
+    @pytest.fixture
+    def create_post_with_photo(self, settings, tmp_path, create_post):
+        settings.MEDIA_ROOT = tmp_path
+        settings.MEDIA_DERIVATIVES = [(128, "image/webp")]
+
+        def create_post_with_photo(content: bytes, headers: dict):
+            with mock.patch("requests.get") as get:
+                get.return_value.content = content
+                get.return_value.headers = headers
+                return create_post({**ACTIVITY_DETAIL, "photos": {"primary": PHOTO}})
+
+        return create_post_with_photo
+
+    def test_creates_photo_derivatives(self, activity, create_post_with_photo):
+        create_post_with_photo(make_png(), {"content-type": "image/png"})
+
+        t_file = activity.photos.get().t_file
+        assert list(t_file.ref_t_formatted_image.values_list("mime_type", "width", "height")) == [
+            ("image/webp", 128, 96)
+        ]
+
+    def test_stores_photo_metadata(self, activity, create_post_with_photo):
+        with open("tests/fixtures/img_gps.jpeg", "rb") as f:
+            # Strava doesn't always say what it's sending.
+            create_post_with_photo(f.read(), {})
+
+        t_file = activity.photos.get().t_file
+        assert t_file.mime_type == "image/jpeg"
+        assert t_file.exif["make"] == "Apple"
+        with t_file.file.open("rb") as f:
+            stored = f.read()
+        assert not ExifImage(stored).has_exif
+        assert t_file.byte_size == len(stored)
+        assert t_file.content_hash == hashlib.md5(stored).hexdigest()
+        assert t_file.width and t_file.height
@@ -1,7 +1,13 @@
+import gzip
+import html
+import re
+
 import pytest
 from django.urls import reverse
 
+from core import documents, page_cache
 from core.constants import Visibility
+from domain.timeline import operations as timeline_ops
 
 
 @pytest.mark.django_db
@@ -104,3 +110,96 @@ class TestFeedView:
 
         response = client.get(target_url)
         assert should_show == (t_entry.p_summary in response.content.decode("utf-8"))
+
+    def test_links_to_next_page(self, client, target_url, factory):
+        t_entries = [
+            factory.StatusEntry(t_post=factory.PublishedNotePost(visibility=Visibility.PUBLIC), p_summary=f"Entry {i}")
+            for i in range(12)
+        ]
+
+        response = client.get(target_url)
+        content = response.content.decode("utf-8")
+        next_url = re.search(r'<atom:link rel="next" href="([^"]+)"', content).group(1)
+
+        next_response = client.get(html.unescape(next_url))
+        next_content = next_response.content.decode("utf-8")
+        assert "Entry 0<" in next_content and "Entry 1<" in next_content
+        assert "Entry 0<" not in content
+        assert 'rel="next"' not in next_content
+        assert len(t_entries) == content.count("<item>") + next_content.count("<item>")
+
+
+@pytest.mark.django_db
+class TestFeedConditionalGet:
+    @pytest.fixture
+    def target_url(self):
+        return reverse("public:feed")
+
+    def test_not_modified(
+        self, client, target_url, factory, django_assert_max_num_queries, django_capture_on_commit_callbacks
+    ):
+        t_entry = factory.StatusEntry(t_post=factory.PublishedNotePost(visibility=Visibility.PUBLIC))
+        timeline_ops.refresh_timeline(t_entry.t_post_id)
+        etag = client.get(target_url)["ETag"]
+
+        # Only the timestamps are read, not the items.
+        with django_assert_max_num_queries(1):
+            response = client.get(target_url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+
+        with django_capture_on_commit_callbacks(execute=True):
+            t_entry.p_summary = "Changed"
+            t_entry.save()
+            timeline_ops.refresh_timeline(t_entry.t_post_id)
+
+        assert client.get(target_url, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+
+@pytest.mark.django_db
+class TestFeedDocument:
+    @pytest.fixture
+    def target_url(self):
+        return reverse("public:feed")
+
+    @pytest.fixture
+    def t_entry(self, factory):
+        t_entry = factory.StatusEntry(t_post=factory.PublishedNotePost(visibility=Visibility.PUBLIC), p_summary="First")
+        timeline_ops.refresh_timeline(t_entry.t_post_id)
+        return t_entry
+
+    def test_serves_stored_document(self, client, target_url, t_entry, django_assert_max_num_queries):
+        client.get(target_url)
+
+        # Only the conditional GET validators are read.
+        with django_assert_max_num_queries(1):
+            response = client.get(target_url, HTTP_ACCEPT_ENCODING="gzip")
+
+        assert response["Content-Encoding"] == "gzip"
+        assert "First" in gzip.decompress(response.content).decode()
+
+    def test_regenerated_after_a_change(
+        self, client, target_url, t_entry, django_assert_max_num_queries, django_capture_on_commit_callbacks
+    ):
+        client.get(target_url)
+        t_entry.p_summary = "Second"
+        t_entry.save()
+        timeline_ops.refresh_timeline(t_entry.t_post_id)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            page_cache.purge(page_cache.TIMELINE)
+            documents.regenerate_documents()
+
+        with django_assert_max_num_queries(1):
+            response = client.get(target_url)
+        assert "Second" in response.content.decode()
+
+    def test_renders_live_for_logged_in_users(self, client, target_url, t_entry, factory):
+        t_post = factory.PublishedNotePost(visibility=Visibility.PRIVATE)
+        private_entry = factory.StatusEntry(t_post=t_post, p_summary="Private")
+        timeline_ops.refresh_timeline(private_entry.t_post_id)
+        client.get(target_url)
+
+        client.force_login(t_post.p_author)
+
+        assert "Private" in client.get(target_url).content.decode()
@@ -0,0 +1,123 @@
+import io
+import threading
+import time
+import uuid
+from unittest import mock
+
+import pytest
+from django.core import management
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connections
+from django.urls import reverse
+from PIL import Image
+
+from core import locks
+from data.files import models as file_models
+from domain.files import operations as file_ops
+from domain.images import images as image_ops
+from interfaces.public.files.forms import MediaUploadForm
+
+
+def make_png(width: int = 800, height: int = 600) -> SimpleUploadedFile:
+    data = io.BytesIO()
+    Image.new("RGB", (width, height), "green").save(data, format="png")
+    return SimpleUploadedFile("photo.png", data.getvalue(), content_type="image/png")
+
+
+@pytest.mark.django_db
+class TestDerivatives:
+    @pytest.fixture(autouse=True)
+    def media_root(self, settings, tmp_path):
+        settings.MEDIA_ROOT = tmp_path
+        settings.MEDIA_DERIVATIVES = [(None, "image/webp"), (600, None), (128, "image/webp")]
+
+    def test_created_on_upload(self, client, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True):
+            form = MediaUploadForm(files={"file": make_png()})
+            assert form.is_valid()
+            t_file = form.save()
+
+        assert set(t_file.ref_t_formatted_image.values_list("mime_type", "width", "height")) == {
+            ("image/webp", 800, 600),
+            ("image/png", 600, 450),
+            ("image/webp", 128, 96),
+        }
+
+        # Requests are served the copies made on upload.
+        response = client.get(reverse("public:get_media", args=[t_file.uuid]), {"s": 128, "f": "image/webp"})
+        assert response.status_code == 200
+        assert t_file.ref_t_formatted_image.count() == 3
+
+    def test_command_creates_missing_derivatives(self):
+        t_file = file_models.TFile(uuid=uuid.uuid4(), mime_type="image/png", filename="photo.png")
+        t_file.file = make_png()
+        t_file.save()
+
+        management.call_command("generate_media_derivatives")
+        assert t_file.ref_t_formatted_image.count() == 3
+
+        stdout = io.StringIO()
+        management.call_command("generate_media_derivatives", stdout=stdout)
+        assert "Created 0 copies" in stdout.getvalue()
+
+        management.call_command("generate_media_derivatives", "--regenerate", stdout=stdout)
+        assert "Deleted 3 existing copies" in stdout.getvalue()
+        assert t_file.ref_t_formatted_image.count() == 3
+
+
+@pytest.mark.django_db(transaction=True)
+class TestSingleFlight:
+    @pytest.fixture(autouse=True)
+    def media_root(self, settings, tmp_path):
+        settings.MEDIA_ROOT = tmp_path / "media"
+        settings.MEDIA_DERIVATIVE_LOCK_DIR = str(tmp_path / "locks")
+
+    @pytest.fixture
+    def t_file(self):
+        t_file = file_models.TFile(uuid=uuid.uuid4(), mime_type="image/png", filename="photo.png")
+        t_file.file = make_png()
+        t_file.save()
+        return t_file
+
+    def test_created_once_for_concurrent_requests(self, t_file):
+        convert_image_format = image_ops.convert_image_format
+
+        def slow_convert(*args, **kwargs):
+            # Long enough for every thread to find it missing and wait for it.
+            time.sleep(0.2)
+            return convert_image_format(*args, **kwargs)
+
+        workers = 16
+        barrier = threading.Barrier(workers)
+        results = []
+
+        def request():
+            try:
+                barrier.wait()
+                results.append(file_ops.get_file(file_models.TFile.objects.get(pk=t_file.pk), "image/webp", 128))
+            finally:
+                connections.close_all()
+
+        with mock.patch("domain.images.images.convert_image_format", side_effect=slow_convert) as convert:
+            threads = [threading.Thread(target=request) for _ in range(workers)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert convert.call_count == 1
+        t_formatted_image = file_models.TFormattedImage.objects.get()
+        assert len(results) == workers
+        assert {result.pk for result in results} == {t_formatted_image.pk}
+        assert all(isinstance(result, file_models.TFormattedImage) for result in results)
+
+    def test_original_served_while_busy(self, client, settings, t_file):
+        settings.MEDIA_DERIVATIVE_WAIT = 0
+
+        with locks.file_lock(file_ops._get_lock_path(t_file, "image/webp", 128), timeout=0):
+            response = client.get(reverse("public:get_media", args=[t_file.uuid]), {"s": 128, "f": "image/webp"})
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "image/png"
+        assert response["Cache-Control"] == "no-cache"
+        assert not file_models.TFormattedImage.objects.exists()
@@ -0,0 +1,79 @@
+import hashlib
+import io
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+from exif import Image as ExifImage
+from PIL import Image
+
+from data.files import models as file_models
+from domain.images import images as image_ops
+from interfaces.public.files.forms import MediaUploadForm
+
+VIDEO = bytes(range(256)) * 64
+
+
+def upload(file) -> file_models.TFile:
+    form = MediaUploadForm(files={"file": file})
+    assert form.is_valid()
+    return form.save()
+
+
+@pytest.mark.django_db
+class TestIngestUpload:
+    @pytest.fixture(autouse=True)
+    def media_root(self, settings, tmp_path):
+        settings.MEDIA_ROOT = tmp_path
+
+    def test_image_location_kept_and_scrubbed(self):
+        with open("tests/fixtures/img_gps.jpeg", "rb") as f:
+            t_file = upload(SimpleUploadedFile("gps.jpeg", f.read(), content_type="image/jpeg"))
+
+        assert t_file.exif["make"] == "Apple"
+        assert t_file.point.y == pytest.approx(35.3194833)
+        with t_file.file.open("rb") as f:
+            stored = f.read()
+        assert not ExifImage(stored).has_exif
+        assert t_file.content_hash == hashlib.md5(stored).hexdigest() == Path(t_file.file.name).name
+        assert t_file.byte_size == len(stored)
+
+    def test_image_rotated_upright(self):
+        exif = Image.Exif()
+        exif[image_ops.ORIENTATION] = 6
+        data = io.BytesIO()
+        Image.new("RGB", (30, 20)).save(data, format="jpeg", exif=exif.tobytes())
+
+        t_file = upload(SimpleUploadedFile("photo.jpg", data.getvalue(), content_type="image/jpeg"))
+
+        assert (t_file.width, t_file.height) == (20, 30)
+        with t_file.file.open("rb") as f, Image.open(f) as stored:
+            assert stored.size == (20, 30)
+
+    def test_other_files_stored_as_uploaded(self):
+        with mock.patch("domain.images.images.save_upright") as save_upright:
+            t_file = upload(SimpleUploadedFile("clip.mp4", VIDEO, content_type="video/mp4"))
+
+        save_upright.assert_not_called()
+        assert t_file.exif == {}
+        assert t_file.width is None
+        with t_file.file.open("rb") as f:
+            assert f.read() == VIDEO
+        assert t_file.content_hash == hashlib.md5(VIDEO).hexdigest()
+
+    @pytest.mark.parametrize("max_memory_size", [0, 2621440])
+    def test_hashed_as_received(self, client, factory, settings, max_memory_size):
+        settings.FILE_UPLOAD_MAX_MEMORY_SIZE = max_memory_size
+        client.force_login(factory.User())
+
+        with mock.patch("domain.files.operations._md5_sum", side_effect=AssertionError("read again")):
+            response = client.post(
+                reverse("public:micropub_media"),
+                {"file": SimpleUploadedFile("clip.mp4", VIDEO, content_type="video/mp4")},
+            )
+
+        assert response.status_code == 201
+        t_file = file_models.TFile.objects.get()
+        assert t_file.content_hash == hashlib.md5(VIDEO).hexdigest() == Path(t_file.file.name).name
@@ -0,0 +1,95 @@
+import io
+import uuid
+from pathlib import Path
+
+import pytest
+from django.core import management
+from django.core.files.uploadedfile import SimpleUploadedFile
+from PIL import Image
+
+from data.files import models as file_models
+from domain.files import queries as file_queries
+from domain.images import images as image_ops
+from interfaces.public.files.forms import MediaUploadForm
+
+
+def make_jpeg(width: int, height: int, orientation: int | None = None) -> SimpleUploadedFile:
+    data = io.BytesIO()
+    exif = Image.Exif()
+    if orientation:
+        exif[image_ops.ORIENTATION] = orientation
+    Image.new("RGB", (width, height), "green").save(data, format="jpeg", exif=exif.tobytes())
+    return SimpleUploadedFile("photo.jpg", data.getvalue(), content_type="image/jpeg")
+
+
+@pytest.mark.django_db
+class TestFileMetadata:
+    @pytest.fixture(autouse=True)
+    def media_root(self, settings, tmp_path):
+        settings.MEDIA_ROOT = tmp_path
+
+    def test_stored_on_upload(self):
+        form = MediaUploadForm(files={"file": make_jpeg(300, 200)})
+        assert form.is_valid()
+        t_file = form.save()
+
+        assert (t_file.width, t_file.height) == (300, 200)
+        assert (t_file.display_width, t_file.display_height) == (300, 200)
+        assert t_file.byte_size == t_file.file.size
+        assert t_file.content_hash == Path(t_file.file.name).name
+
+    def test_size_read_without_the_file(self):
+        t_file = file_models.TFile(mime_type="image/jpeg", width=300, height=200, display_width=200, display_height=300)
+
+        assert file_queries.get_size_for_file(t_file) == file_queries.Size(width=300, height=200)
+        assert image_ops.get_maybe_resized_size(t_file, 128) == (85, 128)
+        assert image_ops.get_maybe_resized_size(t_file) == (200, 300)
+
+    def test_command_updates_files_missing_it(self):
+        t_file = file_models.TFile(uuid=uuid.uuid4(), mime_type="image/jpeg")
+        t_file.file = make_jpeg(300, 200, orientation=6)
+        t_file.save()
+        assert t_file.width is None
+
+        stdout = io.StringIO()
+        management.call_command("update_file_metadata", stdout=stdout)
+
+        t_file.refresh_from_db()
+        assert (t_file.width, t_file.height) == (300, 200)
+        assert (t_file.display_width, t_file.display_height) == (200, 300)
+        assert t_file.byte_size == t_file.file.size
+        assert t_file.content_hash == Path(t_file.file.name).name
+        assert "Updated the metadata of 1 files" in stdout.getvalue()
+
+
+@pytest.mark.parametrize(
+    "width,height,longest_edge", [(800, 600, 128), (600, 800, 208), (5000, 7, 256), (100, 50, 600)]
+)
+def test_resized_size_matches_pillow(width, height, longest_edge):
+    image = Image.new("1", (width, height))
+    image.thumbnail((longest_edge, longest_edge))
+
+    assert image_ops.get_resized_size(width, height, longest_edge) == image.size
+
+
+def test_resize_image_decodes_less_and_rotates_once():
+    data = io.BytesIO()
+    exif = Image.Exif()
+    exif[image_ops.ORIENTATION] = 6
+    Image.new("RGB", (4000, 3000), "green").save(data, format="jpeg", exif=exif.tobytes())
+
+    with Image.open(data) as image:
+        resized = image_ops.resize_image(image, 600)
+        # Decoded at half the size, the smallest still twice as large as the copy, and turned upright in place.
+        assert image.size == (1500, 2000)
+
+    assert resized.size == image_ops.get_resized_size(3000, 4000, 600) == (450, 600)
+    assert image_ops.ORIENTATION not in resized.getexif()
+
+
+def test_benchmark_image_resizing():
+    stdout = io.StringIO()
+    management.call_command("benchmark_image_resizing", "--megapixels", "1", "--repeat", "1", stdout=stdout)
+
+    assert "1MP.jpg" in stdout.getvalue()
+    assert "draft" in stdout.getvalue()
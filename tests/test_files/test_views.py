@@ -0,0 +1,62 @@
+import uuid
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+
+from data.files import models as file_models
+
+CONTENT = bytes(range(256)) * 4
+
+
+@pytest.mark.django_db
+class TestGetMedia:
+    @pytest.fixture
+    def t_file(self, settings, tmp_path):
+        settings.MEDIA_ROOT = tmp_path
+        t_file = file_models.TFile(uuid=uuid.uuid4(), mime_type="video/mp4")
+        t_file.file = SimpleUploadedFile("clip.mp4", CONTENT, content_type="video/mp4")
+        t_file.save()
+        return t_file
+
+    @pytest.fixture
+    def url(self, t_file):
+        return reverse("public:get_media", args=[t_file.uuid])
+
+    def test_immutable(self, client, url):
+        response = client.get(url)
+
+        assert b"".join(response.streaming_content) == CONTENT
+        assert response["Cache-Control"] == "public, max-age=31536000, immutable"
+        assert response["Accept-Ranges"] == "bytes"
+
+        assert client.get(url, HTTP_IF_NONE_MATCH=response["ETag"]).status_code == 304
+
+    @pytest.mark.parametrize(
+        "byte_range,content_range,expected",
+        [
+            ("bytes=0-99", "bytes 0-99/1024", CONTENT[:100]),
+            ("bytes=1000-", "bytes 1000-1023/1024", CONTENT[1000:]),
+            ("bytes=-24", "bytes 1000-1023/1024", CONTENT[-24:]),
+        ],
+    )
+    def test_range(self, client, url, byte_range, content_range, expected):
+        response = client.get(url, HTTP_RANGE=byte_range)
+
+        assert response.status_code == 206
+        assert response["Content-Range"] == content_range
+        assert b"".join(response.streaming_content) == expected
+
+    def test_unsatisfiable_range(self, client, url):
+        response = client.get(url, HTTP_RANGE="bytes=2000-")
+
+        assert response.status_code == 416
+        assert response["Content-Range"] == "bytes */1024"
+
+    def test_x_accel_redirect(self, client, url, t_file, settings):
+        settings.MEDIA_SENDFILE = "x-accel-redirect"
+
+        response = client.get(url)
+
+        assert response["X-Accel-Redirect"] == f"/protected-media/{t_file.file.name}"
+        assert response.content == b""
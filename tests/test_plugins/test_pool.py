@@ -0,0 +1,54 @@
+import pytest
+
+from data.plugins import pool
+
+NOW_PLUGIN = "blog.tanzawa.plugins.nowpage"
+HEALTH_PLUGIN = "blog.tanzawa.plugins.health"
+EXERCISE_PLUGIN = "blog.tanzawa.plugins.exercise"
+
+
+@pytest.mark.django_db
+class TestPluginPool:
+    @pytest.fixture(autouse=True)
+    def clear_registry(self, settings):
+        # Enabled only through the database, whatever the environment forces.
+        settings.FORCE_ENABLED_PLUGINS = []
+        pool.plugin_pool._registry = None
+        yield
+        pool.plugin_pool._registry = None
+
+    def enable(self, identifier: str) -> None:
+        pool.plugin_pool.enable(pool.plugin_pool.get_plugin(identifier))
+
+    def test_dispatches_to_enabled_plugins_by_hook(self, django_assert_num_queries):
+        self.enable(NOW_PLUGIN)
+        pool.plugin_pool.enabled_plugins()
+
+        with django_assert_num_queries(0):
+            assert [p.identifier for p in pool.plugin_pool.public_navigation_plugins()] == [NOW_PLUGIN]
+            assert list(pool.plugin_pool.admin_navigation_plugins()) == []
+            assert list(pool.plugin_pool.feed_plugins()) == []
+            assert pool.plugin_pool.get_plugin(NOW_PLUGIN).is_enabled()
+
+    def test_enabling_a_plugin_reloads_the_registry(self):
+        assert list(pool.plugin_pool.admin_navigation_plugins()) == []
+
+        self.enable(HEALTH_PLUGIN)
+
+        assert [p.identifier for p in pool.plugin_pool.admin_navigation_plugins()] == [HEALTH_PLUGIN]
+
+        pool.plugin_pool.disable(pool.plugin_pool.get_plugin(HEALTH_PLUGIN))
+
+        assert list(pool.plugin_pool.admin_navigation_plugins()) == []
+
+    def test_dispatches_to_forced_plugins(self, settings):
+        settings.FORCE_ENABLED_PLUGINS = [HEALTH_PLUGIN, EXERCISE_PLUGIN]
+
+        assert {p.identifier for p in pool.plugin_pool.admin_navigation_plugins()} == {HEALTH_PLUGIN, EXERCISE_PLUGIN}
+        assert [p.identifier for p in pool.plugin_pool.public_navigation_plugins()] == [EXERCISE_PLUGIN]
+        assert [p.identifier for p in pool.plugin_pool.feed_plugins()] == [EXERCISE_PLUGIN]
+
+        # Forced plugins stay enabled.
+        pool.plugin_pool.disable(pool.plugin_pool.get_plugin(HEALTH_PLUGIN))
+
+        assert HEALTH_PLUGIN in {p.identifier for p in pool.plugin_pool.admin_navigation_plugins()}
@@ -1,11 +1,16 @@
+import threading
 from unittest import mock
 
 import pytest
+from django.contrib.auth.models import AnonymousUser
 from django.urls import reverse
 from model_bakery import baker
 
+from core import page_cache
 from core.constants import Visibility
+from core.db import routers
 from data.indieweb.constants import MPostKinds
+from interfaces.public.home import sections
 
 
 @pytest.mark.django_db
@@ -64,6 +69,50 @@ class TestHomeView:
         if login_user:
             client.force_login(login_user)
 
-        with mock.patch("interfaces.public.home.views.sunbotte_queries"):
+        with mock.patch("interfaces.public.home.sections.sunbottle_queries"):
             response = client.get(target_url)
         assert should_show == (t_entry.p_summary in response.content.decode("utf-8"))
+
+
+@pytest.mark.django_db
+class TestHomeSections:
+    def test_cached_until_a_dependency_changes(
+        self, factory, django_assert_num_queries, django_capture_on_commit_callbacks
+    ):
+        t_entry = factory.StatusEntry(t_post=factory.PublishedNotePost(visibility=Visibility.PUBLIC))
+        sections.get_sections(AnonymousUser())
+
+        with django_assert_num_queries(0):
+            context = sections.get_sections(AnonymousUser())
+        assert context["posts"] == [t_entry.t_post]
+
+        second_entry = factory.StatusEntry(t_post=factory.PublishedNotePost(visibility=Visibility.PUBLIC))
+        with django_capture_on_commit_callbacks(execute=True):
+            page_cache.purge(page_cache.kind_tag(MPostKinds.note))
+
+        assert second_entry.t_post in sections.get_sections(AnonymousUser())["posts"]
+
+    @pytest.mark.django_db(transaction=True)
+    def test_built_concurrently_in_the_request_context(self, settings, factory):
+        settings.HOME_SECTION_WORKERS = 4
+        t_entry = factory.StatusEntry(t_post=factory.PublishedNotePost(visibility=Visibility.PUBLIC))
+        barrier = threading.Barrier(2, timeout=5)
+
+        def build(user):
+            # Both sections have to be building at once to get past the barrier.
+            barrier.wait()
+            return routers._read_only.get()
+
+        with mock.patch("interfaces.public.home.sections.sunbottle_queries"), routers.read_only():
+            context = sections.get_sections(
+                AnonymousUser(),
+                [
+                    sections.Section("first", build, lambda: []),
+                    sections.Section("second", build, lambda: []),
+                    *sections.SECTIONS,
+                ],
+            )
+
+        assert context["first"] is context["second"] is True
+        assert context["posts"] == [t_entry.t_post]
+        assert routers._read_only.get() is False
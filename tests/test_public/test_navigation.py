@@ -0,0 +1,46 @@
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.urls import reverse
+from model_bakery import baker
+
+from core.constants import Visibility
+from data.streams.models import MStream
+from domain.indieweb.relme import queries as relme_queries
+
+
+@pytest.mark.django_db
+class TestNavigation:
+    @pytest.fixture
+    def public_stream(self, factory):
+        return factory.Stream(name="Notes", slug="notes", visibility=Visibility.PUBLIC)
+
+    @pytest.fixture
+    def private_stream(self, factory):
+        return factory.Stream(name="Diary", slug="diary", visibility=Visibility.PRIVATE)
+
+    def test_streams_split_by_user(self, public_stream, private_stream, factory):
+        assert MStream.objects.navigation(AnonymousUser()) == [public_stream]
+        assert MStream.objects.navigation(factory.User()) == [public_stream, private_stream]
+
+    def test_cached_until_changed(self, public_stream, factory, django_assert_num_queries):
+        relme = baker.make("indieweb.TRelMe", url="https://example.com/me")
+        MStream.objects.navigation(AnonymousUser())
+        relme_queries.get_relme()
+
+        with django_assert_num_queries(0):
+            assert MStream.objects.navigation(AnonymousUser()) == [public_stream]
+            assert relme_queries.get_relme() == [relme]
+
+        stream = factory.Stream(name="Photos", slug="photos", visibility=Visibility.PUBLIC)
+        relme.delete()
+
+        assert MStream.objects.navigation(AnonymousUser()) == [public_stream, stream]
+        assert relme_queries.get_relme() == []
+
+    def test_listed_on_public_pages(self, client, public_stream, private_stream):
+        response = client.get(reverse("public:bookmarks"))
+
+        assert response.status_code == 200
+        content = response.content.decode()
+        assert reverse("public:stream", args=[public_stream.slug]) in content
+        assert reverse("public:stream", args=[private_stream.slug]) not in content
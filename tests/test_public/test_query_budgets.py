@@ -0,0 +1,44 @@
+import pytest
+from django.urls import reverse
+
+from core.constants import Visibility
+from domain.timeline import operations as timeline_ops
+
+
+@pytest.mark.django_db
+@pytest.mark.query_budget(max_repeats=1)
+class TestListQueryBudgets:
+    @pytest.fixture(autouse=True)
+    def plugins(self, settings):
+        # Only the site's own queries, plugins hook into every item.
+        settings.FORCE_ENABLED_PLUGINS = []
+
+    @pytest.fixture(autouse=True)
+    def entries(self, factory):
+        stream = factory.Stream(name="Notes", slug="notes", visibility=Visibility.PUBLIC)
+        entries = []
+        for i in range(4):
+            entry_factory = factory.ArticleEntry if i % 2 else factory.StatusEntry
+            t_entry = entry_factory(
+                t_post__visibility=Visibility.PUBLIC, p_summary=f"Entry {i}", e_content=f"<p>Entry {i}</p>"
+            )
+            t_entry.t_post.streams.add(stream)
+            timeline_ops.refresh_timeline(t_entry.t_post_id)
+            entries.append(t_entry)
+        return entries
+
+    @pytest.mark.parametrize(
+        "url_name,args",
+        [
+            ("public:feed", []),
+            ("public:stream_feed", ["notes"]),
+            ("public:blog", []),
+            ("public:stream", ["notes"]),
+        ],
+    )
+    def test_no_statement_repeated_per_item(self, client, query_budget, url_name, args):
+        with query_budget():
+            response = client.get(reverse(url_name, args=args))
+
+        assert response.status_code == 200
+        assert "Entry 3" in response.content.decode()
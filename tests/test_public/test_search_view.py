@@ -4,6 +4,7 @@ from model_bakery import baker
 
 from core.constants import Visibility
 from data.indieweb.constants import MPostKinds
+from domain.timeline import operations as timeline_ops
 
 
 @pytest.mark.django_db
@@ -29,13 +30,15 @@ class TestSearchView:
 
     @pytest.fixture
     def t_entry(self, t_post, m_post_kind, author):
-        return baker.make(
+        t_entry = baker.make(
             "entry.TEntry",
             t_post=t_post,
             p_name="",
             p_summary="Content here",
             e_content="<h1>Content here</h1>",
         )
+        timeline_ops.refresh_timeline(t_post.pk)
+        return t_entry
 
     @pytest.fixture
     def author(self):
@@ -66,3 +69,15 @@ class TestSearchView:
             client.force_login(login_user)
         response = client.get(target_url)
         assert should_show == (t_entry.p_summary in response.content.decode("utf-8"))
+
+    @pytest.mark.parametrize("visibility", [Visibility.PUBLIC])
+    def test_highlights_matches(self, client, target_url, t_entry):
+        response = client.get(target_url, {"q": "here"})
+
+        assert "Content <mark>here</mark>" in response.content.decode("utf-8")
+
+    @pytest.mark.parametrize("visibility", [Visibility.PUBLIC])
+    def test_excludes_entries_without_matches(self, client, target_url, t_entry):
+        response = client.get(target_url, {"q": "elsewhere"})
+
+        assert "Nothing found" in response.content.decode("utf-8")
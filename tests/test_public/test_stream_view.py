@@ -4,6 +4,7 @@ from model_bakery import baker
 
 from core.constants import Visibility
 from data.indieweb.constants import MPostKinds
+from domain.timeline import operations as timeline_ops
 
 
 @pytest.mark.django_db
@@ -29,13 +30,15 @@ class TestStreamView:
 
     @pytest.fixture
     def t_entry(self, t_post, m_post_kind, author):
-        return baker.make(
+        t_entry = baker.make(
             "entry.TEntry",
             t_post=t_post,
             p_name="",
             p_summary="Content here",
             e_content="<h1>Content here</h1>",
         )
+        timeline_ops.refresh_timeline(t_post.pk)
+        return t_entry
 
     @pytest.fixture
     def author(self):
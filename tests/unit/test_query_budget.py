@@ -0,0 +1,119 @@
+from types import SimpleNamespace
+
+import pytest
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from core.db import instrumentation
+from data.entry.models import TEntry
+from interfaces.common.middleware.queries import QueryBudgetMiddleware
+
+
+def _execute(sql, params, many, context):
+    return None
+
+
+def _record(recorder: instrumentation.QueryRecorder, *statements: str) -> None:
+    for sql in statements:
+        recorder(_execute, sql, [], False, {})
+
+
+class TestFingerprint:
+    def test_normalizes_whitespace_and_in_lists(self):
+        assert instrumentation.fingerprint('SELECT *\n  FROM "t_post" WHERE "id" IN (%s, %s,%s)') == (
+            'SELECT * FROM "t_post" WHERE "id" IN (...)'
+        )
+
+
+class TestQueryRecorder:
+    def test_counts_statements(self):
+        recorder = instrumentation.QueryRecorder()
+        _record(recorder, "SELECT 1", "SELECT 2")
+
+        assert recorder.count == 2
+        assert recorder.duration >= 0
+
+    def test_repeated(self):
+        recorder = instrumentation.QueryRecorder()
+        _record(recorder, "SELECT %s", "SELECT 2", "SELECT %s", "SELECT %s")
+
+        assert recorder.repeated() == {"SELECT %s": 3}
+
+    def test_over_budget(self):
+        recorder = instrumentation.QueryRecorder()
+        _record(recorder, "SELECT %s", "SELECT %s", "SELECT 2")
+
+        assert recorder.over_budget(max_queries=3, max_repeats=2) == []
+        assert recorder.over_budget(max_queries=2, max_repeats=1) == [
+            "3 queries (budget 2)",
+            "2 executions (budget 1) of SELECT %s",
+        ]
+        assert recorder.over_budget(max_queries=None, max_repeats=None) == []
+
+
+class TestQueryBudgetMiddleware:
+    @pytest.fixture
+    def middleware(self):
+        return QueryBudgetMiddleware(lambda request: HttpResponse("ok"))
+
+    @pytest.fixture(autouse=True)
+    def budget(self, settings):
+        settings.DB_QUERY_BUDGET = 0
+        settings.DB_QUERY_REPEAT_BUDGET = 0
+
+    def test_server_timing_for_staff(self, middleware):
+        request = RequestFactory().get("/")
+        request.user = SimpleNamespace(is_staff=True)
+
+        response = middleware(request)
+
+        assert response["Server-Timing"].startswith("db;dur=")
+
+    def test_no_server_timing_for_visitors(self, middleware):
+        request = RequestFactory().get("/")
+        request.user = SimpleNamespace(is_staff=False)
+
+        assert "Server-Timing" not in middleware(request)
+
+    @pytest.mark.django_db
+    def test_logs_requests_over_budget(self, caplog):
+        def view(request):
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            return HttpResponse("ok")
+
+        middleware = QueryBudgetMiddleware(view)
+        request = RequestFactory().get("/posts/")
+        request.user = SimpleNamespace(is_staff=False)
+
+        middleware(request)
+
+        assert "/posts/ exceeded its query budget" in caplog.text
+
+
+@pytest.mark.django_db
+class TestQueryBudgetFixture:
+    def test_fails_on_n_plus_one(self, factory, query_budget):
+        for _ in range(3):
+            factory.StatusEntry()
+
+        with pytest.raises(pytest.fail.Exception, match="3 executions \\(budget 1\\)"):
+            with query_budget(max_repeats=1):
+                for t_entry in TEntry.objects.all():
+                    t_entry.t_post.p_author
+
+    @pytest.mark.query_budget(max_queries=1)
+    def test_budget_from_marker(self, query_budget):
+        with pytest.raises(pytest.fail.Exception, match="2 queries \\(budget 1\\)"):
+            with query_budget():
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+                    cursor.execute("SELECT 2")
+
+    def test_within_budget(self, query_budget):
+        with query_budget(max_queries=1) as recorder:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+
+        assert recorder.count == 1
@@ -0,0 +1,40 @@
+from unittest import mock
+
+import pytest
+from django.db import DEFAULT_DB_ALIAS
+
+from core.db import routers
+from data.post import models as post_models
+
+
+class TestReadWriteRouter:
+    @pytest.fixture
+    def router(self):
+        return routers.ReadWriteRouter()
+
+    @pytest.fixture(autouse=True)
+    def read_only_alias(self):
+        with mock.patch.object(routers.connections, "settings", {DEFAULT_DB_ALIAS: {}, "readonly": {}}):
+            yield
+
+    def test_reads_use_writer_by_default(self, router):
+        assert router.db_for_read(post_models.TPost) is None
+
+    def test_reads_use_read_only_connection_when_requested(self, router):
+        with routers.read_only():
+            assert router.db_for_read(post_models.TPost) == routers.READ_ONLY_DB_ALIAS
+        assert router.db_for_read(post_models.TPost) is None
+
+    def test_reads_in_transaction_use_writer(self, router):
+        with routers.read_only(), mock.patch.object(routers, "connections") as connections:
+            connections.settings = {DEFAULT_DB_ALIAS: {}, "readonly": {}}
+            connections.__getitem__.return_value.in_atomic_block = True
+            assert router.db_for_read(post_models.TPost) == DEFAULT_DB_ALIAS
+
+    def test_writes_always_use_writer(self, router):
+        with routers.read_only():
+            assert router.db_for_write(post_models.TPost) == DEFAULT_DB_ALIAS
+
+    def test_only_writer_is_migrated(self, router):
+        assert router.allow_migrate(DEFAULT_DB_ALIAS, "post") is True
+        assert router.allow_migrate(routers.READ_ONLY_DB_ALIAS, "post") is False
@@ -0,0 +1,40 @@
+import math
+
+import pytest
+
+from core.db import spatial
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    Great-circle distance, as SpatiaLite measures it.
+    """
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    a = (
+        math.sin((phi2 - phi1) / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lon2 - lon1) / 2) ** 2
+    )
+    return 2 * spatial.EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+class TestBoundingBox:
+    def test_contains_circle(self):
+        min_lon, min_lat, max_lon, max_lat = spatial.bounding_box(35.0, 139.0, 10)
+
+        assert haversine_km(35.0, 139.0, max_lat, 139.0) == pytest.approx(10)
+        assert haversine_km(35.0, 139.0, min_lat, 139.0) == pytest.approx(10)
+        # The circle reaches furthest east and west slightly north of its center, so the box is a little wider.
+        assert haversine_km(35.0, 139.0, 35.0, max_lon) >= 10
+        assert haversine_km(35.0, 139.0, 35.0, min_lon) >= 10
+
+    @pytest.mark.parametrize(
+        "lat,lon",
+        [
+            (89.99, 0),
+            (0, 179.99),
+        ],
+    )
+    def test_spans_every_longitude_at_the_poles_and_antimeridian(self, lat, lon):
+        min_lon, _, max_lon, _ = spatial.bounding_box(lat, lon, 10)
+
+        assert (min_lon, max_lon) == (-180, 180)